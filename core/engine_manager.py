@@ -15,6 +15,8 @@ from core.winboard_engine import WinboardEngine
 class EngineInfo:
     """Information about a chess engine"""
     
+    __slots__ = ("name", "path", "protocol", "options")
+    
     def __init__(self, name: str, path: str, protocol: str = "UCI"):
         self.name = name
         self.path = path
@@ -232,6 +234,7 @@ class EngineWorker(QObject):
         """
         print(f"DEBUG: EngineWorker.analyze_position appelé")
         self._stop_flag = False  # Reset stop flag for new analysis
+        fen = board.fen()  # Tags every update with the analyzed position
         
         # Handle WinBoard engine - limited analysis support
         if self.winboard_engine and self.protocol == "XBoard":
@@ -250,7 +253,8 @@ class EngineWorker(QObject):
                     "nps": 0,
                     "time": time_limit,
                     "pv": [board.san(move)],  # Only one move in PV
-                    "multipv": 1  # WinBoard doesn't support MultiPV
+                    "multipv": 1,  # WinBoard doesn't support MultiPV
+                    "fen": fen
                 }
                 self.analysis_update.emit(analysis_data)
                 print(f"DEBUG: Analyse WinBoard émise: {analysis_data}")
@@ -288,7 +292,8 @@ class EngineWorker(QObject):
                         "nps": info.get("nps", 0),
                         "time": info.get("time", 0),
                         "pv": [],
-                        "multipv": info.get("multipv", 1)
+                        "multipv": info.get("multipv", 1),
+                        "fen": fen
                     }
                     
                     # Get score
@@ -341,8 +346,13 @@ class EngineWorker(QObject):
         if self.winboard_engine and self.protocol == "XBoard":
             print(f"DEBUG: Demande du meilleur coup (WinBoard) avec time_limit={time_limit}")
             
-            # Use a simple container to store the move (thread-safe for single write)
-            move_result = {'move': None, 'received': False}
+            # Resolved from the WinBoard callback, whatever thread it runs on
+            loop = asyncio.get_running_loop()
+            move_future = loop.create_future()
+            
+            def set_move(move):
+                if not move_future.done():
+                    move_future.set_result(move)
             
             def on_move_ready(move_str):
                 """Callback when WinBoard engine returns a move"""
@@ -351,12 +361,10 @@ class EngineWorker(QObject):
                     # Convert UCI move string to chess.Move
                     move = chess.Move.from_uci(move_str)
                     print(f"DEBUG: Converted to chess.Move: {move}")
-                    move_result['move'] = move
-                    move_result['received'] = True
                 except Exception as e:
                     print(f"DEBUG: Error parsing WinBoard move '{move_str}': {e}")
-                    move_result['move'] = None
-                    move_result['received'] = True
+                    move = None
+                loop.call_soon_threadsafe(set_move, move)
             
             # Connect signal
             self.winboard_engine.move_ready.connect(on_move_ready)
@@ -367,17 +375,14 @@ class EngineWorker(QObject):
                 self.winboard_engine.set_position(board)
                 self.winboard_engine.go(time_limit)
                 
-                # Wait for move with polling (simpler than async queue)
-                start_time = asyncio.get_event_loop().time()
+                # Wake up as soon as the move arrives instead of polling
                 timeout = time_limit + 10.0
+                try:
+                    move = await asyncio.wait_for(move_future, timeout)
+                except asyncio.TimeoutError:
+                    print(f"DEBUG: Timeout waiting for WinBoard move ({timeout}s)")
+                    return None
                 
-                while not move_result['received']:
-                    await asyncio.sleep(0.1)  # Check every 100ms
-                    if asyncio.get_event_loop().time() - start_time > timeout:
-                        print(f"DEBUG: Timeout waiting for WinBoard move ({timeout}s)")
-                        return None
-                
-                move = move_result['move']
                 print(f"DEBUG: Meilleur coup reçu (WinBoard): {move}")
                 return move
                 
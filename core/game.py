@@ -2,13 +2,18 @@
 Game logic wrapper using python-chess library
 """
 import chess
-from typing import Optional, List
+from typing import Iterable, Optional, List
+from PyQt6.QtCore import QObject, pyqtSignal
 
 
-class ChessGame:
+class ChessGame(QObject):
     """Wrapper class for chess game logic"""
     
+    # Emitted after each legal move: (chess.Move, game over)
+    move_completed = pyqtSignal(object, bool)
+    
     def __init__(self):
+        super().__init__()
         self.board = chess.Board()
         self.move_history: List[str] = []
         
@@ -31,9 +36,29 @@ class ChessGame:
             san = self.board.san(move)
             self.board.push(move)
             self.move_history.append(san)
+            # Game over state is only computed when someone listens
+            if self.receivers(self.move_completed) and not self.signalsBlocked():
+                self.move_completed.emit(move, self.board.is_game_over())
             return True
         return False
         
+    def replay_moves(self, moves: Iterable[chess.Move]) -> int:
+        """
+        Play moves already known to be legal, e.g. a parsed PGN mainline
+        
+        Skips the legality check and does not emit move_completed.
+        
+        Args:
+            moves: Legal moves, in order, from the current position
+            
+        Returns:
+            Number of moves played
+        """
+        count = len(self.move_history)
+        for move in moves:
+            self.move_history.append(self.board.san_and_push(move))
+        return len(self.move_history) - count
+        
     def make_move_uci(self, uci_move: str) -> bool:
         """
         Make a move using UCI notation (e.g., "e2e4")
@@ -82,6 +107,10 @@ class ChessGame:
             return "Draw - Threefold repetition"
         return "Game in progress"
         
+    def last_san(self) -> Optional[str]:
+        """Get the SAN of the most recent move, or None before the first move"""
+        return self.move_history[-1] if self.move_history else None
+        
     def get_pgn_moves(self) -> str:
         """Get moves in PGN format"""
         pgn_text = ""
@@ -11,6 +11,11 @@ from pathlib import Path
 import json
 
 
+# Packages dont les loggers de module (logging.getLogger(__name__)) sont routés
+# vers les sorties de l'application
+APP_LOGGER_PACKAGES = ('ui', 'core')
+
+
 class DebugLogger:
     """Gestionnaire de logs et crashs pour ChessAvatar"""
     
@@ -55,6 +60,17 @@ class DebugLogger:
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
         
+        # Les loggers des modules de l'application (ui.*, core.*) remontent à
+        # leur package : mêmes sorties, niveau INFO (les logger.debug() ne
+        # coûtent presque rien). Le logger racine et les bibliothèques tierces
+        # ne sont pas touchés.
+        for package in APP_LOGGER_PACKAGES:
+            package_logger = logging.getLogger(package)
+            package_logger.setLevel(logging.INFO)
+            package_logger.addHandler(file_handler)
+            package_logger.addHandler(console_handler)
+            package_logger.propagate = False
+        
         return logger
     
     def log(self, level, message, **kwargs):
@@ -144,6 +144,44 @@ class TestChessGame:
         for move_uci in moves:
             game.make_move(chess.Move.from_uci(move_uci))
         assert game.board.can_claim_threefold_repetition()
+        
+    def test_last_san(self):
+        """Test last_san returns the SAN of the latest move"""
+        game = ChessGame()
+        assert game.last_san() is None
+        game.make_move(chess.Move.from_uci("g1f3"))
+        assert game.last_san() == "Nf3"
+        
+    def test_move_completed_signal(self):
+        """Test move_completed is emitted for legal moves only"""
+        game = ChessGame()
+        received = []
+        game.move_completed.connect(lambda move, game_over: received.append((move, game_over)))
+        game.make_move(chess.Move.from_uci("e2e5"))
+        assert received == []
+        move = chess.Move.from_uci("e2e4")
+        game.make_move(move)
+        assert received == [(move, False)]
+        
+    def test_move_completed_signal_game_over(self):
+        """Test move_completed reports a game ending move"""
+        game = ChessGame()
+        received = []
+        game.move_completed.connect(lambda move, game_over: received.append(game_over))
+        for move_uci in ["f2f3", "e7e5", "g2g4", "d8h4"]:
+            game.make_move(chess.Move.from_uci(move_uci))
+        assert received == [False, False, False, True]
+        
+    def test_replay_moves(self):
+        """Test replaying known legal moves without signals"""
+        game = ChessGame()
+        received = []
+        game.move_completed.connect(lambda move, game_over: received.append(move))
+        moves = [chess.Move.from_uci(uci) for uci in ["e2e4", "e7e5", "g1f3"]]
+        assert game.replay_moves(moves) == 3
+        assert game.move_history == ["e4", "e5", "Nf3"]
+        assert game.board.move_stack == moves
+        assert received == []
 
 
 @pytest.mark.unit
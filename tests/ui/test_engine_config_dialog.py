@@ -0,0 +1,71 @@
+"""
+Tests for the engine configuration dialog
+Tests which fields a save writes
+"""
+import pytest
+from PyQt6.QtWidgets import QMessageBox
+from core.engine_manager import EngineInfo
+import ui.engine_config_dialog as engine_config_dialog
+from ui.engine_config_dialog import EngineConfigDialog
+
+
+@pytest.fixture
+def dialog(qapp, tmp_path, monkeypatch):
+    """Dialog working in an empty directory, with message boxes silenced"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(engine_config_dialog.QMessageBox, "information",
+                        lambda *args: QMessageBox.StandardButton.Ok)
+    monkeypatch.setattr(engine_config_dialog.QMessageBox, "warning",
+                        lambda *args: QMessageBox.StandardButton.Ok)
+    engine_path = tmp_path / "engine.exe"
+    engine_path.write_bytes(b"")
+    stockfish = EngineInfo("Stockfish", str(engine_path), "UCI")
+    stockfish.options = {"Threads": 1, "Hash": 64, "MultiPV": 1,
+                         "Ponder": False, "Skill Level": 20}
+    dlg = EngineConfigDialog([stockfish])
+    dlg._io_pool.waitForDone()
+    yield dlg
+    dlg._io_pool.waitForDone()
+
+
+def _fill_form(dlg, name, path, skill_level):
+    """Fill the form programmatically (no edit signals reach the dirty flags)"""
+    dlg.add_engine()
+    dlg.name_edit.setText(name)
+    dlg.path_edit.setText(path)
+    dlg._meta_dirty = False
+    dlg._uci_dirty = False
+    dlg.skill_level_spin.blockSignals(True)
+    dlg.skill_level_spin.setValue(skill_level)
+    dlg.skill_level_spin.blockSignals(False)
+
+
+@pytest.mark.ui
+class TestEngineConfigSave:
+    """Test EngineConfigDialog.save_engine"""
+    
+    def test_new_engine_writes_every_field(self, dialog, tmp_path):
+        """Test a new engine is saved with the UCI options shown in the form"""
+        _fill_form(dialog, "Komodo", str(tmp_path / "engine.exe"), 5)
+        dialog.save_engine()
+        komodo = next(e for e in dialog.get_engines() if e.name == "Komodo")
+        assert komodo.path == str(tmp_path / "engine.exe")
+        assert komodo.options["Skill Level"] == 5
+        
+    def test_save_onto_existing_name_writes_every_field(self, dialog, tmp_path):
+        """Test saving under another engine's name overwrites all its fields"""
+        other_path = tmp_path / "other.exe"
+        other_path.write_bytes(b"")
+        _fill_form(dialog, "Stockfish", str(other_path), 3)
+        dialog.save_engine()
+        engines = dialog.get_engines()
+        assert len(engines) == 1
+        assert engines[0].path == str(other_path)
+        assert engines[0].options["Skill Level"] == 3
+        
+    def test_unchanged_engine_is_not_rewritten(self, dialog):
+        """Test saving the loaded engine without edits is a no-op"""
+        dialog.engine_list.setCurrentIndex(dialog._engine_model.index(0))
+        dialog.save_engine()
+        assert not dialog.save_button.isEnabled()
+        assert not (dialog.config_file).exists()
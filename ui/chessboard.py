@@ -113,10 +113,65 @@ class ChessBoardWidget(QWidget):
         self.legal_moves = []
         self.update()
         
+    def apply_move(self, board: chess.Board, move: chess.Move):
+        """
+        Repaint after a move was pushed on a board
+        
+        Only the squares the move touched are repainted, instead of the
+        whole board as set_board() does.
+        
+        Args:
+            board: Board the move was played on (the game's board)
+            move: Move just played on board
+        """
+        if board is not self.board or self.selected_square is not None or self.dragging:
+            # Showing another board (e.g. a copy while navigating the
+            # notation) or selection highlights anywhere: repaint everything
+            self.set_board(board)
+            return
+        
+        from_rank = chess.square_rank(move.from_square)
+        to_file = chess.square_file(move.to_square)
+        piece = self.board.piece_at(move.to_square)
+        
+        dirty = self._square_rect(move.from_square).united(self._square_rect(move.to_square))
+        if piece and piece.piece_type == chess.KING and abs(chess.square_file(move.from_square) - to_file) > 1:
+            # Castling: the rook moved somewhere on the same rank
+            dirty = dirty.united(self._square_rect(chess.square(0, from_rank)))
+            dirty = dirty.united(self._square_rect(chess.square(7, from_rank)))
+        elif piece and piece.piece_type == chess.PAWN and chess.square_file(move.from_square) != to_file:
+            # Pawn capture, possibly en passant: the captured pawn sat beside the origin
+            dirty = dirty.united(self._square_rect(chess.square(to_file, from_rank)))
+        self.update(dirty)
+        
+    def reject_last_drag(self):
+        """Put back a piece whose move was refused, without touching the position"""
+        if self.selected_square is None and not self.dragging and not self.legal_moves:
+            return  # The release already cleaned up and repainted
+        self.dragging = False
+        self.from_square = None
+        self.drag_piece = None
+        self.set_board(self.board)
+        
+    def _square_rect(self, square: int) -> QRect:
+        """Get the widget rectangle covering a square"""
+        x, y = self.square_to_coords(square)
+        return QRect(x, y, self.square_size, self.square_size)
+        
     def flip_board(self):
         """Flip the board orientation"""
         self.flipped = not self.flipped
         self.update()
+        
+    def set_orientation(self, white_at_bottom: bool):
+        """
+        Show the board from one side, repainting only if it changes
+        
+        Args:
+            white_at_bottom: True to put White at the bottom
+        """
+        if self.flipped == white_at_bottom:
+            self.flip_board()
     
     def set_theme(self, theme_name: str):
         """Set the board theme"""
@@ -244,8 +299,16 @@ class ChessBoardWidget(QWidget):
         # ===== EVALUATION BAR (Left side, integrated) =====
         self._draw_evaluation_bar(painter)
         
+        # Squares outside a partial update (see apply_move) are left as they are
+        dirty = event.rect()
+        board_origin_x, board_origin_y = self.square_to_coords(chess.A8 if not self.flipped else chess.H1)
+        full = dirty.contains(QRect(board_origin_x, board_origin_y, self.board_size, self.board_size))
+        visible_squares = chess.SQUARES if full else [
+            square for square in chess.SQUARES if dirty.intersects(self._square_rect(square))
+        ]
+        
         # Draw board squares
-        for square in chess.SQUARES:
+        for square in visible_squares:
             x, y = self.square_to_coords(square)
             
             # Determine square color
@@ -291,7 +354,7 @@ class ChessBoardWidget(QWidget):
         # Draw pieces
         if self.piece_set == "svg":
             # Use SVG pieces
-            for square in chess.SQUARES:
+            for square in visible_squares:
                 piece = self.board.piece_at(square)
                 if piece and not (self.dragging and square == self.from_square):
                     x, y = self.square_to_coords(square)
@@ -304,7 +367,7 @@ class ChessBoardWidget(QWidget):
             piece_font.setPointSize(self.piece_font_size)
             painter.setFont(piece_font)
             
-            for square in chess.SQUARES:
+            for square in visible_squares:
                 piece = self.board.piece_at(square)
                 if piece and not (self.dragging and square == self.from_square):
                     x, y = self.square_to_coords(square)
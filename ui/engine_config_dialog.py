@@ -1,17 +1,124 @@
 """
 Engine configuration dialog for managing chess engines
 """
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget, 
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListView, 
                              QPushButton, QLabel, QLineEdit, QFileDialog,
                              QMessageBox, QComboBox, QGroupBox, QFormLayout,
-                             QListWidgetItem, QSpinBox, QCheckBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QSpinBox, QCheckBox, QStackedWidget)
+from PyQt6.QtCore import (Qt, pyqtSignal, QSignalBlocker, QObject,
+                          QRunnable, QThreadPool, QAbstractListModel,
+                          QModelIndex)
 from pathlib import Path
-import json
+from functools import lru_cache
+import logging
 import os
 from typing import List
 from core.engine_manager import EngineInfo
 
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    # orjson not available, fall back to the standard library
+    import json
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _path_stem(path: str) -> str:
+    """File name of path without its extension"""
+    return Path(path).stem
+
+
+class _ConfigIOSignals(QObject):
+    """Signals emitted by config I/O tasks (lives in the GUI thread)"""
+    
+    loaded = pyqtSignal(object)  # Parsed config data (dict), None if unreadable
+    saved = pyqtSignal()  # Write finished (successfully or not)
+
+
+class _ConfigIOTask(QRunnable):
+    """Background task reading or writing the engines config file"""
+    
+    def __init__(self, path: Path, signals: _ConfigIOSignals, payload: dict = None):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+        self.payload = payload
+        
+    @classmethod
+    def load(cls, path: Path, signals: _ConfigIOSignals) -> '_ConfigIOTask':
+        """Create a task reading the config file"""
+        return cls(path, signals)
+        
+    @classmethod
+    def save(cls, path: Path, signals: _ConfigIOSignals, payload: dict) -> '_ConfigIOTask':
+        """Create a task writing payload to the config file"""
+        return cls(path, signals, payload)
+        
+    def run(self):
+        """Perform the file I/O off the GUI thread"""
+        if self.payload is None:
+            try:
+                data = _json_loads(self.path.read_bytes())
+            except Exception as e:
+                logger.warning("Failed to load engines config: %s", e)
+                data = None
+            self.signals.loaded.emit(data)
+        else:
+            try:
+                self.path.write_bytes(_json_dumps(self.payload))
+            except Exception as e:
+                logger.warning("Failed to save engines config: %s", e)
+            self.signals.saved.emit()
+
+
+class _EngineModel(QAbstractListModel):
+    """List model exposing the dialog's engines to the engine list view"""
+    
+    def __init__(self, engines: List[EngineInfo], parent=None):
+        super().__init__(parent)
+        self._engines = engines
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._engines)
+        
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        engine = self._engines[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"🔧 {engine.name}"
+        if role == Qt.ItemDataRole.UserRole:
+            return engine
+        return None
+        
+    def set_engines(self, engines: List[EngineInfo]):
+        """Point the model at a new engines list"""
+        self.beginResetModel()
+        self._engines = engines
+        self.endResetModel()
+        
+    def append_engine(self, engine: EngineInfo):
+        """Append an engine to the underlying list"""
+        row = len(self._engines)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._engines.append(engine)
+        self.endInsertRows()
+
 
 class EngineConfigDialog(QDialog):
     """Dialog for configuring chess engines"""
@@ -21,10 +128,49 @@ class EngineConfigDialog(QDialog):
     
     def __init__(self, engines: List[EngineInfo], parent=None):
         super().__init__(parent)
-        self.engines = engines.copy()
+        # Share the caller's list until the first in-place mutation
+        self._engines_ref = engines
+        self._owns_engines = False
         self.config_file = Path("engines_config.json")
+        
+        # Path parsing cached for the lifetime of the dialog (existence is
+        # checked on every save: the file may appear or disappear meanwhile)
+        self._path_stem = lru_cache(maxsize=64)(_path_stem)
+        
+        # Engine file picker, created on first browse and reused afterwards
+        self._file_dialog = None
+        
+        # Serialized engine dicts keyed by id(engine), invalidated on edit
+        self._dict_cache: dict = {}
+        
+        # Config file I/O runs off the GUI thread; a single worker keeps
+        # successive saves ordered
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        self._io_signals = _ConfigIOSignals(self)
+        self._io_signals.loaded.connect(self._apply_loaded_engines)
+        # Listeners are told about a change once it is on disk
+        self._io_signals.saved.connect(self.engines_changed)
+        
         self.init_ui()
-        self.load_engines_to_list()
+        
+    @property
+    def engines(self) -> List[EngineInfo]:
+        """Engines currently shown in the dialog"""
+        return self._engines_ref
+        
+    @engines.setter
+    def engines(self, engines: List[EngineInfo]):
+        self._engines_ref = engines
+        self._owns_engines = True
+        self._engine_model.set_engines(engines)
+        
+    def _own_engines(self):
+        """Copy the shared engines list before mutating it in place"""
+        if not self._owns_engines:
+            self._engines_ref = list(self._engines_ref)
+            self._owns_engines = True
+            self._engine_model.set_engines(self._engines_ref)
         
     def init_ui(self):
         """Initialize UI"""
@@ -49,9 +195,12 @@ class EngineConfigDialog(QDialog):
         list_label.setStyleSheet("font-weight: bold;")
         left_layout.addWidget(list_label)
         
-        self.engine_list = QListWidget()
+        self.engine_list = QListView()
+        self._engine_model = _EngineModel(self.engines, self)
+        self.engine_list.setModel(self._engine_model)
+        self.engine_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.engine_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #252526;
                 color: #d4d4d4;
                 border: 1px solid #3e3e3e;
@@ -59,18 +208,20 @@ class EngineConfigDialog(QDialog):
                 padding: 5px;
                 font-size: 10pt;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 8px;
                 border-radius: 3px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0e639c;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #3e3e3e;
             }
         """)
-        self.engine_list.itemSelectionChanged.connect(self.on_selection_changed)
+        # Rows are single-line names, so Qt can skip per-item size measurement
+        self.engine_list.setUniformItemSizes(True)
+        self.engine_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         left_layout.addWidget(self.engine_list)
         
         # Buttons for list management
@@ -124,6 +275,8 @@ class EngineConfigDialog(QDialog):
                 border: 1px solid #0e639c;
             }
         """)
+        self.name_edit.editingFinished.connect(self._trim_name)
+        self.name_edit.textEdited.connect(self._mark_meta_dirty)
         details_layout.addRow("Nom:", self.name_edit)
         
         path_layout = QHBoxLayout()
@@ -162,13 +315,78 @@ class EngineConfigDialog(QDialog):
                 selection-background-color: #0e639c;
             }
         """)
+        self.protocol_combo.currentIndexChanged.connect(self._mark_meta_dirty)
         details_layout.addRow("Protocole:", self.protocol_combo)
         
         right_layout.addWidget(details_group)
         
-        # UCI Options Group
+        # Engine shown in the form and fields edited since it was loaded
+        self._form_engine = None
+        self._meta_dirty = False
+        self._uci_dirty = False
+        
+        # UCI Options Group (built on first use, see _ensure_uci_widgets)
+        self._group_style = details_group.styleSheet()
+        self._uci_built = False
+        self.uci_stack = QStackedWidget()
+        uci_placeholder = QLabel("Sélectionnez un moteur")
+        uci_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        uci_placeholder.setStyleSheet("color: #888888; font-size: 9pt;")
+        self.uci_stack.addWidget(uci_placeholder)
+        right_layout.addWidget(self.uci_stack)
+        
+        # Save button
+        self.save_button = QPushButton("💾 Sauvegarder")
+        self.save_button.setEnabled(False)
+        self.save_button.clicked.connect(self.save_engine)
+        right_layout.addWidget(self.save_button)
+        
+        # Info label
+        info_label = QLabel(
+            "ℹ️ Moteurs UCI supportés:\n"
+            "• Stockfish\n"
+            "• Komodo\n"
+            "• Leela Chess Zero\n"
+            "• Et d'autres moteurs UCI compatibles"
+        )
+        info_label.setStyleSheet("""
+            QLabel {
+                background-color: #1e1e1e;
+                border: 1px solid #3e3e3e;
+                border-radius: 4px;
+                padding: 10px;
+                color: #888888;
+                font-size: 9pt;
+            }
+        """)
+        right_layout.addWidget(info_label)
+        
+        right_layout.addStretch()
+        content_layout.addLayout(right_layout, stretch=1)
+        
+        layout.addLayout(content_layout)
+        
+        # Bottom buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.close_button = QPushButton("Fermer")
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        
+        layout.addLayout(button_layout)
+        
+        # Load saved engines
+        self.load_engines_from_config()
+        
+    def _ensure_uci_widgets(self):
+        """Build the UCI options group the first time it is needed"""
+        if self._uci_built:
+            return
+        self._uci_built = True
+        
         uci_group = QGroupBox("Options UCI")
-        uci_group.setStyleSheet(details_group.styleSheet())
+        uci_group.setStyleSheet(self._group_style)
         uci_layout = QFormLayout(uci_group)
         
         # Get CPU count for max threads
@@ -294,67 +512,35 @@ class EngineConfigDialog(QDialog):
         self.skill_level_spin.setToolTip("Niveau de jeu : -1 = Force max, 0 = Débutant, 20 = Expert")
         uci_layout.addRow("Skill Level:", self.skill_level_spin)
         
-        right_layout.addWidget(uci_group)
+        for spin in (self.threads_spin, self.hash_spin, self.multipv_spin, self.skill_level_spin):
+            spin.valueChanged.connect(self._mark_uci_dirty)
+        self.ponder_check.toggled.connect(self._mark_uci_dirty)
         
-        # Save button
-        self.save_button = QPushButton("💾 Sauvegarder")
-        self.save_button.setEnabled(False)
-        self.save_button.clicked.connect(self.save_engine)
-        right_layout.addWidget(self.save_button)
+        self.uci_stack.addWidget(uci_group)
+        self.uci_stack.setCurrentWidget(uci_group)
         
-        # Info label
-        info_label = QLabel(
-            "ℹ️ Moteurs UCI supportés:\n"
-            "• Stockfish\n"
-            "• Komodo\n"
-            "• Leela Chess Zero\n"
-            "• Et d'autres moteurs UCI compatibles"
-        )
-        info_label.setStyleSheet("""
-            QLabel {
-                background-color: #1e1e1e;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                padding: 10px;
-                color: #888888;
-                font-size: 9pt;
-            }
-        """)
-        right_layout.addWidget(info_label)
-        
-        right_layout.addStretch()
-        content_layout.addLayout(right_layout, stretch=1)
+    def _mark_meta_dirty(self):
+        """Flag name/path/protocol as edited"""
+        self._meta_dirty = True
         
-        layout.addLayout(content_layout)
+    def _mark_uci_dirty(self):
+        """Flag UCI options as edited"""
+        self._uci_dirty = True
         
-        # Bottom buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        
-        self.close_button = QPushButton("Fermer")
-        self.close_button.clicked.connect(self.accept)
-        button_layout.addWidget(self.close_button)
-        
-        layout.addLayout(button_layout)
-        
-        # Load saved engines
-        self.load_engines_from_config()
-        
-    def load_engines_to_list(self):
-        """Load engines to the list widget"""
-        self.engine_list.clear()
-        for engine in self.engines:
-            item = QListWidgetItem(f"🔧 {engine.name}")
-            item.setData(Qt.ItemDataRole.UserRole, engine)
-            self.engine_list.addItem(item)
-            
     def on_selection_changed(self):
         """Handle selection change in engine list"""
-        items = self.engine_list.selectedItems()
+        items = self.engine_list.selectionModel().selectedIndexes()
         if items:
             self.remove_button.setEnabled(True)
             self.save_button.setEnabled(True)  # Enable save button when engine is selected
             engine: EngineInfo = items[0].data(Qt.ItemDataRole.UserRole)
+            self._ensure_uci_widgets()
+            
+            # Block change notifications while filling the form in bulk
+            blockers = [QSignalBlocker(w) for w in (
+                self.name_edit, self.path_edit, self.protocol_combo,
+                self.threads_spin, self.hash_spin, self.multipv_spin,
+                self.ponder_check, self.skill_level_spin)]
             self.name_edit.setText(engine.name)
             self.path_edit.setText(engine.path)
             self.protocol_combo.setCurrentText(engine.protocol)
@@ -366,6 +552,10 @@ class EngineConfigDialog(QDialog):
             self.multipv_spin.setValue(engine.options.get("MultiPV", 3))
             self.ponder_check.setChecked(engine.options.get("Ponder", False))
             self.skill_level_spin.setValue(engine.options.get("Skill Level", -1))
+            del blockers
+            self._form_engine = engine
+            self._meta_dirty = False
+            self._uci_dirty = False
         else:
             self.remove_button.setEnabled(False)
             self.save_button.setEnabled(False)  # Disable save button when nothing is selected
@@ -373,6 +563,7 @@ class EngineConfigDialog(QDialog):
     def add_engine(self):
         """Add new engine"""
         self.engine_list.clearSelection()
+        self._ensure_uci_widgets()
         self.name_edit.clear()
         self.path_edit.clear()
         self.protocol_combo.setCurrentIndex(0)
@@ -385,12 +576,15 @@ class EngineConfigDialog(QDialog):
         self.ponder_check.setChecked(False)
         self.skill_level_spin.setValue(-1)
         
+        self._form_engine = None
+        self._meta_dirty = False
+        self._uci_dirty = False
         self.save_button.setEnabled(True)
         self.name_edit.setFocus()
         
     def remove_engine(self):
         """Remove selected engine"""
-        items = self.engine_list.selectedItems()
+        items = self.engine_list.selectionModel().selectedIndexes()
         if not items:
             return
             
@@ -403,37 +597,52 @@ class EngineConfigDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             engine: EngineInfo = items[0].data(Qt.ItemDataRole.UserRole)
+            for e in self.engines:
+                if e.name == engine.name:
+                    self._dict_cache.pop(id(e), None)
             self.engines = [e for e in self.engines if e.name != engine.name]
-            self.load_engines_to_list()
             self.save_engines_to_config()
-            self.engines_changed.emit()
             
             # Clear form
+            self._form_engine = None
             self.name_edit.clear()
             self.path_edit.clear()
             self.remove_button.setEnabled(False)
             
     def browse_engine(self):
         """Browse for engine executable"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Sélectionner un moteur d'échecs",
-            "",
-            "Exécutables (*.exe);;Tous les fichiers (*.*)"
-        )
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Sélectionner un moteur d'échecs")
+            self._file_dialog.setNameFilters(["Exécutables (*.exe)", "Tous les fichiers (*.*)"])
+            self._file_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            
+        file_path = ""
+        if self._file_dialog.exec():
+            file_path = self._file_dialog.selectedFiles()[0]
         
         if file_path:
             self.path_edit.setText(file_path)
             # Auto-fill name if empty
             if not self.name_edit.text():
-                engine_name = Path(file_path).stem
+                engine_name = self._path_stem(file_path)
                 self.name_edit.setText(engine_name)
+            self._meta_dirty = True
             self.save_button.setEnabled(True)
             
+    def _trim_name(self):
+        """Show the name trimmed once editing ends (save_engine trims it too)"""
+        text = self.name_edit.text()
+        trimmed = text.strip()
+        if trimmed != text:
+            self.name_edit.setText(trimmed)
+            
     def save_engine(self):
         """Save engine configuration"""
+        # editingFinished may not fire before the click (buttons without
+        # focus, Enter on the default button): trim the name here as well.
+        # Path is read-only and only filled programmatically
         name = self.name_edit.text().strip()
-        path = self.path_edit.text().strip()
+        path = self.path_edit.text()
         protocol = self.protocol_combo.currentText()
         
         # Validate
@@ -449,31 +658,38 @@ class EngineConfigDialog(QDialog):
             QMessageBox.warning(self, "Erreur", "Le fichier spécifié n'existe pas")
             return
         
-        # Get UCI options
-        uci_options = {
-            "Threads": self.threads_spin.value(),
-            "Hash": self.hash_spin.value(),
-            "MultiPV": self.multipv_spin.value(),
-            "Ponder": self.ponder_check.isChecked(),
-            "Skill Level": self.skill_level_spin.value()
-        }
-            
         # Check if name already exists (for new engines)
         existing = next((e for e in self.engines if e.name == name), None)
+        # Dirty flags only describe the engine loaded in the form: a new
+        # engine, or a name matching another entry, writes every field
+        same_engine = existing is not None and existing is self._form_engine
+        if same_engine and not self._meta_dirty and not self._uci_dirty:
+            # Nothing edited since the engine was loaded
+            self.save_button.setEnabled(False)
+            return
+        
+        self._ensure_uci_widgets()
+        
         if existing:
-            # Update existing
-            existing.path = path
-            existing.protocol = protocol
-            existing.options = uci_options
+            # Update existing, only touching edited fields of the loaded engine
+            if self._meta_dirty or not same_engine:
+                existing.path = path
+                existing.protocol = protocol
+            if self._uci_dirty or not same_engine:
+                existing.options = self._read_uci_options()
+            self._dict_cache.pop(id(existing), None)
+            self._form_engine = existing
         else:
             # Add new
             new_engine = EngineInfo(name, path, protocol)
-            new_engine.options = uci_options
-            self.engines.append(new_engine)
+            new_engine.options = self._read_uci_options()
+            self._own_engines()
+            self._engine_model.append_engine(new_engine)
+            self._form_engine = new_engine
             
-        self.load_engines_to_list()
         self.save_engines_to_config()
-        self.engines_changed.emit()
+        self._meta_dirty = False
+        self._uci_dirty = False
         self.save_button.setEnabled(False)
         
         QMessageBox.information(
@@ -483,31 +699,58 @@ class EngineConfigDialog(QDialog):
             f"Redémarrez le moteur pour appliquer les changements."
         )
         
+    def _read_uci_options(self) -> dict:
+        """Collect UCI options from the form"""
+        return {
+            "Threads": self.threads_spin.value(),
+            "Hash": self.hash_spin.value(),
+            "MultiPV": self.multipv_spin.value(),
+            "Ponder": self.ponder_check.isChecked(),
+            "Skill Level": self.skill_level_spin.value()
+        }
+        
     def load_engines_from_config(self):
-        """Load engines from config file"""
+        """Load engines from config file (asynchronously)"""
         if not self.config_file.exists():
             return
             
+        # Editing waits for the file: the loaded list would replace any change
+        self._set_editing_enabled(False)
+        self._io_pool.start(_ConfigIOTask.load(self.config_file, self._io_signals))
+        
+    def _set_editing_enabled(self, enabled: bool):
+        """Allow or block changes to the engine list"""
+        self.engine_list.setEnabled(enabled)
+        self.add_button.setEnabled(enabled)
+        self.browse_button.setEnabled(enabled)
+        if enabled:
+            # Remove/save follow the selection
+            self.on_selection_changed()
+        else:
+            self.remove_button.setEnabled(False)
+            self.save_button.setEnabled(False)
+        
+    def _apply_loaded_engines(self, data):
+        """Populate the engine list once the config file has been read"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if data is not None:
                 self.engines = [EngineInfo.from_dict(e) for e in data.get('engines', [])]
-                self.load_engines_to_list()
+                self._dict_cache.clear()
         except Exception as e:
-            print(f"Failed to load engines config: {e}")
+            logger.warning("Failed to load engines config: %s", e)
+        finally:
+            self._set_editing_enabled(True)
             
     def save_engines_to_config(self):
-        """Save engines to config file"""
-        try:
-            data = {
-                'engines': [e.to_dict() for e in self.engines]
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Failed to save engines config: {e}")
+        """Save engines to config file (asynchronously, emits engines_changed once written)"""
+        cache = self._dict_cache
+        data = {
+            'engines': [cache.get(id(e)) or cache.setdefault(id(e), e.to_dict())
+                        for e in self.engines]
+        }
+        self._io_pool.start(_ConfigIOTask.save(self.config_file, self._io_signals, data))
             
     def get_engines(self) -> List[EngineInfo]:
         """Get the current list of engines"""
-        return self.engines.copy()
+        return list(self._engines_ref)
 
@@ -1,92 +1,275 @@
 """
 Engine analysis panel with evaluation bar and principal variations
 """
+import logging
+import math
+import os
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QProgressBar, QTextEdit, QGroupBox)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen
-from typing import Optional, Dict, List
+                             QPushButton, QProgressBar, QPlainTextEdit, QGroupBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QTimer
+from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QTextCursor, QPixmap
+from typing import Optional, Dict, List, Tuple, Deque
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Upper bound for the Threads option
+_MAX_THREADS = os.cpu_count() or 64
+
+# Eval label stylesheets
+_EVAL_STYLE_NORMAL = """
+    QLabel {
+        font-size: 20pt;
+        font-weight: bold;
+        background-color: #1e1e1e;
+        border: 1px solid #3e3e3e;
+        border-radius: 4px;
+        padding: 10px;
+        color: #d4d4d4;
+    }
+"""
+
+_EVAL_STYLE_WIN = """
+    QLabel {
+        font-size: 20pt;
+        font-weight: bold;
+        background-color: #1e1e1e;
+        border: 2px solid #00ff00;
+        border-radius: 4px;
+        padding: 10px;
+        color: #00ff00;
+    }
+"""
+
+_EVAL_STYLE_LOSS = """
+    QLabel {
+        font-size: 20pt;
+        font-weight: bold;
+        background-color: #1e1e1e;
+        border: 2px solid #ff0000;
+        border-radius: 4px;
+        padding: 10px;
+        color: #ff0000;
+    }
+"""
+
+# Engine status stylesheets
+_STATUS_STYLE_IDLE = """
+    QLabel {
+        color: #888888; 
+        font-size: 10pt;
+        padding: 4px 8px;
+        background-color: #1e1e1e;
+        border-left: 3px solid #888888;
+        border-radius: 3px;
+    }
+"""
+
+_STATUS_STYLE_ACTIVE = """
+    QLabel {
+        color: #4FC3F7; 
+        font-size: 10pt;
+        font-weight: bold;
+        padding: 4px 8px;
+        background-color: #1e1e1e;
+        border-left: 3px solid #4FC3F7;
+        border-radius: 3px;
+    }
+"""
+
+_STATUS_STYLE_CLEARED = "color: #888888; font-size: 9pt;"
+
+_STATUS_STYLE_NOT_CONFIGURED = "color: #ff6b6b; font-size: 9pt;"
+
+
+# Count humanization: (suffix, divisor) per tier
+_UNITS = (('', 1), ('K', 1_000), ('M', 1_000_000), ('G', 1_000_000_000))
+
+# Highest tier a number of a given bit length can reach; numbers at or
+# below that tier's divisor drop one tier (e.g. 1000 stays unscaled)
+_TIER_BY_BITS = tuple(
+    max(t for t, (_, div) in enumerate(_UNITS) if div < (1 << bits) or t == 0)
+    for bits in range(65)
+)
+
+
+def _fmt_count(n: int) -> str:
+    """Format a node/NPS count as e.g. 950, 12.3K, 4.5M"""
+    tier = _TIER_BY_BITS[min(int(n).bit_length(), 64)]
+    if n <= _UNITS[tier][1]:
+        tier -= 1
+    if tier <= 0:
+        return f"{n}"
+    suffix, div = _UNITS[tier]
+    return f"{n/div:.1f}{suffix}"
 
 
 class EvaluationBar(QWidget):
     """Visual evaluation bar showing position assessment"""
     
+    # (eval_cp, mate_in), always delivered through the event loop
+    eval_changed = pyqtSignal(object, object)
+    
+    # Painter resources shared by all bars
+    _BLACK = QColor("#2c2c2c")
+    _WHITE = QColor("#e8e8e8")
+    _TEXT_COLOR = QColor("#d4d4d4")
+    _BORDER_PEN = QPen(QColor("#3e3e3e"), 2)
+    _CENTER_PEN = QPen(QColor("#0e639c"), 2)
+    _TEXT_FONT: Optional[QFont] = None  # Needs a QApplication, built on first paint
+    TEXT_BAND_H = 20  # Height of the evaluation text area
+    
+    # White share of the bar for each centipawn value in [-1000, 1000],
+    # using Lichess' win-probability curve
+    _WHITE_FRACTION = tuple(
+        (50 + 50 * (2 / (1 + math.exp(-0.00368208 * cp)) - 1)) / 100
+        for cp in range(-1000, 1001)
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.evaluation = 0.0  # In pawns, positive = white advantage
         self.is_mate = False
         self.mate_in = 0
+        self._white_fraction = 0.5  # Share of the bar painted white (0-1)
+        self._text_str = "0.0"  # Evaluation text shown on the bar
+        self._overlay: Optional[QPixmap] = None  # Border and center line, per size
         self.setMinimumHeight(400)
         self.setMaximumWidth(40)
+        self.eval_changed.connect(self._apply_evaluation, Qt.ConnectionType.QueuedConnection)
         
     def set_evaluation(self, eval_cp: Optional[int] = None, mate_in: Optional[int] = None):
         """
         Set the evaluation
         
+        Safe to call from any thread: the new value is queued and applied
+        on the GUI thread.
+        
         Args:
             eval_cp: Evaluation in centipawns (from white's perspective)
             mate_in: Mate in N moves (positive = white mates, negative = black mates)
         """
+        self.eval_changed.emit(eval_cp, mate_in)
+        
+    def _apply_evaluation(self, eval_cp: Optional[int], mate_in: Optional[int]):
+        """Update the bar state on the GUI thread and schedule a repaint"""
         if mate_in is not None:
-            self.is_mate = True
-            self.mate_in = mate_in
             # Max out the bar for mate
-            self.evaluation = 10.0 if mate_in > 0 else -10.0
+            state = (True, mate_in, 10.0 if mate_in > 0 else -10.0)
         elif eval_cp is not None:
-            self.is_mate = False
-            # Convert centipawns to pawns
-            self.evaluation = eval_cp / 100.0
-            # Clamp to reasonable range for display
-            self.evaluation = max(-10.0, min(10.0, self.evaluation))
+            # Convert centipawns to pawns, clamped to reasonable range for display
+            state = (False, self.mate_in, max(-10.0, min(10.0, eval_cp / 100.0)))
+        else:
+            return
+            
+        # Engines repeat the same score across depths: nothing to repaint
+        if state == (self.is_mate, self.mate_in, self.evaluation):
+            return
+        
+        old_black_height = self._black_height()
+        old_text = self._text_str
         
-        self.update()
+        self.is_mate, self.mate_in, self.evaluation = state
+        
+        if self.is_mate:
+            # Mate fills the bar for the mating side
+            self._white_fraction = 1.0 if self.evaluation > 0 else 0.0
+            self._text_str = f"M{abs(self.mate_in)}"
+        else:
+            self._white_fraction = self._WHITE_FRACTION[round(self.evaluation * 100) + 1000]
+            self._text_str = f"{abs(self.evaluation):.1f}"
+        
+        # Only repaint the band between the old and new split plus both text spots
+        new_black_height = self._black_height()
+        if new_black_height == old_black_height and self._text_str == old_text:
+            return
+        top = min(old_black_height, new_black_height)
+        dirty = QRect(0, top, self.width(), abs(new_black_height - old_black_height))
+        dirty = dirty.united(self._text_rect(old_black_height))
+        dirty = dirty.united(self._text_rect(new_black_height))
+        self.update(dirty)
+        
+    def _black_height(self) -> int:
+        """Height in pixels of the black (top) portion"""
+        height = self.height()
+        return height - int(height * self._white_fraction)
+        
+    def _text_rect(self, black_height: int) -> QRect:
+        """Rectangle holding the evaluation text, placed in the larger section"""
+        white_height = self.height() - black_height
+        text_y = black_height // 2 if black_height > white_height else black_height + white_height // 2
+        return QRect(0, text_y, self.width(), self.TEXT_BAND_H)
+        
+    @classmethod
+    def _text_font(cls) -> QFont:
+        """Bold 9pt font shared by all bars"""
+        if cls._TEXT_FONT is None:
+            cls._TEXT_FONT = QFont()
+            cls._TEXT_FONT.setPointSize(9)
+            cls._TEXT_FONT.setBold(True)
+        return cls._TEXT_FONT
+        
+    def resizeEvent(self, event):
+        """Drop the static overlay, it depends on the widget size"""
+        self._overlay = None
+        super().resizeEvent(event)
+        
+    def _static_overlay(self) -> QPixmap:
+        """Border and center line, rendered once per widget size"""
+        if self._overlay is None:
+            width = self.width()
+            height = self.height()
+            ratio = self.devicePixelRatioF()
+            overlay = QPixmap(int(width * ratio), int(height * ratio))
+            overlay.setDevicePixelRatio(ratio)
+            overlay.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(overlay)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            
+            # Draw border
+            painter.setPen(self._BORDER_PEN)
+            painter.drawRect(1, 1, width - 2, height - 2)
+            
+            # Draw center line
+            center_y = height // 2
+            painter.setPen(self._CENTER_PEN)
+            painter.drawLine(0, center_y, width, center_y)
+            painter.end()
+            
+            self._overlay = overlay
+        return self._overlay
         
     def paintEvent(self, event):
         """Paint the evaluation bar"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Only the dirty region scheduled by _apply_evaluation needs compositing
+        painter.setClipRect(event.rect())
         
         width = self.width()
         height = self.height()
         
-        # Calculate white percentage (0-1)
-        # eval +5 = 100% white, -5 = 0% white (100% black)
-        white_percentage = (self.evaluation + 10.0) / 20.0
-        white_percentage = max(0.0, min(1.0, white_percentage))
-        
-        white_height = int(height * white_percentage)
-        black_height = height - white_height
+        black_height = self._black_height()
+        white_height = height - black_height
         
         # Draw black portion (top)
-        painter.fillRect(0, 0, width, black_height, QColor("#2c2c2c"))
+        painter.fillRect(0, 0, width, black_height, self._BLACK)
         
         # Draw white portion (bottom)
-        painter.fillRect(0, black_height, width, white_height, QColor("#e8e8e8"))
-        
-        # Draw border
-        painter.setPen(QPen(QColor("#3e3e3e"), 2))
-        painter.drawRect(1, 1, width - 2, height - 2)
+        painter.fillRect(0, black_height, width, white_height, self._WHITE)
         
-        # Draw center line
-        center_y = height // 2
-        painter.setPen(QPen(QColor("#0e639c"), 2))
-        painter.drawLine(0, center_y, width, center_y)
+        # Draw border and center line
+        painter.drawPixmap(0, 0, self._static_overlay())
         
         # Draw evaluation text
-        painter.setPen(QColor("#d4d4d4"))
-        font = painter.font()
-        font.setPointSize(9)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setPen(self._TEXT_COLOR)
+        painter.setFont(self._text_font())
         
-        if self.is_mate:
-            text = f"M{abs(self.mate_in)}"
-        else:
-            text = f"{abs(self.evaluation):.1f}"
-            
         # Position text in the larger section
-        text_y = black_height // 2 if black_height > white_height else black_height + white_height // 2
-        painter.drawText(0, text_y, width, 20, Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawText(self._text_rect(black_height), Qt.AlignmentFlag.AlignCenter, self._text_str)
 
 
 class PrincipalVariationWidget(QWidget):
@@ -95,6 +278,9 @@ class PrincipalVariationWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.variations: List[Dict] = []
+        self._lines: List[str] = []  # Lines currently displayed
+        self._line_cache: Dict[int, Tuple[tuple, str]] = {}  # slot -> (key, line)
+        self._pv_join_cache: Dict[int, Tuple[tuple, str]] = {}  # slot -> (moves, joined)
         self.init_ui()
         
     def init_ui(self):
@@ -109,11 +295,12 @@ class PrincipalVariationWidget(QWidget):
         layout.addWidget(title)
         
         # Text display for variations
-        self.pv_text = QTextEdit()
+        self.pv_text = QPlainTextEdit()
         self.pv_text.setReadOnly(True)
+        self.pv_text.setUndoRedoEnabled(False)
         self.pv_text.setMaximumHeight(150)
         self.pv_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 border: 1px solid #3e3e3e;
@@ -134,30 +321,66 @@ class PrincipalVariationWidget(QWidget):
         """
         self.variations = variations
         
-        # Format text
-        text_lines = []
+        # Format text, reusing lines whose displayed content is unchanged
+        lines = []
         for i, var in enumerate(variations, 1):
-            # Format score
-            if var.get("mate") is not None:
-                score_str = f"M{var['mate']}"
-            elif var.get("score") is not None:
-                score = var["score"] / 100.0
-                score_str = f"{score:+.2f}"
-            else:
-                score_str = "..."
-                
-            # Format moves
-            moves = " ".join(var.get("pv", [])[:8])  # Show first 8 moves
-            if len(var.get("pv", [])) > 8:
-                moves += " ..."
-                
-            text_lines.append(f"{i}. [{score_str}] {moves}")
+            pv = var.get("pv", ())
+            head = tuple(pv[:8])  # Show first 8 moves
+            truncated = len(pv) > 8
+            key = (var.get("score"), var.get("mate"), head, truncated)
+            cached = self._line_cache.get(i)
+            if cached is None or cached[0] != key:
+                cached = (key, self._format_line(i, var, self._joined_moves(i, head, truncated)))
+                self._line_cache[i] = cached
+            lines.append(cached[1])
+            
+        if lines == self._lines:
+            return
+            
+        if self._lines and len(lines) == len(self._lines):
+            # Same layout: rewrite only the lines that changed
+            document = self.pv_text.document()
+            cursor = QTextCursor(document)
+            cursor.beginEditBlock()
+            for row, (old, new) in enumerate(zip(self._lines, lines)):
+                if old != new:
+                    cursor.setPosition(document.findBlockByNumber(row).position())
+                    cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock,
+                                        QTextCursor.MoveMode.KeepAnchor)
+                    cursor.insertText(new)
+            cursor.endEditBlock()
+        else:
+            self.pv_text.setPlainText("\n".join(lines))
+        self._lines = lines
+        
+    def _joined_moves(self, index: int, head: tuple, truncated: bool) -> str:
+        """Moves of a line as text, joined once per distinct move sequence"""
+        cached = self._pv_join_cache.get(index)
+        if cached is None or cached[0] != head:
+            cached = (head, " ".join(head))
+            self._pv_join_cache[index] = cached
+        return cached[1] + " ..." if truncated else cached[1]
+        
+    @staticmethod
+    def _format_line(index: int, var: Dict, moves: str) -> str:
+        """Format one variation line"""
+        # Format score
+        if var.get("mate") is not None:
+            score_str = f"M{var['mate']}"
+        elif var.get("score") is not None:
+            score = var["score"] / 100.0
+            score_str = f"{score:+.2f}"
+        else:
+            score_str = "..."
             
-        self.pv_text.setPlainText("\n".join(text_lines))
+        return f"{index}. [{score_str}] {moves}"
         
     def clear(self):
         """Clear variations"""
         self.variations = []
+        self._lines = []
+        self._line_cache.clear()
+        self._pv_join_cache.clear()
         self.pv_text.clear()
 
 
@@ -168,6 +391,13 @@ class EnginePanel(QWidget):
     start_analysis = pyqtSignal()
     stop_analysis = pyqtSignal()
     option_changed = pyqtSignal(str, object)
+    _drain_requested = pyqtSignal()  # Internal: buffered info awaits rendering
+    
+    # Highest MultiPV the engine config dialog allows
+    MAX_MULTIPV = 5
+    
+    # Positions kept in the evaluation cache
+    EVAL_CACHE_SIZE = 4096
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -175,7 +405,28 @@ class EnginePanel(QWidget):
         self.current_depth = 0
         self.current_nodes = 0
         self.current_threads = 1
-        self.variations_data: Dict[int, Dict] = {}  # multipv -> data
+        # Latest data per line, indexed by multipv - 1
+        self._variations: List[Optional[Dict]] = [None] * self.MAX_MULTIPV
+        self._active_pv_count = 0  # Highest multipv received
+        
+        # Lines of already analyzed positions: fen -> (depth, lines), LRU ordered
+        self._eval_cache: "OrderedDict[str, Tuple[int, List[Dict]]]" = OrderedDict()
+        self._current_fen: Optional[str] = None
+        self._current_eval_style: Optional[str] = None
+        self._current_status_style: Optional[str] = None
+        self._last_nodes_text = ""
+        self._last_nps_text = ""
+        
+        # Engine info is buffered (from any thread) and rendered at most
+        # once per frame (~30 Hz); deque append/popleft are thread-safe
+        self._ring: Deque[Dict] = deque(maxlen=64)
+        self._drain_scheduled = False
+        self._drain_requested.connect(self._schedule_drain)
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(33)
+        self._update_timer.timeout.connect(self._flush_updates)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -193,16 +444,7 @@ class EnginePanel(QWidget):
         header_layout.addWidget(title)
         
         self.engine_status = QLabel("Aucun moteur")
-        self.engine_status.setStyleSheet("""
-            QLabel {
-                color: #888888; 
-                font-size: 10pt;
-                padding: 4px 8px;
-                background-color: #1e1e1e;
-                border-left: 3px solid #888888;
-                border-radius: 3px;
-            }
-        """)
+        self._set_status_style(_STATUS_STYLE_IDLE)
         header_layout.addWidget(self.engine_status)
         
         main_layout.addLayout(header_layout)
@@ -255,6 +497,12 @@ class EnginePanel(QWidget):
             }
         """)
         self.threads_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Size for the widest value so thread changes never re-layout the row
+        self.threads_label.ensurePolished()
+        self.threads_label.setText(f"{_MAX_THREADS}")
+        widest = self.threads_label.sizeHint().width()
+        self.threads_label.setText("--")
+        self.threads_label.setFixedWidth(max(widest, self.threads_label.sizeHint().width()))
         threads_row.addWidget(self.threads_label)
         
         btn_style = """
@@ -344,17 +592,7 @@ class EnginePanel(QWidget):
         # Numeric evaluation
         self.eval_label = QLabel("0.00")
         self.eval_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.eval_label.setStyleSheet("""
-            QLabel {
-                font-size: 20pt;
-                font-weight: bold;
-                background-color: #1e1e1e;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                padding: 10px;
-                color: #d4d4d4;
-            }
-        """)
+        self._set_eval_style(_EVAL_STYLE_NORMAL)
         eval_info_layout.addWidget(self.eval_label)
         
         # Analysis info - more compact and cleaner
@@ -400,20 +638,22 @@ class EnginePanel(QWidget):
         main_layout.addLayout(button_layout)
         main_layout.addStretch()
         
+    def _set_eval_style(self, style: str):
+        """Apply an eval label stylesheet unless it is already active"""
+        if style is not self._current_eval_style:
+            self._current_eval_style = style
+            self.eval_label.setStyleSheet(style)
+            
+    def _set_status_style(self, style: str):
+        """Apply an engine status stylesheet unless it is already active"""
+        if style is not self._current_status_style:
+            self._current_status_style = style
+            self.engine_status.setStyleSheet(style)
+        
     def set_engine_status(self, engine_name: str, uci_options: Optional[Dict] = None):
         """Set engine status and UCI parameters"""
         self.engine_status.setText(f"🔹 {engine_name}")
-        self.engine_status.setStyleSheet("""
-            QLabel {
-                color: #4FC3F7; 
-                font-size: 10pt;
-                font-weight: bold;
-                padding: 4px 8px;
-                background-color: #1e1e1e;
-                border-left: 3px solid #4FC3F7;
-                border-radius: 3px;
-            }
-        """)
+        self._set_status_style(_STATUS_STYLE_ACTIVE)
         self.analyze_button.setEnabled(True)
         
         # Display UCI parameters
@@ -438,10 +678,15 @@ class EnginePanel(QWidget):
             self.minus_thread_btn.setEnabled(False)
             self.plus_thread_btn.setEnabled(False)
         
+    def set_engine_not_configured(self):
+        """Show that no engine has been configured yet"""
+        self.set_engine_status("Non configuré")
+        self._set_status_style(_STATUS_STYLE_NOT_CONFIGURED)
+        
     def clear_engine_status(self):
         """Clear engine status"""
         self.engine_status.setText("Aucun moteur")
-        self.engine_status.setStyleSheet("color: #888888; font-size: 9pt;")
+        self._set_status_style(_STATUS_STYLE_CLEARED)
         self.analyze_button.setEnabled(False)
         self.stop_button.setEnabled(False)
         self.minus_thread_btn.setEnabled(False)
@@ -449,19 +694,19 @@ class EnginePanel(QWidget):
     
     def _on_increase_threads(self):
         """Increase thread count"""
-        import os
-        max_threads = os.cpu_count() or 64
-        if self.current_threads < max_threads:
-            self.current_threads += 1
-            self.threads_label.setText(f"Threads: {self.current_threads}")
-            self.option_changed.emit("Threads", self.current_threads)
+        self._set_threads(min(self.current_threads + 1, _MAX_THREADS))
             
     def _on_decrease_threads(self):
         """Decrease thread count"""
-        if self.current_threads > 1:
-            self.current_threads -= 1
-            self.threads_label.setText(f"Threads: {self.current_threads}")
-            self.option_changed.emit("Threads", self.current_threads)
+        self._set_threads(max(self.current_threads - 1, 1))
+        
+    def _set_threads(self, threads: int):
+        """Apply a new thread count and notify the engine"""
+        if threads == self.current_threads:
+            return
+        self.current_threads = threads
+        self.threads_label.setText(f"{self.current_threads}")
+        self.option_changed.emit("Threads", self.current_threads)
             
     def update_analysis(self, data: Dict):
         """
@@ -470,89 +715,163 @@ class EnginePanel(QWidget):
         Args:
             data: Analysis data dict with score, depth, pv, etc.
         """
-        multipv = data.get("multipv", 1)
-        self.variations_data[multipv] = data
+        self.push_info(data)
         
-        # Update for first variation (main line)
-        if multipv == 1:
-            # Update evaluation bar and label
-            if data.get("mate") is not None:
-                self.eval_bar.set_evaluation(mate_in=data["mate"])
-                self.eval_label.setText(f"Mat en {abs(data['mate'])}")
-                if data["mate"] > 0:
-                    self.eval_label.setStyleSheet("""
-                        QLabel {
-                            font-size: 20pt;
-                            font-weight: bold;
-                            background-color: #1e1e1e;
-                            border: 2px solid #00ff00;
-                            border-radius: 4px;
-                            padding: 10px;
-                            color: #00ff00;
-                        }
-                    """)
-                else:
-                    self.eval_label.setStyleSheet("""
-                        QLabel {
-                            font-size: 20pt;
-                            font-weight: bold;
-                            background-color: #1e1e1e;
-                            border: 2px solid #ff0000;
-                            border-radius: 4px;
-                            padding: 10px;
-                            color: #ff0000;
-                        }
-                    """)
-            elif data.get("score") is not None:
-                score = data["score"]
-                self.eval_bar.set_evaluation(eval_cp=score)
-                self.eval_label.setText(f"{score/100.0:+.2f}")
-                self.eval_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 20pt;
-                        font-weight: bold;
-                        background-color: #1e1e1e;
-                        border: 1px solid #3e3e3e;
-                        border-radius: 4px;
-                        padding: 10px;
-                        color: #d4d4d4;
-                    }
-                """)
-                
-            # Update info labels
-            self.depth_label.setText(f"Profondeur: {data.get('depth', 0)}")
+    def push_info(self, data: Dict):
+        """
+        Buffer engine info for the next display refresh
+        
+        Can be called from the engine thread. Only one Qt signal is
+        emitted per batch; _flush_updates keeps the latest data per line.
+        
+        Args:
+            data: Analysis data dict with score, depth, pv, etc.
+        """
+        self._ring.append(data)
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._drain_requested.emit()
             
-            nodes = data.get('nodes', 0)
-            if nodes > 1_000_000:
-                self.nodes_label.setText(f"Nœuds: {nodes/1_000_000:.1f}M")
-            elif nodes > 1_000:
-                self.nodes_label.setText(f"Nœuds: {nodes/1_000:.1f}K")
-            else:
-                self.nodes_label.setText(f"Nœuds: {nodes}")
-                
-            nps = data.get('nps', 0)
-            if nps > 1_000_000:
-                self.nps_label.setText(f"N/s: {nps/1_000_000:.1f}M")
-            elif nps > 1_000:
-                self.nps_label.setText(f"N/s: {nps/1_000:.1f}K")
-            else:
-                self.nps_label.setText(f"N/s: {nps}")
+    def _schedule_drain(self):
+        """Start the coalescing timer (GUI thread)"""
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+            
+    def _flush_updates(self):
+        """Render the analysis data buffered since the last flush"""
+        self._drain_scheduled = False
+        pending: Dict[int, Dict] = {}  # multipv -> latest data
+        ring = self._ring
+        current_fen = self._current_fen
+        while ring:
+            data = ring.popleft()
+            # Late info from the search of a previous position
+            if current_fen is not None and data.get("fen", current_fen) != current_fen:
+                continue
+            pending[data.get("multipv", 1)] = data
+        if not pending:
+            return
+        for multipv, line in pending.items():
+            if multipv > len(self._variations):
+                self._variations.extend([None] * (multipv - len(self._variations)))
+            self._variations[multipv - 1] = line
+            if multipv > self._active_pv_count:
+                self._active_pv_count = multipv
+        
+        # Update for first variation (main line)
+        data = pending.get(1)
+        if data is not None:
+            self._render_main_line(data)
                 
         # Update principal variations
-        variations = sorted(self.variations_data.values(), key=lambda x: x.get("multipv", 1))
+        variations = [v for v in self._variations[:self._active_pv_count] if v is not None]
+        self.pv_widget.update_variations(variations)
+        self._store_in_cache(variations)
+        
+    def _render_main_line(self, data: Dict):
+        """Show evaluation and search info of the main line"""
+        # Update evaluation bar and label
+        if data.get("mate") is not None:
+            self.eval_bar.set_evaluation(mate_in=data["mate"])
+            self.eval_label.setText(f"Mat en {abs(data['mate'])}")
+            self._set_eval_style(_EVAL_STYLE_WIN if data["mate"] > 0 else _EVAL_STYLE_LOSS)
+        elif data.get("score") is not None:
+            score = data["score"]
+            self.eval_bar.set_evaluation(eval_cp=score)
+            self.eval_label.setText(f"{score/100.0:+.2f}")
+            self._set_eval_style(_EVAL_STYLE_NORMAL)
+            
+        # Update info labels
+        self.depth_label.setText(f"Profondeur: {data.get('depth', 0)}")
+        
+        nodes_text = f"Nœuds: {_fmt_count(data.get('nodes', 0))}"
+        if nodes_text != self._last_nodes_text:
+            self._last_nodes_text = nodes_text
+            self.nodes_label.setText(nodes_text)
+            
+        nps_text = f"N/s: {_fmt_count(data.get('nps', 0))}"
+        if nps_text != self._last_nps_text:
+            self._last_nps_text = nps_text
+            self.nps_label.setText(nps_text)
+            
+    def _store_in_cache(self, variations: List[Dict]):
+        """Remember the lines of the current position, keeping the deepest"""
+        if self._current_fen is None or not variations:
+            return
+        depth = variations[0].get("depth", 0)
+        cached = self._eval_cache.get(self._current_fen)
+        if cached is None or depth >= cached[0]:
+            self._eval_cache[self._current_fen] = (depth, variations)
+        self._eval_cache.move_to_end(self._current_fen)
+        if len(self._eval_cache) > self.EVAL_CACHE_SIZE:
+            self._eval_cache.popitem(last=False)
+            
+    def cache_lookup(self, fen: str) -> Optional[List[Dict]]:
+        """
+        Get the cached lines of a position
+        
+        Args:
+            fen: Position FEN
+            
+        Returns:
+            Lines ordered by multipv, or None if the position was never analyzed
+        """
+        cached = self._eval_cache.get(fen)
+        if cached is None:
+            return None
+        self._eval_cache.move_to_end(fen)
+        return cached[1]
+        
+    def apply_cached(self, fen: str) -> bool:
+        """
+        Set the position being analyzed and show its cached lines, if any
+        
+        Args:
+            fen: Position FEN
+            
+        Returns:
+            True if cached lines were displayed
+        """
+        if fen != self._current_fen:
+            # Lines of the previous position must not mix with the new ones
+            self._clear_variations()
+        self._current_fen = fen
+        self._discard_pending_updates()
+        variations = self.cache_lookup(fen)
+        if variations is None:
+            self.pv_widget.clear()
+            return False
+        self._variations = list(variations)
+        if len(self._variations) < self.MAX_MULTIPV:
+            self._variations.extend([None] * (self.MAX_MULTIPV - len(self._variations)))
+        self._active_pv_count = len(variations)
+        self._render_main_line(variations[0])
         self.pv_widget.update_variations(variations)
+        return True
+        
+    def _clear_variations(self):
+        """Forget all received lines"""
+        self._variations = [None] * self.MAX_MULTIPV
+        self._active_pv_count = 0
+        
+    def _discard_pending_updates(self):
+        """Drop analysis data not rendered yet"""
+        self._update_timer.stop()
+        self._ring.clear()
+        self._drain_scheduled = False
         
     def _on_analyze_clicked(self):
         """Handle analyze button click"""
-        print("DEBUG: EnginePanel._on_analyze_clicked appele")
-        print(f"DEBUG: is_analyzing avant: {self.is_analyzing}")
+        logger.debug("EnginePanel._on_analyze_clicked appele")
+        logger.debug("is_analyzing avant: %s", self.is_analyzing)
         self.is_analyzing = True
         self.analyze_button.setEnabled(False)
         self.stop_button.setEnabled(True)
-        self.variations_data.clear()
-        print("DEBUG: Emission du signal start_analysis")
+        self._clear_variations()
+        self._discard_pending_updates()
+        logger.debug("Emission du signal start_analysis")
         self.start_analysis.emit()
-        print(f"DEBUG: is_analyzing apres: {self.is_analyzing}")
+        logger.debug("is_analyzing apres: %s", self.is_analyzing)
         
     def _on_stop_clicked(self):
         """Handle stop button click"""
@@ -565,22 +884,15 @@ class EnginePanel(QWidget):
         """Reset analysis display"""
         self.eval_bar.set_evaluation(eval_cp=0)
         self.eval_label.setText("0.00")
-        self.eval_label.setStyleSheet("""
-            QLabel {
-                font-size: 20pt;
-                font-weight: bold;
-                background-color: #1e1e1e;
-                border: 1px solid #3e3e3e;
-                border-radius: 4px;
-                padding: 10px;
-                color: #d4d4d4;
-            }
-        """)
+        self._set_eval_style(_EVAL_STYLE_NORMAL)
         self.depth_label.setText("Profondeur: --")
         self.nodes_label.setText("Nœuds: --")
         self.nps_label.setText("N/s: --")
+        self._last_nodes_text = ""
+        self._last_nps_text = ""
         self.pv_widget.clear()
-        self.variations_data.clear()
+        self._clear_variations()
+        self._discard_pending_updates()
         
         if self.is_analyzing:
             self._on_stop_clicked()
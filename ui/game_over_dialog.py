@@ -1,10 +1,84 @@
 """
 Game Over Dialog - Shows the result of a chess game
 """
+import logging
+import re
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QWidget)
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QPixmap, QPainter
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Game outcomes
+WIN_WHITE = "win_white"
+WIN_BLACK = "win_black"
+DRAW = "draw"
+ENDED = "ended"
+
+# PGN result -> outcome
+_RESULT_OUTCOMES = {"1-0": WIN_WHITE, "0-1": WIN_BLACK, "1/2-1/2": DRAW}
+
+# Outcome -> (icon, title, title color)
+_OUTCOME_DISPLAY = {
+    WIN_WHITE: ("🏆", "Victoire des Blancs !", "#4CAF50"),
+    WIN_BLACK: ("🏆", "Victoire des Noirs !", "#4CAF50"),
+    DRAW: ("🤝", "Match Nul", "#FFC107"),
+    ENDED: ("🏆", "Partie Terminée", "#4CAF50"),
+}
+
+# Draw reasons: single words matched by set lookup, multi-word phrases by substring
+_DRAW_TOKENS = frozenset({"nulle", "pat", "répétition"})
+_DRAW_PHRASES = ("matériel insuffisant", "50 coups")
+
+# Decisive reasons, scanned in a single pass
+_LOSS_RE = re.compile(r"mat|abandon")
+
+# Emoji icons rasterized once (needs a QApplication, so filled on first use)
+_ICON_CACHE = {}
+_ICON_SIZE = 96
+
+
+def _icon_pixmap(icon: str) -> QPixmap:
+    """Get the pixmap of an emoji icon, rendering it on first request"""
+    pixmap = _ICON_CACHE.get(icon)
+    if pixmap is None:
+        pixmap = QPixmap(_ICON_SIZE, _ICON_SIZE)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPointSize(48)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, icon)
+        painter.end()
+        _ICON_CACHE[icon] = pixmap
+    return pixmap
+
+
+def _classify_outcome(result: str, reason: str) -> str:
+    """Determine the game outcome from the PGN result, falling back to the reason"""
+    reason_lower = reason.lower()
+    is_draw = (not _DRAW_TOKENS.isdisjoint(reason_lower.split()) or
+               any(phrase in reason_lower for phrase in _DRAW_PHRASES))
+    
+    # Priority 1: Use result if it's valid PGN notation
+    outcome = _RESULT_OUTCOMES.get(result)
+    if outcome is not None:
+        return outcome
+    if is_draw:
+        return DRAW
+    
+    # Priority 2: Fallback to reason if result is missing/invalid
+    if _LOSS_RE.search(reason_lower):
+        if "blancs" in reason_lower:
+            # Blancs ont perdu → Noirs gagnent
+            return WIN_BLACK
+        if "noirs" in reason_lower:
+            # Noirs ont perdu → Blancs gagnent
+            return WIN_WHITE
+    return ENDED
 
 
 class GameOverDialog(QDialog):
@@ -16,7 +90,51 @@ class GameOverDialog(QDialog):
         super().__init__(parent)
         self.result = result  # "1-0", "0-1", "1/2-1/2"
         self.reason = reason  # "Échec et mat", "Pat", etc.
-        self.init_ui()
+        self._ui_built = False  # Widgets are created on first show
+        
+    def update_result(self, result: str, reason: str):
+        """
+        Reuse the dialog for another game result
+        
+        Args:
+            result: PGN result ("1-0", "0-1", "1/2-1/2")
+            reason: Human readable reason
+        """
+        self.result = result
+        self.reason = reason
+        if self._ui_built:
+            self._apply_result()
+            
+    def exec(self) -> int:
+        """Build the UI if needed, then run the dialog"""
+        self._ensure_ui()
+        return super().exec()
+        
+    def show(self):
+        """Build the UI if needed, then show the dialog"""
+        self._ensure_ui()
+        super().show()
+        
+    def _ensure_ui(self):
+        """Create the widgets the first time the dialog is shown"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        
+    def _apply_result(self):
+        """Show the current result in the existing labels"""
+        logger.debug("GameOverDialog - result='%s', reason='%s'", self.result, self.reason)
+        
+        icon, title, color = _OUTCOME_DISPLAY[_classify_outcome(self.result, self.reason)]
+        if icon != self._shown_icon:
+            self._shown_icon = icon
+            self.icon_label.setPixmap(_icon_pixmap(icon))
+        self.title_label.setText(title)
+        title_style = f"color: {color};"
+        if title_style != self.title_label.styleSheet():
+            self.title_label.setStyleSheet(title_style)
+        self.reason_label.setText(self.reason)
+        self.result_label.setText(f"Résultat : {self.result}")
     
     def init_ui(self):
         """Initialize the user interface"""
@@ -24,98 +142,43 @@ class GameOverDialog(QDialog):
         self.setModal(True)
         self.setMinimumWidth(400)
         
-        # Debug logs
-        print(f"DEBUG: GameOverDialog - result='{self.result}', reason='{self.reason}'")
-        
         # Main layout
         layout = QVBoxLayout()
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
         
-        # Icon and title based on result
-        icon_label = QLabel()
-        icon_font = QFont()
-        icon_font.setPointSize(48)
-        icon_label.setFont(icon_font)
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # Icon and title, filled from the result by _apply_result
+        self._shown_icon = None
+        self.icon_label = QLabel()
+        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
-        title_label = QLabel()
+        self.title_label = QLabel()
         title_font = QFont()
         title_font.setPointSize(18)
         title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Determine icon and title - check reason for context
-        reason_lower = self.reason.lower()
-        is_draw = ("nulle" in reason_lower or 
-                   "pat" in reason_lower or
-                   "matériel insuffisant" in reason_lower or
-                   "répétition" in reason_lower or
-                   "50 coups" in reason_lower)
-        
-        # Priority 1: Use result if it's valid PGN notation
-        if self.result == "1-0":
-            icon_label.setText("🏆")
-            title_label.setText("Victoire des Blancs !")
-            title_label.setStyleSheet("color: #4CAF50;")
-        elif self.result == "0-1":
-            icon_label.setText("🏆")
-            title_label.setText("Victoire des Noirs !")
-            title_label.setStyleSheet("color: #4CAF50;")
-        elif self.result == "1/2-1/2" or is_draw:
-            icon_label.setText("🤝")
-            title_label.setText("Match Nul")
-            title_label.setStyleSheet("color: #FFC107;")
-        # Priority 2: Fallback to reason if result is missing/invalid
-        else:
-            # Try to determine winner from reason
-            if ("mat" in reason_lower or "abandon" in reason_lower):
-                if "blancs" in reason_lower:
-                    # Blancs ont perdu → Noirs gagnent
-                    icon_label.setText("🏆")
-                    title_label.setText("Victoire des Noirs !")
-                    title_label.setStyleSheet("color: #4CAF50;")
-                elif "noirs" in reason_lower:
-                    # Noirs ont perdu → Blancs gagnent
-                    icon_label.setText("🏆")
-                    title_label.setText("Victoire des Blancs !")
-                    title_label.setStyleSheet("color: #4CAF50;")
-                else:
-                    # Indéterminé
-                    icon_label.setText("🏆")
-                    title_label.setText("Partie Terminée")
-                    title_label.setStyleSheet("color: #4CAF50;")
-            elif is_draw:
-                icon_label.setText("🤝")
-                title_label.setText("Match Nul")
-                title_label.setStyleSheet("color: #FFC107;")
-            else:
-                # Fallback total
-                icon_label.setText("🏆")
-                title_label.setText("Partie Terminée")
-                title_label.setStyleSheet("color: #4CAF50;")
-        
-        layout.addWidget(icon_label)
-        layout.addWidget(title_label)
+        self.title_label.setFont(title_font)
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        layout.addWidget(self.icon_label)
+        layout.addWidget(self.title_label)
         
         # Reason label
-        reason_label = QLabel(self.reason)
+        self.reason_label = QLabel()
         reason_font = QFont()
         reason_font.setPointSize(12)
-        reason_label.setFont(reason_font)
-        reason_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        reason_label.setStyleSheet("color: #aaaaaa;")
-        layout.addWidget(reason_label)
+        self.reason_label.setFont(reason_font)
+        self.reason_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.reason_label.setStyleSheet("color: #aaaaaa;")
+        layout.addWidget(self.reason_label)
         
         # Result label (PGN notation)
-        result_label = QLabel(f"Résultat : {self.result}")
+        self.result_label = QLabel()
         result_font = QFont()
         result_font.setPointSize(11)
-        result_label.setFont(result_font)
-        result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        result_label.setStyleSheet("color: #888888;")
-        layout.addWidget(result_label)
+        self.result_label.setFont(result_font)
+        self.result_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.result_label.setStyleSheet("color: #888888;")
+        layout.addWidget(self.result_label)
         
         # Spacer
         layout.addSpacing(10)
@@ -182,6 +245,8 @@ class GameOverDialog(QDialog):
                 color: #ffffff;
             }
         """)
+        
+        self._apply_result()
     
     def on_new_game(self):
         """Handle new game button click"""
@@ -2,7 +2,7 @@
 Game report dialog - detailed analysis of a completed game
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                              QPushButton, QTextEdit, QTabWidget, QWidget,
+                              QPushButton, QPlainTextEdit, QTabWidget, QWidget,
                               QScrollArea, QGroupBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
@@ -12,16 +12,81 @@ from core.game import ChessGame
 from datetime import datetime
 
 
+# (piece type, value) pairs used for material counts
+_MATERIAL_TABLE = (
+    (chess.PAWN, 1),
+    (chess.KNIGHT, 3),
+    (chess.BISHOP, 3),
+    (chess.ROOK, 5),
+    (chess.QUEEN, 9),
+)
+
+# Dark theme of the report dialog, built once at import
+_DARK_STYLESHEET = """
+    QDialog {
+        background-color: #2b2b2b;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QTabWidget::pane {
+        border: 1px solid #3c3c3c;
+        background-color: #2b2b2b;
+    }
+    QTabBar::tab {
+        background-color: #3c3c3c;
+        color: #e0e0e0;
+        padding: 8px 16px;
+        border: 1px solid #555;
+    }
+    QTabBar::tab:selected {
+        background-color: #0d7377;
+    }
+    QPlainTextEdit, QScrollArea {
+        background-color: #1e1e1e;
+        color: #e0e0e0;
+        border: 1px solid #3c3c3c;
+    }
+    QPushButton {
+        background-color: #0d7377;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #14919b;
+    }
+    QGroupBox {
+        color: #e0e0e0;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+        margin-top: 10px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        padding: 0 5px;
+    }
+"""
+
+
 class GameReportDialog(QDialog):
     """Dialog showing detailed game report"""
     
     def __init__(self, game: ChessGame, parent=None):
         super().__init__(parent)
         self.game = game
+        self._stats = None  # (captures, checks, checkmates, castling), computed once
+        self._material = None  # (white, black) material of the final position
+        self._pgn_cache: Optional[str] = None  # PGN text, generated on first use
         self.init_ui()
         
     def init_ui(self):
         """Initialize UI"""
+        # Compute geometry once, after every child widget is in place
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("Rapport de Partie")
         self.setMinimumSize(800, 600)
         
@@ -34,21 +99,24 @@ class GameReportDialog(QDialog):
         layout.addWidget(title)
         
         # Tabs
-        tabs = QTabWidget()
-        
-        # Tab 1: Overview
-        tabs.addTab(self._create_overview_tab(), "Vue d'ensemble")
-        
-        # Tab 2: Move Analysis
-        tabs.addTab(self._create_moves_tab(), "Analyse des coups")
-        
-        # Tab 3: Statistics
-        tabs.addTab(self._create_stats_tab(), "Statistiques")
-        
-        # Tab 4: PGN Export
-        tabs.addTab(self._create_pgn_tab(), "Export PGN")
+        self.tabs = QTabWidget()
+        
+        # Tab 1: Overview (shown first, so built right away)
+        self.tabs.addTab(self._create_overview_tab(), "Vue d'ensemble")
+        
+        # Tabs 2-4: Move Analysis, Statistics, PGN Export
+        # Placeholders are replaced by the real content on first activation
+        self.tabs.addTab(QWidget(), "Analyse des coups")
+        self.tabs.addTab(QWidget(), "Statistiques")
+        self.tabs.addTab(QWidget(), "Export PGN")
+        self._tab_builders = {
+            1: self._create_moves_tab,
+            2: self._create_stats_tab,
+            3: self._create_pgn_tab,
+        }
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         
         # Close button
         close_btn = QPushButton("Fermer")
@@ -58,54 +126,25 @@ class GameReportDialog(QDialog):
         self.setLayout(layout)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3c3c3c;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #3c3c3c;
-                color: #e0e0e0;
-                padding: 8px 16px;
-                border: 1px solid #555;
-            }
-            QTabBar::tab:selected {
-                background-color: #0d7377;
-            }
-            QTextEdit, QScrollArea {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-                border: 1px solid #3c3c3c;
-            }
-            QPushButton {
-                background-color: #0d7377;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #14919b;
-            }
-            QGroupBox {
-                color: #e0e0e0;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                margin-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                padding: 0 5px;
-            }
-        """)
+        self.setStyleSheet(_DARK_STYLESHEET)
+        
+        self.setUpdatesEnabled(True)
+        
+    def _on_tab_changed(self, index: int):
+        """Build a tab's content the first time it is selected"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        
+        title = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        # Swapping the tab moves the current index around: keep it quiet
+        self.tabs.blockSignals(True)
+        self.tabs.insertTab(index, builder(), title)
+        self.tabs.removeTab(index + 1)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
         
     def _create_overview_tab(self) -> QWidget:
         """Create overview tab"""
@@ -117,17 +156,19 @@ class GameReportDialog(QDialog):
         info_layout = QVBoxLayout()
         
         # Result
-        result = "En cours"
-        if self.game.board.is_game_over():
-            if self.game.board.is_checkmate():
-                winner = "Blancs" if not self.game.board.turn else "Noirs"
-                result = f"Mat - Victoire des {winner}"
-            elif self.game.board.is_stalemate():
-                result = "Pat - Nulle"
-            elif self.game.board.is_insufficient_material():
-                result = "Matériel insuffisant - Nulle"
-            else:
-                result = "Nulle"
+        # outcome() generates legal moves once for the whole ladder
+        outcome = self.game.board.outcome()
+        if outcome is None:
+            result = "En cours"
+        elif outcome.termination == chess.Termination.CHECKMATE:
+            winner = "Blancs" if outcome.winner == chess.WHITE else "Noirs"
+            result = f"Mat - Victoire des {winner}"
+        elif outcome.termination == chess.Termination.STALEMATE:
+            result = "Pat - Nulle"
+        elif outcome.termination == chess.Termination.INSUFFICIENT_MATERIAL:
+            result = "Matériel insuffisant - Nulle"
+        else:
+            result = "Nulle"
         
         info_layout.addWidget(QLabel(f"<b>Résultat:</b> {result}"))
         info_layout.addWidget(QLabel(f"<b>Nombre de coups:</b> {len(self.game.move_history)}"))
@@ -144,8 +185,7 @@ class GameReportDialog(QDialog):
         pos_layout.addWidget(QLabel(f"<b>Échec:</b> {'Oui' if self.game.board.is_check() else 'Non'}"))
         
         # Material count
-        white_material = self._count_material(chess.WHITE)
-        black_material = self._count_material(chess.BLACK)
+        white_material, black_material = self._material_counts()
         pos_layout.addWidget(QLabel(f"<b>Matériel Blancs:</b> {white_material}"))
         pos_layout.addWidget(QLabel(f"<b>Matériel Noirs:</b> {black_material}"))
         pos_layout.addWidget(QLabel(f"<b>Avantage:</b> {abs(white_material - black_material)} ({'Blancs' if white_material > black_material else 'Noirs' if black_material > white_material else 'Égal'})"))
@@ -162,19 +202,24 @@ class GameReportDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout()
         
-        text_edit = QTextEdit()
+        header = QLabel("Historique des coups")
+        header.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        layout.addWidget(header)
+        
+        # Plain text: no rich-text layout for long move lists
+        text_edit = QPlainTextEdit()
         text_edit.setReadOnly(True)
+        text_edit.setFont(QFont("Consolas", 11))
         
         # Format moves nicely
-        moves_text = "<h3>Historique des coups</h3><pre style='font-size: 12pt;'>"
+        parts = [None] * len(self.game.move_history)
         for i, move in enumerate(self.game.move_history):
             if i % 2 == 0:
-                moves_text += f"{i//2 + 1:3d}. {move:8s}"
+                parts[i] = f"{i//2 + 1:3d}. {move:8s}"
             else:
-                moves_text += f"{move:8s}\n"
-        moves_text += "</pre>"
+                parts[i] = f"{move:8s}\n"
         
-        text_edit.setHtml(moves_text)
+        text_edit.setPlainText("".join(parts))
         layout.addWidget(text_edit)
         
         widget.setLayout(layout)
@@ -189,10 +234,7 @@ class GameReportDialog(QDialog):
         stats_layout = QVBoxLayout()
         
         # Count captures, checks, castling
-        captures = sum(1 for move in self.game.move_history if 'x' in move)
-        checks = sum(1 for move in self.game.move_history if '+' in move)
-        checkmates = sum(1 for move in self.game.move_history if '#' in move)
-        castling = sum(1 for move in self.game.move_history if 'O-O' in move)
+        captures, checks, checkmates, castling = self._game_stats()
         
         stats_layout.addWidget(QLabel(f"<b>Captures:</b> {captures}"))
         stats_layout.addWidget(QLabel(f"<b>Échecs:</b> {checks}"))
@@ -214,37 +256,70 @@ class GameReportDialog(QDialog):
         label = QLabel("Export PGN de la partie:")
         layout.addWidget(label)
         
-        pgn_edit = QTextEdit()
+        pgn_edit = QPlainTextEdit()
         pgn_edit.setReadOnly(True)
+        pgn_edit.setFont(QFont("Consolas", 11))
         pgn_edit.setPlainText(self._generate_pgn())
         layout.addWidget(pgn_edit)
         
         # Copy button
         copy_btn = QPushButton("Copier le PGN")
-        copy_btn.clicked.connect(lambda: self._copy_pgn(pgn_edit.toPlainText()))
+        copy_btn.clicked.connect(lambda: self._copy_pgn(self._generate_pgn()))
         layout.addWidget(copy_btn)
         
         widget.setLayout(layout)
         return widget
         
+    def _game_stats(self) -> tuple:
+        """
+        Count captures, checks, checkmates and castles in a single pass
+        
+        The game is replayed from its starting position so each move is
+        classified by python-chess rather than by scanning SAN strings.
+        
+        Returns:
+            Tuple (captures, checks, checkmates, castling)
+        """
+        if self._stats is None:
+            captures = checks = castling = 0
+            board = self.game.board.root()
+            for move in self.game.board.move_stack:
+                if board.is_capture(move):
+                    captures += 1
+                if board.gives_check(move):
+                    checks += 1
+                if board.is_castling(move):
+                    castling += 1
+                board.push(move)
+            # Only the final position can be mate; it is not counted as a plain check
+            checkmates = 1 if self.game.board.is_checkmate() else 0
+            self._stats = (captures, checks - checkmates, checkmates, castling)
+        return self._stats
+        
     def _count_material(self, color: chess.Color) -> int:
         """Count material value for a color"""
-        values = {
-            chess.PAWN: 1,
-            chess.KNIGHT: 3,
-            chess.BISHOP: 3,
-            chess.ROOK: 5,
-            chess.QUEEN: 9,
-        }
-        
-        total = 0
-        for piece_type in [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN]:
-            total += len(self.game.board.pieces(piece_type, color)) * values[piece_type]
-        
-        return total
+        # Popcount the piece bitboards directly instead of building SquareSets
+        board = self.game.board
+        return sum(chess.popcount(board.pieces_mask(piece_type, color)) * value
+                   for piece_type, value in _MATERIAL_TABLE)
+        
+    def _material_counts(self) -> tuple:
+        """
+        Get the material of both sides, computed once per dialog
+        
+        Returns:
+            Tuple (white material, black material)
+        """
+        if self._material is None:
+            self._material = (self._count_material(chess.WHITE),
+                              self._count_material(chess.BLACK))
+        return self._material
         
     def _generate_pgn(self) -> str:
-        """Generate PGN format"""
+        """Generate PGN format (cached: the report shows a static snapshot)"""
+        if self._pgn_cache is not None:
+            return self._pgn_cache
+        
         pgn = f"""[Event "Partie ChessAvatar"]
 [Date "{datetime.now().strftime('%Y.%m.%d')}"]
 [White "Joueur"]
@@ -253,6 +328,7 @@ class GameReportDialog(QDialog):
 
 {self.game.get_pgn_moves()}
 """
+        self._pgn_cache = pgn
         return pgn
         
     def _copy_pgn(self, text: str):
@@ -3,28 +3,89 @@ Layout Configuration Dialog
 Allows users to select, create, and manage UI layouts
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
-                             QListWidget, QListWidgetItem, QPushButton, QLabel,
-                             QMessageBox, QInputDialog, QFileDialog, QTextEdit,
+                             QListView, QPushButton, QLabel,
+                             QMessageBox, QInputDialog, QFileDialog,
                              QCheckBox, QGridLayout, QSlider, QSpinBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (Qt, pyqtSignal, QTimer, QAbstractListModel,
+                          QModelIndex)
 from PyQt6.QtGui import QFont
+from typing import List, Optional, Tuple
 from ui.layout_manager import LayoutManager, LayoutConfig
 from ui.styles import get_button_style, COLORS, FONTS
 
 
+# Label styles, built once from the static theme
+_TITLE_STYLE = f"{FONTS['title']} color: {COLORS['text']};"
+_SUBTITLE_STYLE = f"color: {COLORS['text_secondary']}; padding: 5px;"
+
+
+class _LayoutListModel(QAbstractListModel):
+    """
+    List model for the layout list
+    
+    Rows are (display text, layout name, layout type) tuples; section
+    headers have no layout name and cannot be selected.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, Optional[str], Optional[str]]] = []
+        self._header_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        display, name, layout_type = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display
+        if role == Qt.ItemDataRole.UserRole:
+            return name
+        if role == Qt.ItemDataRole.UserRole + 1:
+            return layout_type
+        if role == Qt.ItemDataRole.FontRole and name is None:
+            return self._header_font
+        return None
+        
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or self._rows[index.row()][1] is None:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        
+    def set_rows(self, rows: List[Tuple[str, Optional[str], Optional[str]]]):
+        """Replace all rows in a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
 class LayoutConfigDialog(QDialog):
     """Dialog for managing UI layouts"""
     
     layout_changed = pyqtSignal(LayoutConfig)
     
+    SPLITTER_TOTAL = 1600  # Reference width used to turn the ratio into sizes
+    
     def __init__(self, layout_manager: LayoutManager, parent=None):
         super().__init__(parent)
         self.layout_manager = layout_manager
         self.current_layout = layout_manager.get_current_layout()
+        self._left_percent = self._layout_left_percent()  # Board share of the splitter
+        
+        # Coalesce description refreshes while the slider is dragged
+        self._update_desc_timer = QTimer(self)
+        self._update_desc_timer.setSingleShot(True)
+        self._update_desc_timer.setInterval(30)
+        self._update_desc_timer.timeout.connect(self.update_description)
+        
         self.init_ui()
         
     def init_ui(self):
         """Initialize UI"""
+        # Compute geometry once, after every child widget is in place
+        self.setUpdatesEnabled(False)
         self.setWindowTitle("🎨 Disposition de l'Interface")
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
@@ -33,13 +94,13 @@ class LayoutConfigDialog(QDialog):
         
         # Title
         title = QLabel("🎨 Personnalisation de la Disposition")
-        title.setStyleSheet(f"{FONTS['title']} color: {COLORS['text']};")
+        title.setStyleSheet(_TITLE_STYLE)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
         
         # Description
         desc = QLabel("Choisissez une disposition prédéfinie ou créez la vôtre")
-        desc.setStyleSheet(f"color: {COLORS['text_secondary']}; padding: 5px;")
+        desc.setStyleSheet(_SUBTITLE_STYLE)
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(desc)
         
@@ -50,8 +111,11 @@ class LayoutConfigDialog(QDialog):
         left_group = QGroupBox("📋 Dispositions Disponibles")
         left_layout = QVBoxLayout()
         
-        self.layout_list = QListWidget()
-        self.layout_list.itemClicked.connect(self.on_layout_selected)
+        self._layout_model = _LayoutListModel(self)
+        self.layout_list = QListView()
+        self.layout_list.setModel(self._layout_model)
+        self.layout_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.layout_list.clicked.connect(self.on_layout_selected)
         self.populate_layout_list()
         left_layout.addWidget(self.layout_list)
         
@@ -125,12 +189,11 @@ class LayoutConfigDialog(QDialog):
         self.splitter_slider = QSlider(Qt.Orientation.Horizontal)
         self.splitter_slider.setMinimum(50)
         self.splitter_slider.setMaximum(90)
-        left_percent = int((self.current_layout.splitter_sizes[0] / sum(self.current_layout.splitter_sizes)) * 100)
-        self.splitter_slider.setValue(left_percent)
+        self.splitter_slider.setValue(self._left_percent)
         self.splitter_slider.valueChanged.connect(self.on_splitter_changed)
         ratio_layout.addWidget(self.splitter_slider)
         
-        self.splitter_label = QLabel(f"{left_percent}% / {100-left_percent}%")
+        self.splitter_label = QLabel(f"{self._left_percent}% / {100 - self._left_percent}%")
         ratio_layout.addWidget(self.splitter_label)
         
         splitter_layout.addLayout(ratio_layout)
@@ -141,9 +204,12 @@ class LayoutConfigDialog(QDialog):
         desc_group = QGroupBox("ℹ️ Description")
         desc_layout = QVBoxLayout()
         
-        self.desc_text = QTextEdit()
+        # A rich-text label is enough for this short snippet
+        self.desc_text = QLabel()
+        self.desc_text.setTextFormat(Qt.TextFormat.RichText)
+        self.desc_text.setWordWrap(True)
+        self.desc_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         self.desc_text.setMaximumHeight(100)
-        self.desc_text.setReadOnly(True)
         self.update_description()
         desc_layout.addWidget(self.desc_text)
         
@@ -177,39 +243,29 @@ class LayoutConfigDialog(QDialog):
         
         layout.addLayout(buttons_layout)
         
+        self.setUpdatesEnabled(True)
+        
     def populate_layout_list(self):
         """Populate the layout list"""
-        self.layout_list.clear()
-        
         # Add presets
-        item = QListWidgetItem("═══ Dispositions Prédéfinies ═══")
-        item.setFlags(Qt.ItemFlag.NoItemFlags)
-        item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        self.layout_list.addItem(item)
-        
+        rows = [("═══ Dispositions Prédéfinies ═══", None, None)]
         for name, data in self.layout_manager.PRESETS.items():
-            item = QListWidgetItem(f"🎨 {data['name']}")
-            item.setData(Qt.ItemDataRole.UserRole, name)
-            item.setData(Qt.ItemDataRole.UserRole + 1, 'preset')
-            self.layout_list.addItem(item)
+            rows.append((f"🎨 {data['name']}", name, 'preset'))
         
         # Add custom layouts
-        if self.layout_manager.get_custom_names():
-            item = QListWidgetItem("\n═══ Dispositions Personnalisées ═══")
-            item.setFlags(Qt.ItemFlag.NoItemFlags)
-            item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-            self.layout_list.addItem(item)
-            
-            for name in self.layout_manager.get_custom_names():
-                item = QListWidgetItem(f"⭐ {name}")
-                item.setData(Qt.ItemDataRole.UserRole, name)
-                item.setData(Qt.ItemDataRole.UserRole + 1, 'custom')
-                self.layout_list.addItem(item)
+        custom_names = self.layout_manager.get_custom_names()
+        if custom_names:
+            rows.append(("\n═══ Dispositions Personnalisées ═══", None, None))
+            for name in custom_names:
+                rows.append((f"⭐ {name}", name, 'custom'))
+        
+        # One model reset instead of per-item inserts
+        self._layout_model.set_rows(rows)
         
-    def on_layout_selected(self, item: QListWidgetItem):
+    def on_layout_selected(self, index: QModelIndex):
         """Handle layout selection"""
-        layout_name = item.data(Qt.ItemDataRole.UserRole)
-        layout_type = item.data(Qt.ItemDataRole.UserRole + 1)
+        layout_name = index.data(Qt.ItemDataRole.UserRole)
+        layout_type = index.data(Qt.ItemDataRole.UserRole + 1)
         
         if not layout_name:
             return
@@ -229,40 +285,49 @@ class LayoutConfigDialog(QDialog):
         for key, check in self.panel_checks.items():
             check.setChecked(self.current_layout.panels_visible.get(key, True))
         
-        # Update splitter slider
-        left_percent = int((self.current_layout.splitter_sizes[0] / sum(self.current_layout.splitter_sizes)) * 100)
-        self.splitter_slider.setValue(left_percent)
-        self.splitter_label.setText(f"{left_percent}% / {100-left_percent}%")
+        # Update splitter slider without round-tripping through on_splitter_changed
+        self._left_percent = self._layout_left_percent()
+        self.splitter_slider.blockSignals(True)
+        self.splitter_slider.setValue(self._left_percent)
+        self.splitter_slider.blockSignals(False)
+        self.splitter_label.setText(f"{self._left_percent}% / {100 - self._left_percent}%")
+        
+    def _layout_left_percent(self) -> int:
+        """Get the board share of the splitter for the current layout, in percent"""
+        sizes = self.current_layout.splitter_sizes
+        return int((sizes[0] / sum(sizes)) * 100)
     
     def update_description(self):
         """Update description text"""
+        self._update_desc_timer.stop()  # Any pending refresh is served now
         if not self.current_layout:
             return
         
         desc = f"<h3>{self.current_layout.name}</h3>"
         desc += "<ul>"
         desc += f"<li><b>Panels visibles:</b> {sum(self.current_layout.panels_visible.values())}/6</li>"
-        desc += f"<li><b>Ratio échiquier/panneau:</b> {self.splitter_label.text()}</li>"
+        desc += f"<li><b>Ratio échiquier/panneau:</b> {self._left_percent}% / {100 - self._left_percent}%</li>"
         desc += "</ul>"
         
-        self.desc_text.setHtml(desc)
+        self.desc_text.setText(desc)
     
     def on_panel_visibility_changed(self, key: str, state):
         """Handle panel visibility change"""
         self.current_layout.panels_visible[key] = (state == Qt.CheckState.Checked.value)
-        self.update_description()
+        self._update_desc_timer.start()
     
     def on_splitter_changed(self, value):
         """Handle splitter slider change"""
         left = value
         right = 100 - value
         
-        # Update sizes (assuming total width of 1600)
-        total = 1600
+        # Keep the sizes and the cached ratio in step
+        total = self.SPLITTER_TOTAL
         self.current_layout.splitter_sizes = [int(total * left / 100), int(total * right / 100)]
+        self._left_percent = left
         
         self.splitter_label.setText(f"{left}% / {right}%")
-        self.update_description()
+        self._update_desc_timer.start()
     
     def create_new_layout(self):
         """Create a new custom layout"""
@@ -288,16 +353,16 @@ class LayoutConfigDialog(QDialog):
     
     def delete_layout(self):
         """Delete selected custom layout"""
-        current_item = self.layout_list.currentItem()
-        if not current_item:
+        current_index = self.layout_list.currentIndex()
+        if not current_index.isValid():
             return
         
-        layout_type = current_item.data(Qt.ItemDataRole.UserRole + 1)
+        layout_type = current_index.data(Qt.ItemDataRole.UserRole + 1)
         if layout_type != 'custom':
             QMessageBox.warning(self, "Erreur", "Vous ne pouvez supprimer que les dispositions personnalisées")
             return
         
-        layout_name = current_item.data(Qt.ItemDataRole.UserRole)
+        layout_name = current_index.data(Qt.ItemDataRole.UserRole)
         
         reply = QMessageBox.question(
             self,
@@ -2,131 +2,174 @@
 Layout Manager for ChessAvatar
 Allows users to customize and save different UI layouts
 """
-import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from PyQt6.QtCore import QSettings
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Optional, Set
+from PyQt6.QtCore import QSettings, QTimer, QCoreApplication
+from ui.layout_presets import PRESETS
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    # orjson not available, fall back to the standard library
+    import json
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+
+def _intern_keys(panels: dict) -> dict:
+    """Rebuild a panel dict with interned keys, shared with the preset literals"""
+    return {sys.intern(key): value for key, value in panels.items()}
+
+
+def _is_valid_layout_dict(data) -> bool:
+    """Cheap shape check of a serialized layout, before building a LayoutConfig"""
+    if not isinstance(data, dict):
+        return False
+    percent = data.get('notation_height_percent', 40)
+    return (isinstance(data.get('splitter_sizes', []), list) and
+            isinstance(data.get('panels_visible', {}), dict) and
+            isinstance(data.get('panels_positions', {}), dict) and
+            isinstance(percent, (int, float)) and 0 <= percent <= 100)
+
+
+# Default panel settings, copied into each new layout
+_DEFAULT_PANELS_VISIBLE = MappingProxyType({
+    'engine': True,
+    'opening': True,
+    'notation': True,
+    'clock': True,
+    'avatar_status': True,
+    'game_controls': True,
+})
+_DEFAULT_PANELS_POSITIONS = MappingProxyType({
+    'engine': 'bottom_left',
+    'opening': 'bottom_left',
+    'notation': 'right',
+    'clock': 'right',
+    'avatar_status': 'right_top',
+    'game_controls': 'right_bottom',
+})
+
+# Serialized LayoutConfig attributes, in file order
+_FIELDS = ('name', 'splitter_sizes', 'panels_visible', 'panels_positions',
+           'board_size', 'notation_height_percent')
 
 
 class LayoutConfig:
     """Represents a UI layout configuration"""
     
+    # 'name' is a property over _name so the file name can be cached
+    __slots__ = ('_name', '_filename') + _FIELDS[1:]
+    
     def __init__(self, name: str = "Default"):
         self.name = name
         self.splitter_sizes = [1200, 400]  # Main splitter
-        self.panels_visible = {
-            'engine': True,
-            'opening': True,
-            'notation': True,
-            'clock': True,
-            'avatar_status': True,
-            'game_controls': True,
-        }
-        self.panels_positions = {
-            'engine': 'bottom_left',
-            'opening': 'bottom_left',
-            'notation': 'right',
-            'clock': 'right',
-            'avatar_status': 'right_top',
-            'game_controls': 'right_bottom',
-        }
+        self.panels_visible = dict(_DEFAULT_PANELS_VISIBLE)
+        self.panels_positions = dict(_DEFAULT_PANELS_POSITIONS)
         self.board_size = 'auto'  # 'auto', 'small', 'medium', 'large'
         self.notation_height_percent = 40  # % of right panel
         
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._filename = None
+    
+    @property
+    def filename(self) -> str:
+        """File name used to store the layout, derived from its name once"""
+        if self._filename is None:
+            self._filename = f"{self._name.lower().replace(' ', '_')}.json"
+        return self._filename
+    
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        return {
-            'name': self.name,
-            'splitter_sizes': self.splitter_sizes,
-            'panels_visible': self.panels_visible,
-            'panels_positions': self.panels_positions,
-            'board_size': self.board_size,
-            'notation_height_percent': self.notation_height_percent,
-        }
+        return {field: getattr(self, field) for field in _FIELDS}
+    
+    def copy(self) -> 'LayoutConfig':
+        """Get an independent copy that can be modified freely"""
+        return self._from_validated(self.name, list(self.splitter_sizes),
+                                    dict(self.panels_visible), dict(self.panels_positions),
+                                    self.board_size, self.notation_height_percent)
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'LayoutConfig':
-        """Create from dictionary"""
-        layout = cls(data.get('name', 'Custom'))
-        layout.splitter_sizes = data.get('splitter_sizes', [1200, 400])
-        layout.panels_visible = data.get('panels_visible', layout.panels_visible)
-        layout.panels_positions = data.get('panels_positions', layout.panels_positions)
-        layout.board_size = data.get('board_size', 'auto')
-        layout.notation_height_percent = data.get('notation_height_percent', 40)
+    def _from_validated(cls, name: str, splitter_sizes: list, panels_visible: dict,
+                        panels_positions: dict, board_size: str,
+                        notation_height_percent: int) -> 'LayoutConfig':
+        """Build a layout from ready field values, without the defaults set by __init__"""
+        layout = cls.__new__(cls)
+        layout.name = name
+        layout.splitter_sizes = splitter_sizes
+        layout.panels_visible = panels_visible
+        layout.panels_positions = panels_positions
+        layout.board_size = board_size
+        layout.notation_height_percent = notation_height_percent
         return layout
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LayoutConfig':
+        """Create from dictionary (raises ValueError on malformed data)"""
+        if not _is_valid_layout_dict(data):
+            raise ValueError("invalid layout data")
+        get = data.get
+        visible = get('panels_visible')
+        positions = get('panels_positions')
+        # Keys parsed from JSON/QSettings are fresh strings: intern them so
+        # panel lookups hit the same objects as the source literals
+        return cls._from_validated(
+            get('name', 'Custom'),
+            get('splitter_sizes', [1200, 400]),
+            _intern_keys(visible) if visible is not None else dict(_DEFAULT_PANELS_VISIBLE),
+            _intern_keys(positions) if positions is not None else dict(_DEFAULT_PANELS_POSITIONS),
+            get('board_size', 'auto'),
+            get('notation_height_percent', 40),
+        )
+
+
+@lru_cache(maxsize=None)
+def _build_preset(name: str) -> Optional[LayoutConfig]:
+    """Build a preset layout once; the result is shared and must not be modified"""
+    preset_data = LayoutManager.PRESETS.get(name)
+    if not preset_data:
+        return None
+    
+    # The table is frozen: store plain copies so to_dict() stays serializable
+    layout = LayoutConfig(preset_data['name'])
+    layout.splitter_sizes = list(preset_data['splitter_sizes'])
+    layout.panels_visible = dict(preset_data['panels_visible'])
+    return layout
 
 
 class LayoutManager:
     """Manages UI layouts"""
     
-    # Preset layouts
-    PRESETS = {
-        'default': {
-            'name': 'Défaut',
-            'description': 'Layout standard avec tous les panels',
-            'splitter_sizes': [1200, 400],
-            'panels_visible': {
-                'engine': True,
-                'opening': True,
-                'notation': True,
-                'clock': True,
-                'avatar_status': True,
-                'game_controls': True,
-            },
-        },
-        'analysis': {
-            'name': 'Analyse',
-            'description': 'Optimisé pour l\'analyse (engine et notation)',
-            'splitter_sizes': [1000, 600],
-            'panels_visible': {
-                'engine': True,
-                'opening': True,
-                'notation': True,
-                'clock': False,
-                'avatar_status': False,
-                'game_controls': True,
-            },
-        },
-        'minimalist': {
-            'name': 'Minimaliste',
-            'description': 'Juste l\'échiquier et la notation',
-            'splitter_sizes': [1300, 300],
-            'panels_visible': {
-                'engine': False,
-                'opening': False,
-                'notation': True,
-                'clock': False,
-                'avatar_status': False,
-                'game_controls': True,
-            },
-        },
-        'training': {
-            'name': 'Entraînement',
-            'description': 'Focus sur l\'échiquier avec pendule',
-            'splitter_sizes': [1400, 200],
-            'panels_visible': {
-                'engine': False,
-                'opening': False,
-                'notation': True,
-                'clock': True,
-                'avatar_status': False,
-                'game_controls': True,
-            },
-        },
-        'tournament': {
-            'name': 'Tournoi',
-            'description': 'Comme en tournoi (pendule proéminente)',
-            'splitter_sizes': [1100, 500],
-            'panels_visible': {
-                'engine': False,
-                'opening': False,
-                'notation': True,
-                'clock': True,
-                'avatar_status': True,
-                'game_controls': True,
-            },
-        },
-    }
+    # Preset layouts (shared with LayoutPresets)
+    PRESETS = PRESETS
+    
+    # Config directories already created by an earlier manager
+    _ensured_dirs: ClassVar[Set[Path]] = set()
     
     def __init__(self, config_dir: Path = None):
         """
@@ -139,13 +182,26 @@ class LayoutManager:
             config_dir = Path.home() / '.chessavatar' / 'layouts'
         
         self.config_dir = config_dir
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        if config_dir not in LayoutManager._ensured_dirs:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            LayoutManager._ensured_dirs.add(config_dir)
         
         self.custom_layouts: Dict[str, LayoutConfig] = {}
         self.current_layout: Optional[LayoutConfig] = None
         
-        # Load custom layouts
-        self.load_custom_layouts()
+        # Custom layouts are read from disk on first access
+        self._custom_loaded = False
+        self._all_layouts: Optional[Dict[str, LayoutConfig]] = None  # Presets + custom
+        
+        # One settings handle for the manager's lifetime
+        self._settings = QSettings('ChessAvatar', 'LayoutManager')
+        self._last_layout_cache: Optional[LayoutConfig] = None
+        
+        # Last layout waiting to be written to QSettings (debounced)
+        self._pending_last: Optional[dict] = None
+        self._save_timer: Optional[QTimer] = None
+        self._dirty = False  # current_layout applied but not persisted yet
+        self._quit_hooked = False
         
         # Load last used layout
         self.current_layout = self.load_last_layout()
@@ -155,32 +211,29 @@ class LayoutManager:
         return list(self.PRESETS.keys())
     
     def get_preset(self, name: str) -> Optional[LayoutConfig]:
-        """Get a preset layout"""
-        preset_data = self.PRESETS.get(name)
-        if not preset_data:
-            return None
-        
-        layout = LayoutConfig(preset_data['name'])
-        layout.splitter_sizes = preset_data['splitter_sizes']
-        layout.panels_visible = preset_data['panels_visible']
-        return layout
+        """Get a preset layout (a copy the caller may modify)"""
+        layout = _build_preset(name)
+        return layout.copy() if layout else None
+    
+    def _ensure_custom_loaded(self):
+        """Load custom layouts from disk if not done yet"""
+        if not self._custom_loaded:
+            self.load_custom_layouts()
     
     def get_custom_names(self) -> List[str]:
         """Get list of custom layout names"""
+        self._ensure_custom_loaded()
         return list(self.custom_layouts.keys())
     
     def get_all_layouts(self) -> Dict[str, LayoutConfig]:
-        """Get all layouts (presets + custom)"""
-        layouts = {}
-        
-        # Add presets
-        for name in self.get_preset_names():
-            layouts[name] = self.get_preset(name)
-        
-        # Add custom
-        layouts.update(self.custom_layouts)
+        """Get all layouts (presets + custom); preset entries are shared instances"""
+        self._ensure_custom_loaded()
+        if self._all_layouts is None:
+            # Presets straight from the table, then custom layouts
+            self._all_layouts = {**{name: _build_preset(name) for name in self.PRESETS},
+                                 **self.custom_layouts}
         
-        return layouts
+        return dict(self._all_layouts)
     
     def save_layout(self, layout: LayoutConfig, as_custom: bool = True):
         """
@@ -191,12 +244,15 @@ class LayoutManager:
             as_custom: If True, save as custom layout
         """
         if as_custom:
-            # Save to file
-            file_path = self.config_dir / f"{layout.name.lower().replace(' ', '_')}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(layout.to_dict(), f, indent=2)
+            # Save to file: write a temp file then swap it in atomically,
+            # so a crash mid-write never leaves a truncated layout
+            file_path = self.config_dir / layout.filename
+            tmp_path = file_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(_json_dumps(layout.to_dict()))
+            os.replace(tmp_path, file_path)
             
             self.custom_layouts[layout.name] = layout
+            self._all_layouts = None
         
         # Save as last used
         self.save_last_layout(layout)
@@ -204,15 +260,46 @@ class LayoutManager:
     def load_custom_layouts(self):
         """Load all custom layouts from disk"""
         self.custom_layouts.clear()
+        self._custom_loaded = True
+        self._all_layouts = None
         
-        for file_path in self.config_dir.glob('*.json'):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    layout = LayoutConfig.from_dict(data)
-                    self.custom_layouts[layout.name] = layout
-            except Exception as e:
-                print(f"ERROR: Failed to load layout {file_path}: {e}")
+        # scandir reuses the directory entry type info instead of stat-ing each path
+        with os.scandir(self.config_dir) as it:
+            entries = [entry for entry in it
+                       if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)]
+        
+        paths = [entry.path for entry in entries]
+        if len(paths) < 4:
+            # Not worth a thread pool for a handful of files
+            layouts = map(self._parse_one, paths)
+        else:
+            # Overlap file reads; map() keeps the directory order
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                layouts = list(executor.map(self._parse_one, paths))
+        
+        for layout in layouts:
+            if layout is not None:
+                self.custom_layouts[layout.name] = layout
+    
+    @staticmethod
+    def _parse_one(path: str) -> Optional[LayoutConfig]:
+        """
+        Read one layout file
+        
+        Args:
+            path: Path of the JSON file
+            
+        Returns:
+            The layout, or None if the file could not be read
+        """
+        try:
+            # One read, then parse the whole buffer
+            with open(path, 'rb') as f:
+                data = _json_loads(f.read())
+            return LayoutConfig.from_dict(data)
+        except Exception as e:
+            logger.warning("Failed to load layout %s: %s", path, e)
+            return None
     
     def delete_layout(self, name: str) -> bool:
         """
@@ -224,41 +311,99 @@ class LayoutManager:
         Returns:
             True if deleted successfully
         """
+        self._ensure_custom_loaded()
         if name not in self.custom_layouts:
             return False
         
         # Delete file
-        file_path = self.config_dir / f"{name.lower().replace(' ', '_')}.json"
+        file_path = self.config_dir / self.custom_layouts[name].filename
         if file_path.exists():
             file_path.unlink()
         
         # Remove from memory
         del self.custom_layouts[name]
+        self._all_layouts = None
         return True
     
     def save_last_layout(self, layout: LayoutConfig):
-        """Save the last used layout"""
-        settings = QSettings('ChessAvatar', 'LayoutManager')
-        settings.setValue('last_layout', layout.to_dict())
+        """Save the last used layout (rapid successive calls are written once)"""
+        self._pending_last = layout.to_dict()
+        self._last_layout_cache = None
+        
+        app = QCoreApplication.instance()
+        if app is None:
+            # No event loop to run the timer: write right away
+            self._flush_last_layout()
+            return
+        
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(500)
+            self._save_timer.timeout.connect(self._flush_last_layout)
+        self._watch_quit(app)
+        self._save_timer.start()
+    
+    def _watch_quit(self, app: QCoreApplication):
+        """Persist anything still pending when the application quits"""
+        if not self._quit_hooked:
+            app.aboutToQuit.connect(self._on_about_to_quit)
+            self._quit_hooked = True
+    
+    def _on_about_to_quit(self):
+        """Write the current layout if it was applied without being saved"""
+        if self._dirty and self.current_layout:
+            self._dirty = False
+            self._pending_last = self.current_layout.to_dict()
+        self._flush_last_layout()
+    
+    def _flush_last_layout(self):
+        """Write the pending last layout to QSettings"""
+        if self._pending_last is None:
+            return
+        
+        self._settings.setValue('last_layout', self._pending_last)
+        self._settings.sync()
+        self._pending_last = None
     
     def load_last_layout(self) -> LayoutConfig:
         """Load the last used layout"""
-        settings = QSettings('ChessAvatar', 'LayoutManager')
-        data = settings.value('last_layout')
+        if self._last_layout_cache is not None:
+            return self._last_layout_cache
+        
+        if self._pending_last is not None:
+            data = self._pending_last
+        else:
+            data = self._settings.value('last_layout')
         
-        if data:
+        if data and _is_valid_layout_dict(data):
             try:
-                return LayoutConfig.from_dict(data)
+                self._last_layout_cache = LayoutConfig.from_dict(data)
+                return self._last_layout_cache
             except:
                 pass
         
-        # Return default
-        return self.get_preset('default')
+        # Return default, kept so a bad stored value is only handled once
+        self._last_layout_cache = self.get_preset('default')
+        return self._last_layout_cache
     
-    def apply_layout(self, layout: LayoutConfig):
-        """Set as current layout"""
+    def apply_layout(self, layout: LayoutConfig, persist: bool = False):
+        """
+        Set as current layout
+        
+        Args:
+            layout: Layout to apply
+            persist: If True, save it as last layout now; otherwise it is
+                only kept in memory and saved when the application quits
+        """
         self.current_layout = layout
-        self.save_last_layout(layout)
+        app = QCoreApplication.instance()
+        if persist or app is None:
+            self._dirty = False
+            self.save_last_layout(layout)
+        else:
+            self._dirty = True
+            self._watch_quit(app)
     
     def get_current_layout(self) -> LayoutConfig:
         """Get current layout"""
@@ -268,16 +413,14 @@ class LayoutManager:
     
     def export_layout(self, layout: LayoutConfig, file_path: Path):
         """Export layout to file"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(layout.to_dict(), f, indent=2)
+        file_path.write_bytes(_json_dumps(layout.to_dict()))
     
     def import_layout(self, file_path: Path) -> Optional[LayoutConfig]:
         """Import layout from file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return LayoutConfig.from_dict(data)
+            data = _json_loads(file_path.read_bytes())
+            return LayoutConfig.from_dict(data)
         except Exception as e:
-            print(f"ERROR: Failed to import layout: {e}")
+            logger.warning("Failed to import layout %s: %s", file_path, e)
             return None
 
@@ -1,33 +1,37 @@
 """
 Predefined layout presets for different use cases
 """
+from types import MappingProxyType
 from typing import Dict, Any
 
 
-class LayoutPresets:
-    """Predefined layout configurations"""
-    
-    @staticmethod
-    def get_preset(name: str) -> Dict[str, Any]:
-        """Get a preset layout by name"""
-        presets = {
-            "default": LayoutPresets.default_layout(),
-            "minimalist": LayoutPresets.minimalist_layout(),
-            "analysis": LayoutPresets.analysis_layout(),
-            "training": LayoutPresets.training_layout(),
-        }
-        return presets.get(name, LayoutPresets.default_layout())
-    
-    @staticmethod
-    def get_all_preset_names():
-        """Get all available preset names"""
-        return ["default", "minimalist", "analysis", "training"]
-    
-    @staticmethod
-    def default_layout() -> Dict[str, Any]:
-        """Default balanced layout"""
-        return {
-            "name": "Défaut",
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Single source of truth for the presets.
+# Top-level fields feed LayoutManager (LayoutConfig schema); the optional
+# 'main_window' entry holds the proportions applied by the main window menu.
+# Frozen all the way down, so the nested data can be shared without copies.
+PRESETS = _freeze({
+    'default': {
+        'name': 'Défaut',
+        'description': 'Layout standard avec tous les panels',
+        'splitter_sizes': [1200, 400],
+        'panels_visible': {
+            'engine': True,
+            'opening': True,
+            'notation': True,
+            'clock': True,
+            'avatar_status': True,
+            'game_controls': True,
+        },
+        'main_window': {
             "description": "Disposition équilibrée standard",
             "panels": {
                 "engine_panel": True,
@@ -41,33 +45,21 @@ class LayoutPresets:
                 "bottom": [50, 50],  # Engine vs Opening
                 "right": [30, 40, 30],  # Notation, Avatar, Stats
             }
-        }
-    
-    @staticmethod
-    def minimalist_layout() -> Dict[str, Any]:
-        """Minimalist layout - only board and essential info"""
-        return {
-            "name": "Minimaliste",
-            "description": "Échiquier au centre, interface épurée",
-            "panels": {
-                "engine_panel": False,
-                "opening_panel": False,
-                "notation_panel": True,
-                "avatar_panel": False,
-                "stats_panel": False,
-            },
-            "splitter_sizes": {
-                "main": [75, 25],  # More space for board
-                "bottom": [0, 0],
-                "right": [100, 0, 0],  # Only notation
-            }
-        }
-    
-    @staticmethod
-    def analysis_layout() -> Dict[str, Any]:
-        """Analysis layout - focus on engine and notation"""
-        return {
-            "name": "Analyse",
+        },
+    },
+    'analysis': {
+        'name': 'Analyse',
+        'description': 'Optimisé pour l\'analyse (engine et notation)',
+        'splitter_sizes': [1000, 600],
+        'panels_visible': {
+            'engine': True,
+            'opening': True,
+            'notation': True,
+            'clock': False,
+            'avatar_status': False,
+            'game_controls': True,
+        },
+        'main_window': {
             "description": "Optimisé pour l'analyse de parties",
             "panels": {
                 "engine_panel": True,
@@ -81,13 +73,49 @@ class LayoutPresets:
                 "bottom": [60, 40],  # More space for engine
                 "right": [40, 0, 60],  # Notation and Stats
             }
-        }
-    
-    @staticmethod
-    def training_layout() -> Dict[str, Any]:
-        """Training layout - focus on learning"""
-        return {
-            "name": "Entraînement",
+        },
+    },
+    'minimalist': {
+        'name': 'Minimaliste',
+        'description': 'Juste l\'échiquier et la notation',
+        'splitter_sizes': [1300, 300],
+        'panels_visible': {
+            'engine': False,
+            'opening': False,
+            'notation': True,
+            'clock': False,
+            'avatar_status': False,
+            'game_controls': True,
+        },
+        'main_window': {
+            "description": "Échiquier au centre, interface épurée",
+            "panels": {
+                "engine_panel": False,
+                "opening_panel": False,
+                "notation_panel": True,
+                "avatar_panel": False,
+                "stats_panel": False,
+            },
+            "splitter_sizes": {
+                "main": [75, 25],  # More space for board
+                "bottom": [0, 0],
+                "right": [100, 0, 0],  # Only notation
+            }
+        },
+    },
+    'training': {
+        'name': 'Entraînement',
+        'description': 'Focus sur l\'échiquier avec pendule',
+        'splitter_sizes': [1400, 200],
+        'panels_visible': {
+            'engine': False,
+            'opening': False,
+            'notation': True,
+            'clock': True,
+            'avatar_status': False,
+            'game_controls': True,
+        },
+        'main_window': {
             "description": "Optimisé pour l'apprentissage",
             "panels": {
                 "engine_panel": True,
@@ -101,5 +129,41 @@ class LayoutPresets:
                 "bottom": [50, 50],
                 "right": [25, 25, 50],  # More space for stats
             }
-        }
+        },
+    },
+    'tournament': {
+        'name': 'Tournoi',
+        'description': 'Comme en tournoi (pendule proéminente)',
+        'splitter_sizes': [1100, 500],
+        'panels_visible': {
+            'engine': False,
+            'opening': False,
+            'notation': True,
+            'clock': True,
+            'avatar_status': True,
+            'game_controls': True,
+        },
+    },
+})
+
 
+class LayoutPresets:
+    """Predefined layout configurations"""
+    
+    @staticmethod
+    def get_preset(name: str) -> Dict[str, Any]:
+        """Get a preset layout by name"""
+        if name not in LayoutPresets.get_all_preset_names():
+            name = "default"
+        return LayoutPresets._make(name)
+    
+    @staticmethod
+    def get_all_preset_names():
+        """Get all available preset names"""
+        return ["default", "minimalist", "analysis", "training"]
+    
+    @staticmethod
+    def _make(name: str) -> Dict[str, Any]:
+        """Build the main window view of a preset from the shared table"""
+        preset = PRESETS[name]
+        return {"name": preset['name'], **preset['main_window']}
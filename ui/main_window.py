@@ -3,31 +3,26 @@ Main window for ChessAvatar application
 """
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QSplitter, QMenuBar, QMenu, QMessageBox, QSizePolicy, 
-                             QFileDialog, QPushButton, QDialog, QDockWidget)
-from PyQt6.QtCore import Qt
+                             QFileDialog, QPushButton, QDialog, QDockWidget,
+                             QApplication, QInputDialog)
+from PyQt6.QtCore import Qt, QSettings, QTimer, pyqtSlot
 from PyQt6.QtGui import QAction, QIcon
+import logging
+from collections import OrderedDict
+from enum import IntEnum
 import chess
-import asyncio
 
 from ui.chessboard import ChessBoardWidget
 from ui.notation_panel import NotationPanel
 from ui.clock_widget import ClockWidget
 from ui.engine_panel import EnginePanel
-from ui.engine_config_dialog import EngineConfigDialog
-from ui.avatar_panel import AvatarPanel, AvatarStatusWidget
-from ui.avatar_creation_dialog import AvatarCreationDialog
-from ui.board_config_dialog import BoardConfigDialog, BoardConfig
-from ui.game_over_dialog import GameOverDialog
+from ui.avatar_panel import AvatarStatusWidget
+from ui.board_config_dialog import BoardConfig
 from ui.opening_panel import OpeningPanel  # NEW: Opening panel
-from ui.theme_config_dialog import ThemeConfigDialog  # NEW: Theme config
-from ui.new_game_dialog import NewGameDialog
 from ui.styles import get_main_stylesheet, get_button_style  # NEW: Enhanced styles
 from ui.resolution_manager import get_resolution_manager
 from ui.layout_presets import LayoutPresets  # NEW: Layout presets
-from ui.game_report_dialog import GameReportDialog  # NEW: Game report
-from ui.about_dialog import AboutDialog  # NEW: About dialog
 from ui.board_control_widget import BoardControlWidget  # NEW: Board controls
-from ui.chessmaster_theme_dialog import ChessmasterThemeDialog  # NEW: Chessmaster themes
 from core.game import ChessGame
 from core.engine_manager import EngineManager
 from core.avatar_manager import AvatarManager
@@ -35,6 +30,100 @@ from core.avatar_worker import AvatarEngineManager
 from core.sound_manager import get_sound_manager
 from core.pgn_manager import get_pgn_manager
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Dock areas, combined once
+ALL_DOCK_AREAS = (Qt.DockWidgetArea.LeftDockWidgetArea |
+                  Qt.DockWidgetArea.RightDockWidgetArea |
+                  Qt.DockWidgetArea.TopDockWidgetArea |
+                  Qt.DockWidgetArea.BottomDockWidgetArea)
+_NO_BOTTOM_DOCK_AREAS = ALL_DOCK_AREAS & ~Qt.DockWidgetArea.BottomDockWidgetArea
+_NO_TOP_DOCK_AREAS = ALL_DOCK_AREAS & ~Qt.DockWidgetArea.TopDockWidgetArea
+
+# Squares where a pawn move is a promotion
+PROMO_TO_MASK = chess.BB_RANK_1 | chess.BB_RANK_8
+
+# Engine replies remembered per (engine, position), least recently used dropped first
+ENGINE_MOVE_CACHE_SIZE = 4096
+
+class PlayMode(IntEnum):
+    """Play modes (NewGameDialog reports them by lower-case name)"""
+    FREE = 0
+    VS_ENGINE = 1
+    VS_AVATAR = 2
+    VS_HUMAN = 3
+    ENGINE_VS_ENGINE = 4
+    AVATAR_VS_AVATAR = 5
+    AVATAR_VS_ENGINE = 6
+    
+    @classmethod
+    def from_name(cls, name: str) -> "PlayMode":
+        """Get the mode from its NewGameDialog name (e.g. "vs_engine")"""
+        return cls[name.upper()]
+
+
+# Menu bar: (menu title, entries). An entry is (text, shortcut, handler name),
+# None for a separator, or the name of a method adding a submenu.
+MENU_SPEC = (
+    ("📋 Jeu", (
+        ("🎯 Nouvelle partie", "Ctrl+N", "new_game"),
+        None,
+        ("📂 Ouvrir PGN...", "Ctrl+O", "open_pgn"),
+        ("💾 Sauvegarder PGN...", "Ctrl+S", "save_pgn"),
+        None,
+        ("📋 Copier FEN", "Ctrl+Shift+C", "copy_fen"),
+        ("📋 Coller FEN", "Ctrl+Shift+V", "paste_fen"),
+        None,
+        ("🚪 Quitter", "Ctrl+Q", "close"),
+    )),
+    ("🎨 Apparence", (
+        ("🖌️ Thèmes et Pièces...", "Ctrl+T", "open_theme_config"),
+        ("🎨 Thèmes Chessmaster...", "Ctrl+Shift+T", "open_chessmaster_themes"),
+        None,
+        ("⚙️ Configuration de l'échiquier...", None, "open_board_config"),
+    )),
+    ("🖥️ Affichage", (
+        "_add_docks_submenu",
+        None,
+        ("↺ Réinitialiser la disposition", "Ctrl+Shift+R", "_reset_layout"),
+        ("💾 Sauvegarder la disposition", None, "_save_window_state"),
+    )),
+    ("📊 Analyse", (
+        ("↶ Annuler le coup", "Ctrl+Z", "undo_move"),
+        None,
+        ("📄 Rapport de partie...", "Ctrl+R", "show_game_report"),
+    )),
+    ("⚙️ Moteur", (
+        ("🔧 Configuration des moteurs...", None, "open_engine_config"),
+        None,
+        "_add_engine_select_submenu",
+    )),
+    ("🤖 Avatar", (
+        ("➕ Créer un Avatar IA...", "Ctrl+Shift+A", "create_avatar"),
+        ("📁 Gérer les Avatars...", None, "manage_avatars"),
+    )),
+    ("❓ Aide", (
+        ("ℹ️ À propos de ChessAvatar...", "F1", "show_about"),
+    )),
+)
+
+# Play modes where the opponent replies to each player move: mode -> slot name
+OPPONENT_SLOTS = {
+    PlayMode.VS_ENGINE: "_on_move_completed_for_engine",
+    PlayMode.VS_AVATAR: "_on_move_completed_for_avatar",
+}
+
+# "Panneaux" submenu: (dock attribute, toggle text)
+DOCK_MENU_SPEC = (
+    ("engine_dock", "⚙ Moteur d'Analyse"),
+    ("opening_dock", "📖 Ouverture"),
+    ("notation_dock", "📝 Notation"),
+    ("avatar_dock", "👤 Adversaire"),
+    ("clock_dock", "⏱ Pendule"),
+    ("controls_dock", "🎮 Contrôles"),
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window"""
@@ -53,35 +142,37 @@ class MainWindow(QMainWindow):
         self.avatar_id = None  # Store current avatar ID
         self.avatar2_id = None  # Store second avatar ID (for Avatar vs Avatar mode)
         self.avatar2_stockfish_config = None  # Store second avatar config
-        self._engine_auto_started = False  # Flag to ensure auto-start happens only once
         # Play vs engine mode
-        self.play_mode = "free"  # "free", "vs_engine", "vs_avatar", "vs_human", "engine_vs_engine", "avatar_vs_avatar", "avatar_vs_engine"
+        self._opponent_slot = None  # Slot replying to the player's moves
+        self.play_mode = PlayMode.FREE
         self.player_color = chess.WHITE  # Color of human player
         self.waiting_for_engine = False
+        self._engine_move_cache = OrderedDict()  # (engine name, EPD) -> move
+        self._pending_engine_key = None  # Cache key of the search in progress
         # Clock auto-start flag
         self.clock_started = False  # Flag pour savoir si la pendule a démarré
+        self.game_over_dialog = None  # GameOverDialog reused across games
+        self._new_game_dialog = None  # NewGameDialog reused across games
+        self._clipboard = QApplication.clipboard()  # Application-wide, fetched once
+        # Window state (native settings store) and its debounced autosave
+        self._settings = QSettings('ChessAvatar', 'MainWindow')
+        self._state_save_timer = QTimer(self)
+        self._state_save_timer.setSingleShot(True)
+        self._state_save_timer.setInterval(500)
+        self._state_save_timer.timeout.connect(self._write_window_state)
         self.setup_engine_signals()
         self.init_ui()
         # Theme is applied in init_ui() now
         self.apply_board_config()
+        # Auto-start the engine on the first event loop iteration
+        QTimer.singleShot(0, self._deferred_auto_start)
     
-    def showEvent(self, event):
-        """Called when window is shown - use to auto-start engine after Qt event loop is running"""
-        print("DEBUG: MainWindow.showEvent appelé")
-        super().showEvent(event)
-        # Auto-start engine on first show
-        if not self._engine_auto_started:
-            print("DEBUG: Premier showEvent, appel DIRECT de auto_start_engine")
-            self._engine_auto_started = True
-            # Call directly - the Qt event loop is running at this point
-            try:
-                self.auto_start_engine()
-            except Exception as e:
-                print(f"DEBUG: ERREUR dans auto_start_engine: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print("DEBUG: showEvent suivant, auto_start déjà fait")
+    def _deferred_auto_start(self):
+        """Auto-start the engine once the Qt event loop is running"""
+        try:
+            self.auto_start_engine()
+        except Exception:
+            logger.exception("Erreur dans auto_start_engine")
         
     def init_ui(self):
         """Initialize the user interface with dockable panels"""
@@ -126,40 +217,33 @@ class MainWindow(QMainWindow):
         
         # Restore last window state (docks positions, sizes, etc.)
         self._restore_window_state()
+        
+        # Autosave once docks stop moving (connected after the restore)
+        for dock in self.findChildren(QDockWidget):
+            dock.dockLocationChanged.connect(self._state_save_timer.start)
     
     def _create_dock_widgets(self):
         """Create all dockable panels"""
+        # Docks whose inner panel is only built when first needed
+        self._lazy_panels = {}
+        # Engine status shown by the engine panel: (panel method, arguments)
+        self._engine_status = ("clear_engine_status", ())
         
         # ===== ENGINE PANEL (Bottom) =====
         self.engine_dock = QDockWidget("⚙ Moteur d'Analyse", self)
         self.engine_dock.setObjectName("EngineDock")
-        self.engine_dock.setAllowedAreas(
-            Qt.DockWidgetArea.BottomDockWidgetArea | 
-            Qt.DockWidgetArea.TopDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.RightDockWidgetArea
-        )
+        self.engine_dock.setAllowedAreas(ALL_DOCK_AREAS)
         
-        self.engine_panel = EnginePanel()
-        self.engine_panel.start_analysis.connect(self.on_engine_start_analysis)
-        self.engine_panel.stop_analysis.connect(self.on_engine_stop_analysis)
-        self.engine_panel.option_changed.connect(self.on_engine_option_changed)
-        self.engine_dock.setWidget(self.engine_panel)
+        self._add_lazy_panel(self.engine_dock, '_engine_panel', self._build_engine_panel)
         
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.engine_dock)
         
         # ===== OPENING PANEL (Bottom, separate - NO TAB) =====
         self.opening_dock = QDockWidget("📖 Ouverture", self)
         self.opening_dock.setObjectName("OpeningDock")
-        self.opening_dock.setAllowedAreas(
-            Qt.DockWidgetArea.BottomDockWidgetArea | 
-            Qt.DockWidgetArea.TopDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.RightDockWidgetArea
-        )
+        self.opening_dock.setAllowedAreas(ALL_DOCK_AREAS)
         
-        self.opening_panel = OpeningPanel()
-        self.opening_dock.setWidget(self.opening_panel)
+        self._add_lazy_panel(self.opening_dock, '_opening_panel', self._build_opening_panel)
         
         self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.opening_dock)
         # Split them horizontally (side by side, not tabbed)
@@ -168,12 +252,7 @@ class MainWindow(QMainWindow):
         # ===== NOTATION PANEL (Right) =====
         self.notation_dock = QDockWidget("📝 Notation", self)
         self.notation_dock.setObjectName("NotationDock")
-        self.notation_dock.setAllowedAreas(
-            Qt.DockWidgetArea.RightDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.BottomDockWidgetArea |
-            Qt.DockWidgetArea.TopDockWidgetArea
-        )
+        self.notation_dock.setAllowedAreas(ALL_DOCK_AREAS)
         
         self.notation_panel = NotationPanel()
         self.notation_panel.move_selected.connect(self.on_navigate_to_move)
@@ -184,15 +263,9 @@ class MainWindow(QMainWindow):
         # ===== AVATAR STATUS (Right, above notation) =====
         self.avatar_dock = QDockWidget("👤 Adversaire", self)
         self.avatar_dock.setObjectName("AvatarDock")
-        self.avatar_dock.setAllowedAreas(
-            Qt.DockWidgetArea.RightDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.TopDockWidgetArea
-        )
+        self.avatar_dock.setAllowedAreas(_NO_BOTTOM_DOCK_AREAS)
         
-        self.avatar_status = AvatarStatusWidget()
-        self.avatar_status.change_avatar_clicked.connect(self.manage_avatars)
-        self.avatar_dock.setWidget(self.avatar_status)
+        self._add_lazy_panel(self.avatar_dock, '_avatar_status', self._build_avatar_status)
         
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.avatar_dock)
         # Split vertically to stack them
@@ -201,12 +274,7 @@ class MainWindow(QMainWindow):
         # ===== CLOCK WIDGET (Right, below notation) =====
         self.clock_dock = QDockWidget("⏱ Pendule", self)
         self.clock_dock.setObjectName("ClockDock")
-        self.clock_dock.setAllowedAreas(
-            Qt.DockWidgetArea.RightDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.TopDockWidgetArea |
-            Qt.DockWidgetArea.BottomDockWidgetArea
-        )
+        self.clock_dock.setAllowedAreas(ALL_DOCK_AREAS)
         
         self.clock_widget = ClockWidget()
         self.clock_widget.time_expired.connect(self.on_time_expired)
@@ -219,11 +287,7 @@ class MainWindow(QMainWindow):
         # ===== GAME CONTROLS (Right, bottom) =====
         self.controls_dock = QDockWidget("🎮 Contrôles", self)
         self.controls_dock.setObjectName("ControlsDock")
-        self.controls_dock.setAllowedAreas(
-            Qt.DockWidgetArea.RightDockWidgetArea |
-            Qt.DockWidgetArea.LeftDockWidgetArea |
-            Qt.DockWidgetArea.BottomDockWidgetArea
-        )
+        self.controls_dock.setAllowedAreas(_NO_TOP_DOCK_AREAS)
         
         game_controls_widget = QWidget()
         game_controls_layout = QHBoxLayout(game_controls_widget)
@@ -271,165 +335,124 @@ class MainWindow(QMainWindow):
         
         # Set initial sizes using resizeDocks (Qt 5.6+)
         # Make all panels visible with reasonable proportions
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(100, self._set_initial_dock_sizes)
         
-    def create_menu_bar(self):
-        """Create the application menu bar"""
-        menubar = self.menuBar()
-        
-        # Jeu menu (simplifié, pas de redondances avec les boutons)
-        game_menu = menubar.addMenu("📋 Jeu")
-        
-        new_game_action = QAction("🎯 Nouvelle partie", self)
-        new_game_action.setShortcut("Ctrl+N")
-        new_game_action.triggered.connect(self.new_game)
-        game_menu.addAction(new_game_action)
-        
-        game_menu.addSeparator()
-        
-        open_pgn_action = QAction("📂 Ouvrir PGN...", self)
-        open_pgn_action.setShortcut("Ctrl+O")
-        open_pgn_action.triggered.connect(self.open_pgn)
-        game_menu.addAction(open_pgn_action)
-        
-        save_pgn_action = QAction("💾 Sauvegarder PGN...", self)
-        save_pgn_action.setShortcut("Ctrl+S")
-        save_pgn_action.triggered.connect(self.save_pgn)
-        game_menu.addAction(save_pgn_action)
-        
-        game_menu.addSeparator()
-        
-        copy_fen_action = QAction("📋 Copier FEN", self)
-        copy_fen_action.setShortcut("Ctrl+Shift+C")
-        copy_fen_action.triggered.connect(self.copy_fen)
-        game_menu.addAction(copy_fen_action)
-        
-        paste_fen_action = QAction("📋 Coller FEN", self)
-        paste_fen_action.setShortcut("Ctrl+Shift+V")
-        paste_fen_action.triggered.connect(self.paste_fen)
-        game_menu.addAction(paste_fen_action)
-        
-        game_menu.addSeparator()
-        
-        quit_action = QAction("🚪 Quitter", self)
-        quit_action.setShortcut("Ctrl+Q")
-        quit_action.triggered.connect(self.close)
-        game_menu.addAction(quit_action)
-        
-        # Apparence menu
-        appearance_menu = menubar.addMenu("🎨 Apparence")
-        
-        theme_config_action = QAction("🖌️ Thèmes et Pièces...", self)
-        theme_config_action.setShortcut("Ctrl+T")
-        theme_config_action.triggered.connect(self.open_theme_config)
-        appearance_menu.addAction(theme_config_action)
-        
-        # NEW: Chessmaster themes
-        chessmaster_themes_action = QAction("🎨 Thèmes Chessmaster...", self)
-        chessmaster_themes_action.setShortcut("Ctrl+Shift+T")
-        chessmaster_themes_action.triggered.connect(self.open_chessmaster_themes)
-        appearance_menu.addAction(chessmaster_themes_action)
+    def _add_lazy_panel(self, dock: QDockWidget, attr: str, builder):
+        """
+        Give a dock an empty placeholder and build its panel on first show
         
-        appearance_menu.addSeparator()
+        Args:
+            dock: Dock widget that will host the panel
+            attr: Attribute holding the panel once built (None until then)
+            builder: Callable creating and wiring the panel
+        """
+        setattr(self, attr, None)
+        self._lazy_panels[dock] = (attr, builder)
+        dock.setWidget(QWidget())
+        dock.visibilityChanged.connect(
+            lambda visible, d=dock: visible and self._ensure_dock_panel(d))
+        
+    def _ensure_dock_panel(self, dock: QDockWidget):
+        """Get the panel of a lazy dock, building it if needed"""
+        attr, builder = self._lazy_panels[dock]
+        panel = getattr(self, attr)
+        if panel is None:
+            panel = builder()
+            setattr(self, attr, panel)
+            placeholder = dock.widget()
+            dock.setWidget(panel)
+            placeholder.deleteLater()
+        return panel
+        
+    def _build_engine_panel(self) -> EnginePanel:
+        """Create the engine analysis panel"""
+        panel = EnginePanel()
+        panel.start_analysis.connect(self.on_engine_start_analysis)
+        panel.stop_analysis.connect(self.on_engine_stop_analysis)
+        panel.option_changed.connect(self.on_engine_option_changed)
+        self._apply_engine_status(panel)
+        return panel
+        
+    def _set_engine_status(self, method: str, *args):
+        """
+        Remember the engine status and show it if the engine panel exists
         
-        board_config_action = QAction("⚙️ Configuration de l'échiquier...", self)
-        board_config_action.triggered.connect(self.open_board_config)
-        appearance_menu.addAction(board_config_action)
+        Args:
+            method: EnginePanel method showing the status
+            *args: Arguments of that method
+        """
+        self._engine_status = (method, args)
+        if self._engine_panel is not None:
+            self._apply_engine_status(self._engine_panel)
+        
+    def _apply_engine_status(self, panel: EnginePanel):
+        """Show the remembered engine status in the engine panel"""
+        method, args = self._engine_status
+        getattr(panel, method)(*args)
+        
+    def _build_opening_panel(self) -> OpeningPanel:
+        """Create the opening panel, synced with the current position"""
+        panel = OpeningPanel()
+        panel.update_opening(self.game.board)
+        return panel
+        
+    def _build_avatar_status(self) -> AvatarStatusWidget:
+        """Create the opponent status widget"""
+        panel = AvatarStatusWidget()
+        panel.change_avatar_clicked.connect(self.manage_avatars)
+        return panel
+        
+    @property
+    def engine_panel(self) -> EnginePanel:
+        """Engine analysis panel, built on first access"""
+        return self._ensure_dock_panel(self.engine_dock)
+        
+    @property
+    def opening_panel(self) -> OpeningPanel:
+        """Opening panel, built on first access"""
+        return self._ensure_dock_panel(self.opening_dock)
+        
+    @property
+    def avatar_status(self) -> AvatarStatusWidget:
+        """Opponent status widget, built on first access"""
+        return self._ensure_dock_panel(self.avatar_dock)
         
-        # NEW: Affichage menu with layout presets and dock toggles
-        display_menu = menubar.addMenu("🖥️ Affichage")
+    def create_menu_bar(self):
+        """Create the application menu bar from MENU_SPEC"""
+        menubar = self.menuBar()
         
-        # Dock visibility toggles
+        for title, entries in MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                elif isinstance(entry, str):
+                    # Submenu built by a dedicated method
+                    getattr(self, entry)(menu)
+                else:
+                    text, shortcut, handler = entry
+                    action = QAction(text, self)
+                    if shortcut:
+                        action.setShortcut(shortcut)
+                    action.triggered.connect(getattr(self, handler))
+                    menu.addAction(action)
+        
+    def _add_docks_submenu(self, menu: QMenu):
+        """Add the dock visibility toggles (self.<dock>_action) to a menu"""
         docks_submenu = QMenu("📐 Panneaux", self)
-        
-        self.engine_dock_action = self.engine_dock.toggleViewAction()
-        self.engine_dock_action.setText("⚙ Moteur d'Analyse")
-        docks_submenu.addAction(self.engine_dock_action)
-        
-        self.opening_dock_action = self.opening_dock.toggleViewAction()
-        self.opening_dock_action.setText("📖 Ouverture")
-        docks_submenu.addAction(self.opening_dock_action)
-        
-        self.notation_dock_action = self.notation_dock.toggleViewAction()
-        self.notation_dock_action.setText("📝 Notation")
-        docks_submenu.addAction(self.notation_dock_action)
-        
-        self.avatar_dock_action = self.avatar_dock.toggleViewAction()
-        self.avatar_dock_action.setText("👤 Adversaire")
-        docks_submenu.addAction(self.avatar_dock_action)
-        
-        self.clock_dock_action = self.clock_dock.toggleViewAction()
-        self.clock_dock_action.setText("⏱ Pendule")
-        docks_submenu.addAction(self.clock_dock_action)
-        
-        self.controls_dock_action = self.controls_dock.toggleViewAction()
-        self.controls_dock_action.setText("🎮 Contrôles")
-        docks_submenu.addAction(self.controls_dock_action)
-        
-        display_menu.addMenu(docks_submenu)
-        display_menu.addSeparator()
-        
-        # Layout reset
-        reset_layout_action = QAction("↺ Réinitialiser la disposition", self)
-        reset_layout_action.setShortcut("Ctrl+Shift+R")
-        reset_layout_action.triggered.connect(self._reset_layout)
-        display_menu.addAction(reset_layout_action)
-        
-        save_layout_action = QAction("💾 Sauvegarder la disposition", self)
-        save_layout_action.triggered.connect(self._save_window_state)
-        display_menu.addAction(save_layout_action)
-        
-        # Analyse menu (simplifié)
-        analysis_menu = menubar.addMenu("📊 Analyse")
-        
-        undo_action = QAction("↶ Annuler le coup", self)
-        undo_action.setShortcut("Ctrl+Z")
-        undo_action.triggered.connect(self.undo_move)
-        analysis_menu.addAction(undo_action)
-        
-        analysis_menu.addSeparator()
-        
-        # NEW: Game report
-        game_report_action = QAction("📄 Rapport de partie...", self)
-        game_report_action.setShortcut("Ctrl+R")
-        game_report_action.triggered.connect(self.show_game_report)
-        analysis_menu.addAction(game_report_action)
-        
-        # Moteur menu
-        engine_menu = menubar.addMenu("⚙️ Moteur")
-        
-        engine_settings_action = QAction("🔧 Configuration des moteurs...", self)
-        engine_settings_action.triggered.connect(self.open_engine_config)
-        engine_menu.addAction(engine_settings_action)
-        
-        engine_menu.addSeparator()
-        
-        # Submenu for selecting engine
+        for dock_attr, text in DOCK_MENU_SPEC:
+            action = getattr(self, dock_attr).toggleViewAction()
+            action.setText(text)
+            setattr(self, f"{dock_attr}_action", action)
+            docks_submenu.addAction(action)
+        menu.addMenu(docks_submenu)
+        
+    def _add_engine_select_submenu(self, menu: QMenu):
+        """Add the engine selection submenu to a menu"""
         self.select_engine_menu = QMenu("🎯 Sélectionner le moteur", self)
-        engine_menu.addMenu(self.select_engine_menu)
+        menu.addMenu(self.select_engine_menu)
         self.update_engine_menu()
         
-        # Avatar menu
-        avatar_menu = menubar.addMenu("🤖 Avatar")
-        
-        create_avatar_action = QAction("➕ Créer un Avatar IA...", self)
-        create_avatar_action.setShortcut("Ctrl+Shift+A")
-        create_avatar_action.triggered.connect(self.create_avatar)
-        avatar_menu.addAction(create_avatar_action)
-        
-        manage_avatars_action = QAction("📁 Gérer les Avatars...", self)
-        manage_avatars_action.triggered.connect(self.manage_avatars)
-        avatar_menu.addAction(manage_avatars_action)
-        
-        # NEW: Help/About menu
-        help_menu = menubar.addMenu("❓ Aide")
-        
-        about_action = QAction("ℹ️ À propos de ChessAvatar...", self)
-        about_action.setShortcut("F1")
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
-        
     def setup_engine_signals(self):
         """Setup engine manager signals"""
         self.engine_manager.engine_started.connect(self.on_engine_started)
@@ -446,96 +469,86 @@ class MainWindow(QMainWindow):
     
     def auto_start_engine(self):
         """Automatically start the first available engine at startup"""
-        print("DEBUG: auto_start_engine VRAIMENT appele")
-        print("DEBUG: auto_start_engine appelé")
+        logger.debug("auto_start_engine appelé")
         engines = self.engine_manager.get_engines()
-        print(f"DEBUG: Moteurs trouvés: {len(engines)}")
+        logger.debug("Moteurs trouvés: %s", len(engines))
         
         if engines:
             # Start the first engine automatically
-            print(f"DEBUG: Démarrage du moteur {engines[0].name}")
+            logger.debug("Démarrage du moteur %s", engines[0].name)
             self.start_engine(engines[0].name)
         else:
             # Show helpful message
-            print("DEBUG: Aucun moteur trouvé")
-            self.engine_panel.set_engine_status("Non configuré")
-            self.engine_panel.engine_status.setStyleSheet("color: #ff6b6b; font-size: 9pt;")
+            logger.debug("Aucun moteur trouvé")
+            self._set_engine_status("set_engine_not_configured")
             self.statusBar().showMessage(
                 "💡 Configurez un moteur: Menu → Moteur → Configuration des moteurs", 
                 10000
             )
         
+    @pyqtSlot(int, int)
     def on_move_made(self, from_square: int, to_square: int):
         """Handle move made on the board"""
-        # Check if it's player's turn when playing vs engine
-        if self.play_mode == "vs_engine":
-            if self.waiting_for_engine:
-                self.statusBar().showMessage("Attendez que le moteur joue!", 2000)
-                self.chessboard.set_board(self.game.board)
-                return
-            # Check if it's the player's turn
-            if self.game.board.turn != self.player_color:
-                # Cancel the move
-                self.chessboard.set_board(self.game.board)
-                self.statusBar().showMessage("Ce n'est pas votre tour !", 2000)
-                return
-        
-        # Check if it's player's turn when playing vs avatar
-        if self.play_mode == "vs_avatar":
-            # Check if it's the player's turn
-            if self.game.board.turn != self.player_color:
+        # Against an engine or avatar, the player only moves on their own turn
+        if self.play_mode in OPPONENT_SLOTS:
+            if self.play_mode == PlayMode.VS_ENGINE and self.waiting_for_engine:
+                refusal = "Attendez que le moteur joue!"
+            elif self.game.board.turn != self.player_color:
+                refusal = "Ce n'est pas votre tour !"
+            else:
+                refusal = None
+            if refusal:
                 # Cancel the move
-                self.chessboard.set_board(self.game.board)
-                self.statusBar().showMessage("Ce n'est pas votre tour !", 2000)
+                self.chessboard.reject_last_drag()
+                self.statusBar().showMessage(refusal, 2000)
                 return
         
         # Create move
         move = chess.Move(from_square, to_square)
         
-        # Check if it's a pawn promotion
-        piece = self.game.board.piece_at(from_square)
-        if piece and piece.piece_type == chess.PAWN:
-            if chess.square_rank(to_square) in [0, 7]:
-                move = chess.Move(from_square, to_square, chess.QUEEN)
+        # Check if it's a pawn promotion (pawn landing on the first or last rank)
+        if (self.game.board.pawns & chess.BB_SQUARES[from_square]
+                and chess.BB_SQUARES[to_square] & PROMO_TO_MASK):
+            move = chess.Move(from_square, to_square, chess.QUEEN)
+        
+        # Capture/castling must be read from the position before the move
+        is_capture = self.game.board.is_capture(move)
+        is_castling = self.game.board.is_castling(move)
         
         # Make the move
         if self.game.make_move(move):
+            # Position state after the move, computed once
+            in_check = self.game.board.is_check()
+            game_over = self.game.board.is_game_over()
+            
             # Auto-start clock after first White move
             if not self.clock_started and len(self.game.board.move_stack) == 1:
-                print("DEBUG: Premier coup des Blancs - démarrage de la pendule")
+                logger.debug("Premier coup des Blancs - démarrage de la pendule")
                 self.clock_widget.start()
                 self.clock_started = True
             
-            # Switch clock if active
-            if self.clock_widget.timer.isActive():
-                self.clock_widget.switch_clock()
-            
             # Update notation panel
-            pgn_text = self.game.get_pgn_moves()
-            self.notation_panel.update_moves(pgn_text)
+            self.append_last_move_to_notation()
             
             # Play appropriate sound
-            if self.game.board.is_capture(move):
+            if is_capture:
                 self.sound_manager.play_capture()
-            elif self.game.board.is_castling(move):
+            elif is_castling:
                 self.sound_manager.play_castle()
-            elif self.game.board.is_check():
+            elif in_check:
                 self.sound_manager.play_check()
             else:
                 self.sound_manager.play_move()
             
-            # Update the board display
-            self.chessboard.set_board(self.game.board)
+            # Update the board display (only the squares the move touched)
+            self.chessboard.apply_move(self.game.board, move)
             
-            # NEW: Update opening panel
-            self.opening_panel.update_opening(self.game.board)
-            
-            # Update notation
-            pgn_text = self.game.get_pgn_moves()
-            self.notation_panel.update_moves(pgn_text)
+            # NEW: Update opening panel (synced on creation if not built yet)
+            if self._opening_panel is not None:
+                self._opening_panel.update_opening(self.game.board)
             
             # Update status bar
-            if self.game.is_game_over():
+            if game_over:
                 result = self.game.get_result()
                 reason = self.get_game_over_reason()
                 self.statusBar().showMessage(f"Partie terminée - {result}")
@@ -548,35 +561,72 @@ class MainWindow(QMainWindow):
                 if self.playing_vs_avatar:
                     self.playing_vs_avatar = False
                 # Stop vs engine game
-                if self.play_mode == "vs_engine":
-                    self.play_mode = "free"
+                if self.play_mode == PlayMode.VS_ENGINE:
+                    self.play_mode = PlayMode.FREE
                     self.waiting_for_engine = False
                 # Show game over dialog
                 self.show_game_over_dialog(result, reason)
             else:
-                # Check if king is in check
-                if self.game.board.is_check():
-                    self.sound_manager.play_check()
-                
-                turn = "Trait aux blancs" if self.game.board.turn == chess.WHITE else "Trait aux noirs"
-                self.statusBar().showMessage(turn)
-                
                 # Auto-analyze if engine is running
-                if self.engine_manager.is_engine_running() and self.engine_panel.is_analyzing:
+                if (self._engine_panel is not None and self._engine_panel.is_analyzing
+                        and self.engine_manager.is_engine_running()):
                     self.request_analysis()
                 
-                # Trigger engine move if playing vs engine
-                if self.play_mode == "vs_engine" and not self.game.board.is_game_over():
-                    self.request_engine_move()
-                
-                # Trigger avatar move if playing vs avatar
-                if self.play_mode == "vs_avatar" and not self.game.board.is_game_over():
-                    self.request_avatar_move()
+                # The opponent (if any) replies through game.move_completed
+                # after this handler returns and posts its own status message
+                if self._opponent_slot is None:
+                    status_msg = "Trait aux blancs" if self.game.board.turn == chess.WHITE else "Trait aux noirs"
+                    self.statusBar().showMessage(status_msg)
                 
             # Switch clock
             if self.clock_widget.timer.isActive():
                 self.clock_widget.switch_clock()
                 
+    @property
+    def play_mode(self) -> PlayMode:
+        """Current play mode"""
+        return self._play_mode
+        
+    @play_mode.setter
+    def play_mode(self, mode: PlayMode):
+        """Set the play mode, wiring the opponent that replies to the player's moves"""
+        self._play_mode = mode
+        slot_name = OPPONENT_SLOTS.get(mode)
+        slot = getattr(self, slot_name) if slot_name else None
+        if slot != self._opponent_slot:
+            if self._opponent_slot is not None:
+                self.game.move_completed.disconnect(self._opponent_slot)
+            if slot is not None:
+                # Queued: the reply is requested once on_move_made has updated
+                # the UI and started any analysis (which would otherwise cancel
+                # the engine's search)
+                self.game.move_completed.connect(slot, Qt.ConnectionType.QueuedConnection)
+            self._opponent_slot = slot
+        
+    @pyqtSlot(object, bool)
+    def _on_move_completed_for_engine(self, move, game_over: bool):
+        """Ask the engine to reply once the player has moved"""
+        if not game_over and self.game.board.turn != self.player_color:
+            self.request_engine_move()
+        
+    @pyqtSlot(object, bool)
+    def _on_move_completed_for_avatar(self, move, game_over: bool):
+        """Ask the avatar to reply once the player has moved"""
+        if not game_over and self.game.board.turn != self.player_color:
+            self.request_avatar_move()
+        
+    def append_last_move_to_notation(self):
+        """Append the move just played to the notation panel"""
+        ply = len(self.game.move_history)
+        if len(self.notation_panel.moves_list) != ply - 1:
+            # Panel out of sync (undo, import...): rebuild it entirely
+            self.notation_panel.update_moves(self.game.get_pgn_moves())
+            return
+        # The side to move is now the opponent of the side that just played
+        self.notation_panel.append_move(self.game.last_san(), (ply + 1) // 2,
+                                        not self.game.board.turn)
+        
+    @pyqtSlot()
     def new_game(self):
         """Start a new game"""
         # Get list of available avatars for dialog
@@ -586,14 +636,20 @@ class MainWindow(QMainWindow):
         # Get list of engines
         engines = self.engine_manager.get_engines()
         
-        # Show configuration dialog
-        dialog = NewGameDialog(
-            engine_available=self.engine_manager.is_engine_running(),
-            avatar_available=avatar_available,
-            avatars=avatars,  # Pass avatar list
-            engines=engines,  # Pass engine list
-            parent=self
-        )
+        # Show configuration dialog (built once, refreshed on later games)
+        engine_available = self.engine_manager.is_engine_running()
+        if self._new_game_dialog is None:
+            from ui.new_game_dialog import NewGameDialog
+            self._new_game_dialog = NewGameDialog(
+                engine_available=engine_available,
+                avatar_available=avatar_available,
+                avatars=avatars,  # Pass avatar list
+                engines=engines,  # Pass engine list
+                parent=self
+            )
+        else:
+            self._new_game_dialog.refresh(engine_available, avatar_available, avatars, engines)
+        dialog = self._new_game_dialog
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             config = dialog.get_config()
@@ -609,16 +665,18 @@ class MainWindow(QMainWindow):
             self.notation_panel.set_game_info("Nouvelle partie")
             self.clock_widget.reset()
             self.clock_started = False  # Reset clock flag
-            self.engine_panel.reset_analysis()
+            if self._engine_panel is not None:
+                self._engine_panel.reset_analysis()
             
             # Apply time control if changed
             if config['time_control']:
                 self.clock_widget.time_control_combo.setCurrentText(config['time_control'])
             
             # Configure mode
-            if config['mode'] == "vs_engine":
+            mode = PlayMode.from_name(config['mode'])
+            if mode == PlayMode.VS_ENGINE:
                 self.player_color = config['player_color']
-                self.play_mode = "vs_engine"
+                self.play_mode = PlayMode.VS_ENGINE
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = False
                 
@@ -630,14 +688,11 @@ class MainWindow(QMainWindow):
                 if selected_engine:
                     current_engine = self.engine_manager.get_active_engine_name()
                     if current_engine != selected_engine:
-                        print(f"DEBUG: Changement de moteur vers {selected_engine}")
+                        logger.debug("Changement de moteur vers %s", selected_engine)
                         self.start_engine(selected_engine)
                 
                 # Flip board if playing as Black
-                if self.player_color == chess.BLACK and not self.chessboard.flipped:
-                    self.chessboard.flip_board()
-                elif self.player_color == chess.WHITE and self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(self.player_color == chess.WHITE)
                 
                 # If Black, engine plays first
                 if self.player_color == chess.BLACK:
@@ -650,7 +705,7 @@ class MainWindow(QMainWindow):
                         f"Nouvelle partie contre le moteur - Vous jouez les Blancs",
                         5000
                     )
-            elif config['mode'] == "vs_avatar":
+            elif mode == PlayMode.VS_AVATAR:
                 # Avatar mode
                 avatar_id = config.get('avatar_id')
                 if not avatar_id:
@@ -658,7 +713,7 @@ class MainWindow(QMainWindow):
                     return
                 
                 self.player_color = config['player_color']
-                self.play_mode = "vs_avatar"
+                self.play_mode = PlayMode.VS_AVATAR
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = True
                 self.avatar_id = avatar_id
@@ -679,7 +734,6 @@ class MainWindow(QMainWindow):
                     return
                 
                 # Get Stockfish path
-                engines = self.engine_manager.get_engines()
                 stockfish = next((e for e in engines if 'stockfish' in e.name.lower()), None)
                 
                 if not stockfish:
@@ -692,20 +746,16 @@ class MainWindow(QMainWindow):
                     return
                 
                 # Start avatar engine
-                print(f"DEBUG: Démarrage de l'avatar {avatar.display_name}")
+                logger.debug("Démarrage de l'avatar %s", avatar.display_name)
                 self.avatar_engine_manager.start_avatar(avatar_id, stockfish.path, player_style)
                 
                 # Flip board if playing as Black
-                if self.player_color == chess.BLACK and not self.chessboard.flipped:
-                    self.chessboard.flip_board()
-                elif self.player_color == chess.WHITE and self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(self.player_color == chess.WHITE)
                 
                 # If Black, avatar plays first
                 if self.player_color == chess.BLACK:
                     self.chessboard.setEnabled(False)
                     # Request avatar move after a short delay (wait for engine to start)
-                    from PyQt6.QtCore import QTimer
                     QTimer.singleShot(1000, lambda: self.request_avatar_move())
                     self.statusBar().showMessage(f"Nouvelle partie contre {avatar.display_name} - L'avatar réfléchit...", 5000)
                 else:
@@ -714,9 +764,9 @@ class MainWindow(QMainWindow):
                         f"Nouvelle partie contre {avatar.display_name} - Vous jouez les Blancs",
                         5000
                     )
-            elif config['mode'] == "engine_vs_engine":
+            elif mode == PlayMode.ENGINE_VS_ENGINE:
                 # Engine vs Engine mode
-                self.play_mode = "engine_vs_engine"
+                self.play_mode = PlayMode.ENGINE_VS_ENGINE
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = False
                 self.chessboard.setEnabled(False)  # Disable user input
@@ -725,16 +775,14 @@ class MainWindow(QMainWindow):
                 self.avatar_status.clear()
                 
                 # Reset board orientation
-                if self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(white_at_bottom=True)
                 
                 self.statusBar().showMessage("⚔️ Moteur vs Moteur - Observation", 3000)
                 
                 # Start with White (engine) making first move
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(1000, lambda: self.auto_play_engine_move())
                 
-            elif config['mode'] == "avatar_vs_avatar":
+            elif mode == PlayMode.AVATAR_VS_AVATAR:
                 # Avatar vs Avatar mode
                 avatar_id = config.get('avatar_id')
                 avatar2_id = config.get('avatar2_id')
@@ -755,7 +803,7 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "Erreur", "Avatar introuvable")
                     return
                 
-                self.play_mode = "avatar_vs_avatar"
+                self.play_mode = PlayMode.AVATAR_VS_AVATAR
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = True
                 self.chessboard.setEnabled(False)  # Disable user input
@@ -764,7 +812,6 @@ class MainWindow(QMainWindow):
                 
                 # Start both avatars
                 # Get Stockfish path
-                engines = self.engine_manager.get_engines()
                 if not engines:
                     QMessageBox.warning(self, "Erreur", "Aucun moteur configuré")
                     return
@@ -781,8 +828,7 @@ class MainWindow(QMainWindow):
                 self.avatar_status.setText(f"⚔️ {avatar1.display_name} (Blancs) vs {avatar2.display_name} (Noirs)")
                 
                 # Reset board
-                if self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(white_at_bottom=True)
                 
                 self.statusBar().showMessage(
                     f"👥 {avatar1.display_name} vs {avatar2.display_name} - Observation",
@@ -790,10 +836,9 @@ class MainWindow(QMainWindow):
                 )
                 
                 # Avatar 1 (White) plays first
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(1500, lambda: self.auto_play_avatar_move())
                 
-            elif config['mode'] == "avatar_vs_engine":
+            elif mode == PlayMode.AVATAR_VS_ENGINE:
                 # Avatar vs Engine mode
                 avatar_id = config.get('avatar_id')
                 
@@ -807,14 +852,13 @@ class MainWindow(QMainWindow):
                     QMessageBox.warning(self, "Erreur", "Avatar introuvable")
                     return
                 
-                self.play_mode = "avatar_vs_engine"
+                self.play_mode = PlayMode.AVATAR_VS_ENGINE
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = True
                 self.chessboard.setEnabled(False)  # Disable user input
                 self.avatar_id = avatar_id
                 
                 # Get Stockfish path
-                engines = self.engine_manager.get_engines()
                 if not engines:
                     QMessageBox.warning(self, "Erreur", "Aucun moteur configuré")
                     return
@@ -828,8 +872,7 @@ class MainWindow(QMainWindow):
                 self.avatar_status.setText(f"🤖 {avatar.display_name} (Avatar) vs Moteur")
                 
                 # Reset board
-                if self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(white_at_bottom=True)
                 
                 self.statusBar().showMessage(
                     f"🤖 {avatar.display_name} vs Moteur - Observation",
@@ -837,12 +880,11 @@ class MainWindow(QMainWindow):
                 )
                 
                 # Avatar (White) plays first
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(1500, lambda: self.request_avatar_move())
                 
             else:
                 # Free mode or Human vs Human mode
-                self.play_mode = config['mode']  # Can be "free" or "vs_human"
+                self.play_mode = mode  # FREE or VS_HUMAN
                 self.waiting_for_engine = False
                 self.playing_vs_avatar = False
                 self.chessboard.setEnabled(True)
@@ -851,10 +893,9 @@ class MainWindow(QMainWindow):
                 self.avatar_status.clear()
                 
                 # Reset board orientation to default (White at bottom)
-                if self.chessboard.flipped:
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(white_at_bottom=True)
                 
-                if config['mode'] == "vs_human":
+                if mode == PlayMode.VS_HUMAN:
                     self.statusBar().showMessage("Nouvelle partie - Humain vs Humain (local)", 3000)
                 else:
                     self.statusBar().showMessage("Nouvelle partie - Mode libre", 3000)
@@ -871,21 +912,12 @@ class MainWindow(QMainWindow):
         if file_path:
             game = self.pgn_manager.import_game(file_path)
             if game:
-                # Get moves from game
-                moves = self.pgn_manager.game_to_move_list(game)
                 game_info = self.pgn_manager.get_game_info(game)
                 
-                # Reset board and replay moves
+                # Reset board and replay the parsed moves (the PGN parser
+                # already checked them; the opponent is not asked to reply)
                 self.game.reset()
-                self.chessboard.set_board(self.game.board)
-                
-                # Apply moves
-                for move_san in moves:
-                    try:
-                        move = self.game.board.parse_san(move_san)
-                        self.game.make_move(move)
-                    except:
-                        break
+                move_count = self.game.replay_moves(game.mainline_moves())
                         
                 # Update display
                 self.chessboard.set_board(self.game.board)
@@ -897,7 +929,7 @@ class MainWindow(QMainWindow):
                 info_text += f"{game_info['event']} - {game_info['date']}"
                 self.notation_panel.set_game_info(info_text)
                 
-                self.statusBar().showMessage(f"PGN chargé: {len(moves)} coups", 3000)
+                self.statusBar().showMessage(f"PGN chargé: {move_count} coups", 3000)
             else:
                 QMessageBox.critical(self, "Erreur", "Impossible de charger le fichier PGN")
         
@@ -935,9 +967,8 @@ class MainWindow(QMainWindow):
         
     def copy_fen(self):
         """Copy FEN to clipboard (placeholder)"""
-        from PyQt6.QtWidgets import QApplication
         fen = self.game.board.fen()
-        QApplication.clipboard().setText(fen)
+        self._clipboard.setText(fen)
         self.statusBar().showMessage(f"FEN copié: {fen}", 3000)
         
     def paste_fen(self):
@@ -964,6 +995,7 @@ class MainWindow(QMainWindow):
     def open_engine_config(self):
         """Open engine configuration dialog"""
         engines = self.engine_manager.get_engines()
+        from ui.engine_config_dialog import EngineConfigDialog
         dialog = EngineConfigDialog(engines, self)
         dialog.engines_changed.connect(self.on_engines_changed)
         
@@ -988,9 +1020,12 @@ class MainWindow(QMainWindow):
                 action.triggered.connect(lambda checked, name=engine.name: self.select_engine(name))
                 self.select_engine_menu.addAction(action)
                 
+    @pyqtSlot()
     def on_engines_changed(self):
         """Handle engines list change"""
         self.update_engine_menu()
+        # A name may now point to another binary, path or option set
+        self._engine_move_cache.clear()
         
     def select_engine(self, engine_name: str):
         """Select and start an engine"""
@@ -998,7 +1033,7 @@ class MainWindow(QMainWindow):
         
     def start_engine(self, engine_name: str = None):
         """Start the selected engine"""
-        print(f"DEBUG: start_engine appelé avec engine_name={engine_name}")
+        logger.debug("start_engine appelé avec engine_name=%s", engine_name)
         
         if engine_name is None:
             # Get first available engine
@@ -1012,7 +1047,7 @@ class MainWindow(QMainWindow):
                 return
             engine_name = engines[0].name
         
-        print(f"DEBUG: Appel de engine_manager.start_engine({engine_name})")
+        logger.debug("Appel de engine_manager.start_engine(%s)", engine_name)
         self.engine_manager.start_engine(engine_name)
         self.statusBar().showMessage(f"Démarrage du moteur {engine_name}...", 3000)
         
@@ -1036,7 +1071,6 @@ class MainWindow(QMainWindow):
                 return
             
             # Ask player to choose color
-            from PyQt6.QtWidgets import QInputDialog
             items = ["Blancs", "Noirs"]
             item, ok = QInputDialog.getItem(
                 self, 
@@ -1049,27 +1083,22 @@ class MainWindow(QMainWindow):
             
             if ok and item:
                 self.player_color = chess.WHITE if item == "Blancs" else chess.BLACK
-                self.play_mode = "vs_engine"
+                self.play_mode = PlayMode.VS_ENGINE
                 self.waiting_for_engine = False
                 
-                print(f"DEBUG: player_color défini à {self.player_color}")
-                print(f"DEBUG: Mode vs_engine activé")
+                logger.debug("player_color défini à %s", self.player_color)
+                logger.debug("Mode vs_engine activé")
                 
                 # Auto-flip board based on player color
-                if self.player_color == chess.BLACK and not self.chessboard.flipped:
-                    print(f"DEBUG: Flip board (Noirs en bas)")
-                    self.chessboard.flip_board()
-                elif self.player_color == chess.WHITE and self.chessboard.flipped:
-                    print(f"DEBUG: Flip board (Blancs en bas)")
-                    self.chessboard.flip_board()
+                self.chessboard.set_orientation(self.player_color == chess.WHITE)
                 
                 # Start new game
                 self.new_game()
-                print(f"DEBUG: Nouveau jeu démarré, turn={self.game.board.turn}")
+                logger.debug("Nouveau jeu démarré, turn=%s", self.game.board.turn)
                 
                 # If player chose black, engine plays first
                 if self.player_color == chess.BLACK:
-                    print(f"DEBUG: Appel request_engine_move (moteur joue Blancs)")
+                    logger.debug("Appel request_engine_move (moteur joue Blancs)")
                     # Disable board interaction until engine plays
                     self.chessboard.setEnabled(False)
                     self.statusBar().showMessage("Le moteur joue en premier...", 0)
@@ -1078,7 +1107,7 @@ class MainWindow(QMainWindow):
                     self.statusBar().showMessage("Mode: Jouer contre le moteur - À vous de jouer!", 3000)
         else:
             # Disable vs engine mode
-            self.play_mode = "free"
+            self.play_mode = PlayMode.FREE
             self.waiting_for_engine = False
             self.statusBar().showMessage("Mode libre activé", 2000)
     
@@ -1094,6 +1123,16 @@ class MainWindow(QMainWindow):
         self.waiting_for_engine = True
         self.statusBar().showMessage(f"⚙️ {engine_name} réfléchit...", 0)
         
+        # Replay the engine's answer if this position was already searched
+        key = (engine_name, self.game.board.epd())
+        move = self._engine_move_cache.get(key)
+        if move is not None:
+            self._engine_move_cache.move_to_end(key)
+            self._pending_engine_key = None
+            QTimer.singleShot(0, lambda: self.on_engine_move_ready(move))
+            return
+        self._pending_engine_key = key
+        
         # Request best move from engine
         # The move_ready signal will be emitted automatically
         self.engine_manager.get_best_move(self.game.board, time_limit=2.0)
@@ -1139,7 +1178,6 @@ class MainWindow(QMainWindow):
                 )
                 
                 # Wait a bit for engine to start, then request move
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(500, lambda: self._request_avatar2_move_delayed(avatar2))
     
     def _request_avatar2_move_delayed(self, avatar2):
@@ -1166,7 +1204,7 @@ class MainWindow(QMainWindow):
     def auto_play_avatar_move(self):
         """Auto-play avatar move for Avatar vs Avatar mode"""
         # For Avatar vs Avatar, we need to switch avatars
-        if self.play_mode == "avatar_vs_avatar":
+        if self.play_mode == PlayMode.AVATAR_VS_AVATAR:
             turn = self.game.board.turn
             
             # Stop current avatar
@@ -1189,7 +1227,6 @@ class MainWindow(QMainWindow):
                     player_style = self.avatar_manager.get_player_style(self.avatar_id)
                     self.avatar_engine_manager.start_avatar(self.avatar_id, stockfish.path, player_style)
                     # Wait for engine to start
-                    from PyQt6.QtCore import QTimer
                     QTimer.singleShot(500, lambda: self.request_avatar_move())
                     return
             else:
@@ -1204,7 +1241,6 @@ class MainWindow(QMainWindow):
                         self.avatar2_stockfish_config
                     )
                     # Wait for engine to start
-                    from PyQt6.QtCore import QTimer
                     QTimer.singleShot(500, lambda: self.request_avatar_move())
                     return
         
@@ -1215,9 +1251,10 @@ class MainWindow(QMainWindow):
         
         self.request_avatar_move()
     
+    @pyqtSlot(object)
     def on_engine_move_ready(self, move):
         """Handle engine move result (called from signal, thread-safe)"""
-        print(f"DEBUG: on_engine_move_ready appelé avec move={move}")
+        logger.debug("on_engine_move_ready appelé avec move=%s", move)
         
         if not move:
             self.waiting_for_engine = False
@@ -1226,12 +1263,13 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Erreur: coup invalide", 2000)
             return
         
+        self._remember_engine_move(move)
+        
         try:
             # Play the move on the board
             if self.game.make_move(move):
                 # Update notation panel
-                pgn_text = self.game.get_pgn_moves()
-                self.notation_panel.update_moves(pgn_text)
+                self.append_last_move_to_notation()
                 
                 # Play appropriate sound
                 if self.game.board.is_capture(move):
@@ -1243,8 +1281,8 @@ class MainWindow(QMainWindow):
                 else:
                     self.sound_manager.play_move()
                 
-                # Update the board display
-                self.chessboard.set_board(self.game.board)
+                # Update the board display (only the squares the move touched)
+                self.chessboard.apply_move(self.game.board, move)
                 
                 # Check game over
                 if self.game.is_game_over():
@@ -1253,21 +1291,19 @@ class MainWindow(QMainWindow):
                     self.statusBar().showMessage(f"Partie terminée - {result}")
                     self.notation_panel.set_game_info(f"Partie terminée - {result}")
                     self.sound_manager.play_game_end()
-                    self.play_mode = "free"
+                    self.play_mode = PlayMode.FREE
                     # Show game over dialog
                     self.show_game_over_dialog(result, reason)
                 else:
                     # Handle AI vs AI modes
-                    if self.play_mode == "engine_vs_engine":
+                    if self.play_mode == PlayMode.ENGINE_VS_ENGINE:
                         # Engine vs Engine: continue playing
-                        from PyQt6.QtCore import QTimer
                         QTimer.singleShot(800, lambda: self.auto_play_engine_move())
                         self.statusBar().showMessage(f"Stockfish joue: {move.uci()}", 2000)
-                    elif self.play_mode == "avatar_vs_engine":
+                    elif self.play_mode == PlayMode.AVATAR_VS_ENGINE:
                         # Avatar vs Engine
                         if self.game.board.turn == chess.WHITE:
                             # Avatar's turn
-                            from PyQt6.QtCore import QTimer
                             QTimer.singleShot(800, lambda: self.request_avatar_move())
                         else:
                             # Engine's turn (just played, so re-enable for next cycle)
@@ -1275,7 +1311,7 @@ class MainWindow(QMainWindow):
                     else:
                         # Normal mode: Re-enable board interaction after engine move
                         self.chessboard.setEnabled(True)
-                        print(f"DEBUG: Échiquier réactivé, turn={self.game.board.turn}")
+                        logger.debug("Échiquier réactivé, turn=%s", self.game.board.turn)
                         self.statusBar().showMessage(f"Stockfish joue : {move.uci()} - À vous de jouer!", 3000)
         except Exception as e:
             print(f"ERROR: Engine move failed: {e}")
@@ -1287,47 +1323,70 @@ class MainWindow(QMainWindow):
         finally:
             self.waiting_for_engine = False
         
+    def _remember_engine_move(self, move):
+        """
+        Store the engine's answer for the position it was asked about
+        
+        Args:
+            move: Move returned by the engine
+        """
+        key, self._pending_engine_key = self._pending_engine_key, None
+        # Skip answers to a position that is no longer on the board
+        if key is None or key[1] != self.game.board.epd():
+            return
+        self._engine_move_cache[key] = move
+        if len(self._engine_move_cache) > ENGINE_MOVE_CACHE_SIZE:
+            self._engine_move_cache.popitem(last=False)
+        
+    @pyqtSlot(str)
     def on_engine_started(self, engine_name: str):
         """Handle engine started signal"""
-        print(f"DEBUG: MainWindow.on_engine_started appelé avec engine_name={engine_name}")
+        logger.debug("MainWindow.on_engine_started appelé avec engine_name=%s", engine_name)
+        
+        # A (re)started engine may run with other options than the cached replies
+        self._engine_move_cache.clear()
         
         # Get UCI options from the active engine
         active_engine = self.engine_manager.active_engine
         uci_options = active_engine.options if active_engine else None
         
-        print(f"DEBUG: Active engine: {active_engine.name if active_engine else 'None'}")
-        print(f"DEBUG: UCI options: {uci_options}")
+        logger.debug("Active engine: %s", active_engine.name if active_engine else 'None')
+        logger.debug("UCI options: %s", uci_options)
         
         # Update engine panel with status and UCI options
-        print(f"DEBUG: Appel de engine_panel.set_engine_status({engine_name}, {uci_options})")
-        self.engine_panel.set_engine_status(engine_name, uci_options)
-        print(f"DEBUG: engine_panel.set_engine_status terminé")
+        logger.debug("Statut du moteur: %s, %s", engine_name, uci_options)
+        self._set_engine_status("set_engine_status", engine_name, uci_options)
         
         self.statusBar().showMessage(f"Moteur {engine_name} prêt", 3000)
-        print(f"DEBUG: on_engine_started terminé")
+        logger.debug("on_engine_started terminé")
         
+    @pyqtSlot()
     def on_engine_stopped(self):
         """Handle engine stopped signal"""
-        self.engine_panel.clear_engine_status()
+        self._set_engine_status("clear_engine_status")
     
+    @pyqtSlot(str)
     def on_avatar_started(self, avatar_name: str):
         """Handle avatar engine started signal"""
-        print(f"DEBUG: MainWindow.on_avatar_started - Avatar {avatar_name} démarré")
+        logger.debug("MainWindow.on_avatar_started - Avatar %s démarré", avatar_name)
         self.statusBar().showMessage(f"Avatar {avatar_name} prêt - À vous de jouer!", 3000)
     
+    @pyqtSlot()
     def on_avatar_stopped(self):
         """Handle avatar engine stopped signal"""
-        print("DEBUG: MainWindow.on_avatar_stopped - Avatar arrêté")
+        logger.debug("MainWindow.on_avatar_stopped - Avatar arrêté")
         self.statusBar().showMessage("Avatar arrêté", 2000)
     
+    @pyqtSlot(str)
     def on_avatar_error(self, error_msg: str):
         """Handle avatar engine error"""
         print(f"ERROR: MainWindow.on_avatar_error - {error_msg}")
         QMessageBox.critical(self, "Erreur de l'avatar", error_msg)
     
+    @pyqtSlot(object)
     def on_avatar_move_ready(self, move):
         """Handle avatar move result (called from signal, thread-safe)"""
-        print(f"DEBUG: on_avatar_move_ready appelé avec move={move}")
+        logger.debug("on_avatar_move_ready appelé avec move=%s", move)
         
         if not move:
             self.chessboard.setEnabled(True)
@@ -1338,8 +1397,7 @@ class MainWindow(QMainWindow):
             # Play the move on the board
             if self.game.make_move(move):
                 # Update notation panel
-                pgn_text = self.game.get_pgn_moves()
-                self.notation_panel.update_moves(pgn_text)
+                self.append_last_move_to_notation()
                 
                 # Switch clock
                 if self.clock_widget.timer.isActive():
@@ -1355,8 +1413,8 @@ class MainWindow(QMainWindow):
                 else:
                     self.sound_manager.play_move()
                 
-                # Update the board display
-                self.chessboard.set_board(self.game.board)
+                # Update the board display (only the squares the move touched)
+                self.chessboard.apply_move(self.game.board, move)
                 
                 # Check game over
                 if self.game.is_game_over():
@@ -1365,29 +1423,26 @@ class MainWindow(QMainWindow):
                     self.statusBar().showMessage(f"Partie terminée - {result}")
                     self.notation_panel.set_game_info(f"Partie terminée - {result}")
                     self.sound_manager.play_game_end()
-                    self.play_mode = "free"
+                    self.play_mode = PlayMode.FREE
                     self.playing_vs_avatar = False
                     # Show game over dialog
                     self.show_game_over_dialog(result, reason)
                 else:
                     # Handle AI vs AI modes
-                    if self.play_mode == "avatar_vs_avatar":
+                    if self.play_mode == PlayMode.AVATAR_VS_AVATAR:
                         # Avatar vs Avatar: continue playing with alternating avatars
-                        from PyQt6.QtCore import QTimer
                         QTimer.singleShot(800, lambda: self.auto_play_avatar_move())
-                    elif self.play_mode == "avatar_vs_engine":
+                    elif self.play_mode == PlayMode.AVATAR_VS_ENGINE:
                         # Avatar vs Engine: engine plays next
                         if self.game.board.turn == chess.BLACK:
-                            from PyQt6.QtCore import QTimer
                             QTimer.singleShot(800, lambda: self.request_engine_move())
                         else:
                             # Avatar plays next
-                            from PyQt6.QtCore import QTimer
                             QTimer.singleShot(800, lambda: self.request_avatar_move())
                     else:
                         # Normal mode: Re-enable board interaction after avatar move
                         self.chessboard.setEnabled(True)
-                        print(f"DEBUG: Échiquier réactivé, turn={self.game.board.turn}")
+                        logger.debug("Échiquier réactivé, turn=%s", self.game.board.turn)
                         avatar = self.avatar_manager.get_avatar(self.avatar_id)
                         avatar_name = avatar.display_name if avatar else "Avatar"
                         self.statusBar().showMessage(f"{avatar_name} joue : {move.uci()} - À vous de jouer!", 3000)
@@ -1399,11 +1454,13 @@ class MainWindow(QMainWindow):
             # Re-enable board on error
             self.chessboard.setEnabled(True)
         
+    @pyqtSlot(str)
     def on_engine_error(self, error_msg: str):
         """Handle engine error"""
         QMessageBox.critical(self, "Erreur du moteur", error_msg)
-        self.engine_panel.clear_engine_status()
+        self._set_engine_status("clear_engine_status")
         
+    @pyqtSlot(dict)
     def on_analysis_updated(self, data: dict):
         """Handle analysis update from engine"""
         self.engine_panel.update_analysis(data)
@@ -1413,9 +1470,10 @@ class MainWindow(QMainWindow):
         mate_in = data.get('score_mate')
         self.chessboard.set_evaluation(eval_cp, mate_in)
         
+    @pyqtSlot()
     def on_engine_start_analysis(self):
         """Handle start analysis from engine panel"""
-        print(f"DEBUG: on_engine_start_analysis - engine_running={self.engine_manager.is_engine_running()}")
+        logger.debug("on_engine_start_analysis - engine_running=%s", self.engine_manager.is_engine_running())
         
         if not self.engine_manager.is_engine_running():
             QMessageBox.information(
@@ -1432,35 +1490,43 @@ class MainWindow(QMainWindow):
             self.engine_panel._on_stop_clicked()
             return
         
-        print("DEBUG: Appel de request_analysis()")
+        logger.debug("Appel de request_analysis()")
         self.request_analysis()
         
+    @pyqtSlot()
     def on_engine_stop_analysis(self):
         """Handle stop analysis from engine panel"""
         self.engine_manager.stop_analysis()
         
+    @pyqtSlot(str, object)
     def on_engine_option_changed(self, name: str, value: any):
         """Handle UCI option change from engine panel"""
-        print(f"DEBUG: MainWindow.on_engine_option_changed {name}={value}")
+        logger.debug("MainWindow.on_engine_option_changed %s=%s", name, value)
         self.engine_manager.update_option(name, value)
+        # Options such as the skill level change the engine's answers
+        self._engine_move_cache.clear()
         
     def request_analysis(self):
         """Request analysis of current position"""
-        print(f"DEBUG: request_analysis - board FEN: {self.game.board.fen()}")
+        logger.debug("request_analysis - board FEN: %s", self.game.board.fen())
+        # Show cached lines right away if this position was analyzed before
+        self.engine_panel.apply_cached(self.game.board.fen())
         self.engine_manager.analyze_position(
             self.game.board,
             multipv=3,  # Analyze top 3 moves
             time_limit=2.0  # 2 seconds per position
         )
-        print("DEBUG: analyze_position appele")
+        logger.debug("analyze_position appele")
         
     # Avatar methods
     def create_avatar(self):
         """Open avatar creation dialog"""
+        from ui.avatar_creation_dialog import AvatarCreationDialog
         dialog = AvatarCreationDialog(self.avatar_manager, self)
         dialog.avatar_created.connect(self.on_avatar_created)
         dialog.exec()
         
+    @pyqtSlot(str)
     def on_avatar_created(self, avatar_id: str):
         """Handle new avatar creation"""
         self.statusBar().showMessage(f"Avatar créé avec succès!", 3000)
@@ -1475,6 +1541,7 @@ class MainWindow(QMainWindow):
         dialog.setMinimumSize(800, 600)
         
         layout = QVBoxLayout(dialog)
+        from ui.avatar_panel import AvatarPanel
         avatar_panel = AvatarPanel(self.avatar_manager)
         # When "Play" button is clicked, close this dialog and open NewGameDialog with avatar preselected
         avatar_panel.avatar_selected.connect(lambda aid: self._start_game_with_avatar(aid, dialog))
@@ -1519,10 +1586,12 @@ class MainWindow(QMainWindow):
     
     def open_board_config(self):
         """Open board configuration dialog"""
+        from ui.board_config_dialog import BoardConfigDialog
         dialog = BoardConfigDialog(self.board_config, self)
         dialog.config_changed.connect(self.on_board_config_changed)
         dialog.exec()
         
+    @pyqtSlot(dict)
     def on_board_config_changed(self, config: dict):
         """Handle board configuration change"""
         self.apply_board_config()
@@ -1571,22 +1640,28 @@ class MainWindow(QMainWindow):
     
     def show_game_over_dialog(self, result: str, reason: str):
         """Show game over dialog"""
-        print(f"DEBUG: show_game_over_dialog appelé")
-        print(f"DEBUG: result='{result}'")
-        print(f"DEBUG: reason='{reason}'")
+        logger.debug("show_game_over_dialog appelé")
+        logger.debug("result='%s'", result)
+        logger.debug("reason='%s'", reason)
         
         # Stop the clock when game ends
         if self.clock_widget.timer.isActive():
             self.clock_widget.pause()
-            print("DEBUG: Pendule arrêtée (partie terminée)")
+            logger.debug("Pendule arrêtée (partie terminée)")
         
-        dialog = GameOverDialog(result, reason, self)
-        dialog.new_game_requested.connect(self.new_game)
-        dialog.exec()
+        # Reuse a single dialog across games
+        if self.game_over_dialog is None:
+            from ui.game_over_dialog import GameOverDialog
+            self.game_over_dialog = GameOverDialog(result, reason, self)
+            self.game_over_dialog.new_game_requested.connect(self.new_game)
+        else:
+            self.game_over_dialog.update_result(result, reason)
+        self.game_over_dialog.exec()
     
+    @pyqtSlot(str)
     def on_time_expired(self, color: str):
         """Handle time expiration"""
-        print(f"DEBUG: Temps écoulé pour {color}")
+        logger.debug("Temps écoulé pour %s", color)
         if color == 'white':
             result = "0-1"
             reason = "Temps écoulé pour les Blancs"
@@ -1597,6 +1672,7 @@ class MainWindow(QMainWindow):
         self.show_game_over_dialog(result, reason)
         self.statusBar().showMessage(f"Temps écoulé ! {reason}", 5000)
     
+    @pyqtSlot()
     def resign_game(self):
         """Handle resign button - player resigns"""
         if self.game.board.is_game_over():
@@ -1630,13 +1706,14 @@ class MainWindow(QMainWindow):
                 self.engine_manager.stop_analysis()
             if self.playing_vs_avatar:
                 self.playing_vs_avatar = False
-            if self.play_mode == "vs_engine":
-                self.play_mode = "free"
+            if self.play_mode == PlayMode.VS_ENGINE:
+                self.play_mode = PlayMode.FREE
                 self.waiting_for_engine = False
             
             # Show game over dialog
             self.show_game_over_dialog(result, reason)
     
+    @pyqtSlot()
     def offer_draw(self):
         """Handle draw offer button"""
         if self.game.board.is_game_over():
@@ -1645,7 +1722,7 @@ class MainWindow(QMainWindow):
         
         # Confirm draw offer
         message = "Voulez-vous proposer un match nul ?\n\n(En mode solo, cela accepte immédiatement la nulle)"
-        if self.play_mode == "vs_engine":
+        if self.play_mode == PlayMode.VS_ENGINE:
             message = "Voulez-vous déclarer un match nul contre le moteur ?"
         
         reply = QMessageBox.question(
@@ -1669,17 +1746,19 @@ class MainWindow(QMainWindow):
                 self.engine_manager.stop_analysis()
             if self.playing_vs_avatar:
                 self.playing_vs_avatar = False
-            if self.play_mode == "vs_engine":
-                self.play_mode = "free"
+            if self.play_mode == PlayMode.VS_ENGINE:
+                self.play_mode = PlayMode.FREE
                 self.waiting_for_engine = False
             
             # Show game over dialog
             self.show_game_over_dialog(result, reason)
     
+    @pyqtSlot()
     def flip_board_manual(self):
         """Manually flip the board"""
         self.chessboard.flip_board()
     
+    @pyqtSlot(int)
     def on_navigate_to_move(self, move_index: int):
         """
         Navigate to a specific move in the game history
@@ -1687,13 +1766,18 @@ class MainWindow(QMainWindow):
         Args:
             move_index: Index of the move (0 = start position, 1 = after first move, etc.)
         """
-        # Créer un board temporaire pour rejouer les coups
-        temp_board = chess.Board()
-        
-        # Rejouer les coups jusqu'à l'index demandé
-        if move_index > 0 and move_index <= len(self.game.board.move_stack):
-            for i in range(move_index):
-                temp_board.push(self.game.board.move_stack[i])
+        if move_index == len(self.game.board.move_stack):
+            # Position actuelle : afficher le board de la partie lui-même,
+            # sur lequel les coups suivants seront joués
+            temp_board = self.game.board
+        else:
+            # Créer un board temporaire pour rejouer les coups
+            temp_board = chess.Board()
+            
+            # Rejouer les coups jusqu'à l'index demandé
+            if move_index > 0 and move_index <= len(self.game.board.move_stack):
+                for i in range(move_index):
+                    temp_board.push(self.game.board.move_stack[i])
         
         # Afficher la position
         self.chessboard.set_board(temp_board)
@@ -1712,6 +1796,7 @@ class MainWindow(QMainWindow):
         current_theme = self.chessboard.current_theme
         current_piece_set = self.chessboard.piece_set
         
+        from ui.theme_config_dialog import ThemeConfigDialog
         dialog = ThemeConfigDialog(self, current_theme, current_piece_set)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             theme, piece_set = dialog.get_config()
@@ -1721,6 +1806,7 @@ class MainWindow(QMainWindow):
     
     def open_chessmaster_themes(self):
         """Open Chessmaster themes selector"""
+        from ui.chessmaster_theme_dialog import ChessmasterThemeDialog
         dialog = ChessmasterThemeDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             theme_id = dialog.get_selected_theme()
@@ -1741,6 +1827,7 @@ class MainWindow(QMainWindow):
                         f"sera implémentée dans la prochaine version."
                     )
     
+    @pyqtSlot(str, str)
     def on_theme_changed(self, theme_name: str, piece_set: str):
         """Handle theme and piece set changes"""
         self.chessboard.set_theme(theme_name)
@@ -1759,10 +1846,11 @@ class MainWindow(QMainWindow):
         # Show/hide panels based on preset
         panels = preset.get("panels", {})
         
-        if hasattr(self, 'engine_panel'):
-            self.engine_panel.setVisible(panels.get("engine_panel", True))
-        if hasattr(self, 'opening_panel'):
-            self.opening_panel.setVisible(panels.get("opening_panel", True))
+        # Panels not built yet have nothing to show or hide
+        if self._engine_panel is not None:
+            self._engine_panel.setVisible(panels.get("engine_panel", True))
+        if self._opening_panel is not None:
+            self._opening_panel.setVisible(panels.get("opening_panel", True))
         if hasattr(self, 'notation_panel'):
             self.notation_panel.setVisible(panels.get("notation_panel", True))
         if hasattr(self, 'avatar_panel'):
@@ -1795,11 +1883,13 @@ class MainWindow(QMainWindow):
     
     def show_game_report(self):
         """Show detailed game report dialog"""
+        from ui.game_report_dialog import GameReportDialog
         dialog = GameReportDialog(self.game, self)
         dialog.exec()
     
     def show_about(self):
         """Show about dialog"""
+        from ui.about_dialog import AboutDialog
         dialog = AboutDialog(self)
         dialog.exec()
     
@@ -1847,41 +1937,47 @@ class MainWindow(QMainWindow):
     
     def _save_window_state(self):
         """Save window state (dock positions, sizes, etc.)"""
-        import json
-        state = {
-            'geometry': self.saveGeometry().toBase64().data().decode('utf-8'),
-            'window_state': self.saveState().toBase64().data().decode('utf-8')
-        }
+        self._write_window_state()
+        self.statusBar().showMessage("Disposition sauvegardée !", 2000)
+    
+    def _write_window_state(self):
+        """Write geometry and dock state to the settings as raw bytes"""
+        self._state_save_timer.stop()
+        self._settings.setValue('geometry', self.saveGeometry())
+        self._settings.setValue('window_state', self.saveState())
+    
+    def _restore_window_state(self):
+        """Restore window state from the settings (or the legacy JSON file)"""
+        geometry = self._settings.value('geometry')
+        window_state = self._settings.value('window_state')
+        if window_state is None:
+            geometry, window_state = self._read_legacy_window_state()
+            if window_state is None:
+                return
         
         try:
-            with open('window_state.json', 'w') as f:
-                json.dump(state, f)
-            self.statusBar().showMessage("Disposition sauvegardée !", 2000)
+            self.restoreGeometry(geometry)
+            self.restoreState(window_state)
         except Exception as e:
-            print(f"Error saving window state: {e}")
+            logger.warning("Error restoring window state: %s", e)
     
-    def _restore_window_state(self):
-        """Restore window state from saved file"""
+    @staticmethod
+    def _read_legacy_window_state():
+        """Read the base64 state written to window_state.json by older versions"""
         import json
         import os
+        from PyQt6.QtCore import QByteArray
         
         if not os.path.exists('window_state.json'):
-            return
-        
+            return None, None
         try:
             with open('window_state.json', 'r') as f:
                 state = json.load(f)
-            
-            from PyQt6.QtCore import QByteArray
-            import base64
-            
-            geometry = QByteArray.fromBase64(state['geometry'].encode('utf-8'))
-            window_state = QByteArray.fromBase64(state['window_state'].encode('utf-8'))
-            
-            self.restoreGeometry(geometry)
-            self.restoreState(window_state)
+            return (QByteArray.fromBase64(state['geometry'].encode('utf-8')),
+                    QByteArray.fromBase64(state['window_state'].encode('utf-8')))
         except Exception as e:
-            print(f"Error restoring window state: {e}")
+            logger.warning("Error reading legacy window_state.json: %s", e)
+            return None, None
     
     def _reset_layout(self):
         """Reset to default layout"""
@@ -1913,29 +2009,28 @@ class MainWindow(QMainWindow):
         self.splitDockWidget(self.clock_dock, self.controls_dock, Qt.Orientation.Vertical)
         
         # Reset sizes
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(100, self._set_initial_dock_sizes)
         
         self.statusBar().showMessage("Disposition réinitialisée !", 2000)
     
     def closeEvent(self, event):
         """Handle window close event"""
-        print("DEBUG: MainWindow.closeEvent appelé")
+        logger.debug("MainWindow.closeEvent appelé")
         
         # Auto-save window state
-        self._save_window_state()
+        self._write_window_state()
         
         # Stop avatar engine if running
         if self.avatar_engine_manager.is_avatar_running():
-            print("DEBUG: Arrêt de l'avatar engine")
+            logger.debug("Arrêt de l'avatar engine")
             self.avatar_engine_manager.stop_avatar()
         
         # Stop main engine if running
         if self.engine_manager.is_engine_running():
-            print("DEBUG: Arrêt du moteur principal")
+            logger.debug("Arrêt du moteur principal")
             self.engine_manager.stop_engine()
         
         # Accept the close event
         event.accept()
-        print("DEBUG: Fenêtre fermée proprement")
+        logger.debug("Fenêtre fermée proprement")
 
@@ -4,7 +4,7 @@ New Game Dialog - Configure game settings before starting
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QRadioButton, QButtonGroup,
                              QComboBox, QGroupBox, QFormLayout)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSignalBlocker
 from PyQt6.QtGui import QFont
 import chess
 
@@ -30,6 +30,7 @@ class NewGameDialog(QDialog):
         self.selected_personality = None  # Chessmaster personality
         
         self.init_ui()
+        self.refresh(engine_available, avatar_available, self.avatars, self.engines)
         self.apply_theme()
     
     def init_ui(self):
@@ -63,27 +64,24 @@ class NewGameDialog(QDialog):
         self.mode_group.addButton(self.free_radio, 0)
         mode_layout.addWidget(self.free_radio)
         
+        # Availability of each mode (and its hint label) is set by refresh()
         self.vs_engine_radio = QRadioButton("Jouer contre le moteur")
-        self.vs_engine_radio.setEnabled(self.engine_available)
         self.vs_engine_radio.toggled.connect(self.on_mode_changed)
         self.mode_group.addButton(self.vs_engine_radio, 1)
         mode_layout.addWidget(self.vs_engine_radio)
         
-        if not self.engine_available:
-            no_engine_label = QLabel("   Aucun moteur configure")
-            no_engine_label.setStyleSheet("color: #ff6b6b; font-size: 9pt;")
-            mode_layout.addWidget(no_engine_label)
+        self.no_engine_label = QLabel("   Aucun moteur configure")
+        self.no_engine_label.setStyleSheet("color: #ff6b6b; font-size: 9pt;")
+        mode_layout.addWidget(self.no_engine_label)
         
         self.vs_avatar_radio = QRadioButton("Jouer contre un avatar")
-        self.vs_avatar_radio.setEnabled(self.avatar_available)
         self.vs_avatar_radio.toggled.connect(self.on_mode_changed)
         self.mode_group.addButton(self.vs_avatar_radio, 2)
         mode_layout.addWidget(self.vs_avatar_radio)
         
-        if not self.avatar_available:
-            no_avatar_label = QLabel("   Aucun avatar configuré")
-            no_avatar_label.setStyleSheet("color: #888888; font-size: 9pt;")
-            mode_layout.addWidget(no_avatar_label)
+        self.no_avatar_label = QLabel("   Aucun avatar configuré")
+        self.no_avatar_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        mode_layout.addWidget(self.no_avatar_label)
         
         # NEW: Human vs Human mode
         self.vs_human_radio = QRadioButton("Humain vs Humain (local)")
@@ -98,37 +96,31 @@ class NewGameDialog(QDialog):
         mode_layout.addWidget(ai_label)
         
         self.engine_vs_engine_radio = QRadioButton("⚔️ Moteur vs Moteur")
-        self.engine_vs_engine_radio.setEnabled(self.engine_available)
         self.engine_vs_engine_radio.toggled.connect(self.on_mode_changed)
         self.mode_group.addButton(self.engine_vs_engine_radio, 4)
         mode_layout.addWidget(self.engine_vs_engine_radio)
         
-        if not self.engine_available:
-            no_engine_ai_label = QLabel("   Aucun moteur configuré")
-            no_engine_ai_label.setStyleSheet("color: #ff6b6b; font-size: 9pt;")
-            mode_layout.addWidget(no_engine_ai_label)
+        self.no_engine_ai_label = QLabel("   Aucun moteur configuré")
+        self.no_engine_ai_label.setStyleSheet("color: #ff6b6b; font-size: 9pt;")
+        mode_layout.addWidget(self.no_engine_ai_label)
         
         self.avatar_vs_avatar_radio = QRadioButton("👥 Avatar vs Avatar")
-        self.avatar_vs_avatar_radio.setEnabled(len(self.avatars) >= 2)
         self.avatar_vs_avatar_radio.toggled.connect(self.on_mode_changed)
         self.mode_group.addButton(self.avatar_vs_avatar_radio, 5)
         mode_layout.addWidget(self.avatar_vs_avatar_radio)
         
-        if len(self.avatars) < 2:
-            no_2avatars_label = QLabel("   Au moins 2 avatars requis")
-            no_2avatars_label.setStyleSheet("color: #888888; font-size: 9pt;")
-            mode_layout.addWidget(no_2avatars_label)
+        self.no_2avatars_label = QLabel("   Au moins 2 avatars requis")
+        self.no_2avatars_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        mode_layout.addWidget(self.no_2avatars_label)
         
         self.avatar_vs_engine_radio = QRadioButton("🤖 Avatar vs Moteur")
-        self.avatar_vs_engine_radio.setEnabled(self.engine_available and self.avatar_available)
         self.avatar_vs_engine_radio.toggled.connect(self.on_mode_changed)
         self.mode_group.addButton(self.avatar_vs_engine_radio, 6)
         mode_layout.addWidget(self.avatar_vs_engine_radio)
         
-        if not (self.engine_available and self.avatar_available):
-            no_both_label = QLabel("   Moteur ET avatar requis")
-            no_both_label.setStyleSheet("color: #888888; font-size: 9pt;")
-            mode_layout.addWidget(no_both_label)
+        self.no_both_label = QLabel("   Moteur ET avatar requis")
+        self.no_both_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        mode_layout.addWidget(self.no_both_label)
         
         mode_group.setLayout(mode_layout)
         layout.addWidget(mode_group)
@@ -160,18 +152,8 @@ class NewGameDialog(QDialog):
         self.avatar_group_widget = QGroupBox("Choisir un avatar")
         avatar_layout = QVBoxLayout()
         
-        self.avatar_combo = QComboBox()
+        self.avatar_combo = QComboBox()  # Filled by refresh()
         self.avatar_combo.setMinimumHeight(35)
-        if self.avatars:
-            for avatar in self.avatars:
-                # Display: "Name (Elo) - Platform"
-                elo = avatar.style_data.get('average_elo', 'N/A')
-                display_text = f"{avatar.display_name} ({elo}) - {avatar.platform.title()}"
-                self.avatar_combo.addItem(display_text, avatar.id)
-        else:
-            self.avatar_combo.addItem("Aucun avatar disponible", None)
-            self.avatar_combo.setEnabled(False)
-        
         avatar_layout.addWidget(self.avatar_combo)
         
         # Avatar info label
@@ -190,17 +172,8 @@ class NewGameDialog(QDialog):
         self.engine_group_widget = QGroupBox("Choisir un moteur")
         engine_layout = QVBoxLayout()
         
-        self.engine_combo = QComboBox()
+        self.engine_combo = QComboBox()  # Filled by refresh()
         self.engine_combo.setMinimumHeight(35)
-        if self.engines:
-            for engine in self.engines:
-                protocol = engine.protocol if hasattr(engine, 'protocol') else 'UCI'
-                display_text = f"{engine.name} ({protocol})"
-                self.engine_combo.addItem(display_text, engine.name)
-        else:
-            self.engine_combo.addItem("Aucun moteur disponible", None)
-            self.engine_combo.setEnabled(False)
-        
         engine_layout.addWidget(self.engine_combo)
         
         # Chessmaster Personality selection (for TheKing engine)
@@ -267,17 +240,8 @@ class NewGameDialog(QDialog):
         self.avatar2_group_widget = QGroupBox("Choisir le second avatar")
         avatar2_layout = QVBoxLayout()
         
-        self.avatar2_combo = QComboBox()
+        self.avatar2_combo = QComboBox()  # Filled by refresh()
         self.avatar2_combo.setMinimumHeight(35)
-        if self.avatars:
-            for avatar in self.avatars:
-                elo = avatar.style_data.get('average_elo', 'N/A')
-                display_text = f"{avatar.display_name} ({elo}) - {avatar.platform.title()}"
-                self.avatar2_combo.addItem(display_text, avatar.id)
-        else:
-            self.avatar2_combo.addItem("Aucun avatar disponible", None)
-            self.avatar2_combo.setEnabled(False)
-        
         avatar2_layout.addWidget(self.avatar2_combo)
         
         # Avatar 2 info label
@@ -292,15 +256,6 @@ class NewGameDialog(QDialog):
         self.avatar2_group_widget.setVisible(False)  # Hidden by default
         layout.addWidget(self.avatar2_group_widget)
         
-        # Update avatar2 info if avatars exist
-        if len(self.avatars) >= 2:
-            self.avatar2_combo.setCurrentIndex(1)  # Select second avatar by default
-            self.on_avatar2_changed(1)
-        
-        # Update avatar info if avatars exist
-        if self.avatars:
-            self.on_avatar_changed(0)
-        
         # Time control selection (optional)
         time_group = QGroupBox("Cadence (optionnel)")
         time_layout = QFormLayout()
@@ -339,6 +294,89 @@ class NewGameDialog(QDialog):
         
         self.setLayout(layout)
     
+    def refresh(self, engine_available=False, avatar_available=False, avatars=None, engines=None):
+        """
+        Update the dialog for a new game, so one instance can be reused
+        
+        Args:
+            engine_available: Whether an engine is running
+            avatar_available: Whether at least one avatar exists
+            avatars: List of Avatar objects
+            engines: List of EngineInfo objects
+        """
+        self.engine_available = engine_available
+        self.avatar_available = avatar_available
+        self.avatars = avatars or []
+        self.engines = engines or []
+        
+        # Modes and their "not available" hints
+        two_avatars = len(self.avatars) >= 2
+        both = engine_available and avatar_available
+        self.vs_engine_radio.setEnabled(engine_available)
+        self.no_engine_label.setVisible(not engine_available)
+        self.vs_avatar_radio.setEnabled(avatar_available)
+        self.no_avatar_label.setVisible(not avatar_available)
+        self.engine_vs_engine_radio.setEnabled(engine_available)
+        self.no_engine_ai_label.setVisible(not engine_available)
+        self.avatar_vs_avatar_radio.setEnabled(two_avatars)
+        self.no_2avatars_label.setVisible(not two_avatars)
+        self.avatar_vs_engine_radio.setEnabled(both)
+        self.no_both_label.setVisible(not both)
+        
+        # Same defaults as a freshly built dialog
+        self.free_radio.setChecked(True)
+        self.white_radio.setChecked(True)
+        self.time_combo.setCurrentIndex(0)
+        
+        # Avatar and engine lists, keeping the previous choice when still listed
+        avatar_items = [(f"{avatar.display_name} ({avatar.style_data.get('average_elo', 'N/A')}) - "
+                         f"{avatar.platform.title()}", avatar.id) for avatar in self.avatars]
+        self._fill_combo(self.avatar_combo, avatar_items, "Aucun avatar disponible",
+                         0, self.avatar_combo.currentData())
+        self._fill_combo(self.avatar2_combo, avatar_items, "Aucun avatar disponible",
+                         1, self.avatar2_combo.currentData())
+        # Only an engine explicitly picked by the user is kept (None = current engine)
+        engine_items = [(f"{engine.name} ({getattr(engine, 'protocol', 'UCI')})", engine.name)
+                        for engine in self.engines]
+        engine_index = self._fill_combo(self.engine_combo, engine_items, "Aucun moteur disponible",
+                                        0, self.selected_engine_name)
+        
+        self.on_avatar_changed(self.avatar_combo.currentIndex() if self.avatars else -1)
+        self.on_avatar2_changed(self.avatar2_combo.currentIndex() if two_avatars else -1)
+        if engine_index is None:
+            self.on_engine_changed(-1)
+        else:
+            self.on_engine_changed(engine_index)
+        
+    @staticmethod
+    def _fill_combo(combo: QComboBox, items, empty_text: str, default_index: int, previous):
+        """
+        Replace the items of a combo, restoring its previous selection if possible
+        
+        Args:
+            combo: Combo box to fill
+            items: List of (text, data) tuples
+            empty_text: Placeholder shown when there are no items
+            default_index: Index selected when the previous choice is gone
+            previous: Data of the item to select again, if still listed
+            
+        Returns:
+            Index of the restored previous choice, or None if it was not restored
+        """
+        blocker = QSignalBlocker(combo)
+        combo.clear()
+        if not items:
+            combo.addItem(empty_text, None)
+            combo.setEnabled(False)
+            return None
+        combo.setEnabled(True)
+        for text, data in items:
+            combo.addItem(text, data)
+        index = combo.findData(previous) if previous is not None else -1
+        combo.setCurrentIndex(index if index >= 0 else min(default_index, len(items) - 1))
+        del blocker
+        return index if index >= 0 else None
+        
     def on_mode_changed(self):
         """Handle mode change"""
         if self.vs_engine_radio.isChecked():
@@ -157,17 +157,14 @@ class NotationPanel(QWidget):
         # Mettre à jour la liste widget
         self.moves_list_widget.clear()
         
-        # Ajouter position de départ
-        item = QListWidgetItem("⭐ Position de départ")
-        self.moves_list_widget.addItem(item)
-        
-        # Ajouter les coups
+        # Position de départ puis les coups, insérés en un seul lot
+        # (une partie PGN entière ne déclenche qu'une mise à jour du modèle)
+        items = ["⭐ Position de départ"]
         for i, move in enumerate(self.moves_list):
             move_num = (i // 2) + 1
             color = "Blancs" if i % 2 == 0 else "Noirs"
-            item_text = f"{move_num}. {move} ({color})"
-            item = QListWidgetItem(item_text)
-            self.moves_list_widget.addItem(item)
+            items.append(f"{move_num}. {move} ({color})")
+        self.moves_list_widget.addItems(items)
         
         # Aller à la fin par défaut
         self.current_move_index = len(self.moves_list)
@@ -232,24 +229,24 @@ class NotationPanel(QWidget):
         self.btn_next.setEnabled(self.current_move_index < len(self.moves_list))
         self.btn_end.setEnabled(self.current_move_index < len(self.moves_list))
         
-    def append_move(self, move_number: int, white_move: str, black_move: str = ""):
+    def append_move(self, san: str, move_number: int, color: bool):
         """
-        Append a move to the notation
+        Append a single move to the notation without rebuilding the list
         
         Args:
-            move_number: The move number
-            white_move: White's move in SAN notation
-            black_move: Black's move in SAN notation (optional)
+            san: Move in SAN notation
+            move_number: The full move number
+            color: Side that played the move (chess.WHITE / chess.BLACK)
         """
-        if black_move:
-            self.moves_list.append(white_move)
-            self.moves_list.append(black_move)
-        else:
-            self.moves_list.append(white_move)
+        self.moves_list.append(san)
+        color_name = "Blancs" if color else "Noirs"
+        self.moves_list_widget.addItem(QListWidgetItem(f"{move_number}. {san} ({color_name})"))
         
-        # Reconstruire le texte PGN et mettre à jour
-        pgn_text = self._build_pgn_text()
-        self.update_moves(pgn_text)
+        # Aller à la fin, comme update_moves
+        self.current_move_index = len(self.moves_list)
+        self.moves_list_widget.setCurrentRow(self.current_move_index)
+        self.update_position_display()
+        self.update_buttons_state()
         
     def _build_pgn_text(self) -> str:
         """Build PGN text from moves list"""
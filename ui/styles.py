@@ -2,6 +2,7 @@
 Global Stylesheet for ChessAvatar
 Provides consistent styling across the application
 """
+from functools import lru_cache
 
 # Color Palette
 COLORS = {
@@ -32,8 +33,9 @@ FONTS = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_main_stylesheet():
-    """Get the main application stylesheet"""
+    """Get the main application stylesheet (cached: built once from COLORS/FONTS)"""
     return f"""
     /* Main Window */
     QMainWindow {{
@@ -299,9 +301,10 @@ def get_panel_style():
     """
 
 
+@lru_cache(maxsize=16)
 def get_button_style(button_type='default'):
     """
-    Get button style
+    Get button style (cached: the same string object is returned per type)
     
     Args:
         button_type: 'default', 'primary', 'success', 'danger', 'warning'